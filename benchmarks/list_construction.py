@@ -0,0 +1,48 @@
+"""Compares splatting into ``List(*vs)`` against the adopting constructors
+``List.from_tuple`` and ``List.from_iterable`` on a large List.
+
+Run with ``python benchmarks/list_construction.py [size]``. Peak allocations
+are measured with tracemalloc, times with timeit.
+"""
+
+import sys
+import timeit
+import tracemalloc
+from pynads import List
+
+
+def peak_allocation(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report(name, func, number=5):
+    seconds = min(timeit.repeat(func, number=1, repeat=number))
+    peak = peak_allocation(func)
+    print("{:<32} {:>10.2f} ms {:>10.2f} MiB".format(name, seconds * 1000,
+                                                   peak / 2.0 ** 20))
+
+
+def main(size):
+    data = tuple(range(size))
+    big = List.from_tuple(data)
+    inc = lambda x: x + 1
+
+    print("List size: {:,}".format(size))
+    report("List(*tuple)", lambda: List(*data))
+    report("List.from_tuple(tuple)", lambda: List.from_tuple(data))
+    report("List(*generator)", lambda: List(*(x for x in data)))
+    report("List.from_iterable(generator)",
+           lambda: List.from_iterable(x for x in data))
+    report("splatting fmap", lambda: List(*[inc(v) for v in big]))
+    report("List.fmap", lambda: big.fmap(inc))
+    report("splatting filter", lambda: List(*filter(inc, big)))
+    report("List.filter", lambda: big.filter(inc))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
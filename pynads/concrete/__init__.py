@@ -1,8 +1,18 @@
 from .either import Either, Left, Right
 from .identity import Identity
 from .list import List
+from .lazylist import LazyList
+from .typedlist import TypedList
+from .sortedlist import SortedList
+from .conslist import ConsList
+from .arraylist import ArrayList
 from .maybe import Maybe, Just, Nothing
+from .optionarray import MaybeArray, EitherArray
 from .map import Map
+from .pmap import PMap
+from .lazymap import LazyMap
+from .columnarmap import ColumnarMap
+from .diskmap import DiskMap
 from .mempty import Mempty
 from .reader import Reader, Function, Reader as R  # provide shortcut
 from .state import State
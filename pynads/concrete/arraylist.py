@@ -0,0 +1,179 @@
+"""A Functor and Monoid over a NumPy array. NumPy is optional for pynads as a
+whole; this module can always be imported but ArrayList can only be
+instantiated when NumPy is available.
+"""
+
+from collections import Sequence
+from ..abc import Functor, Monoid
+from ..utils.internal import _iter_but_not_str_or_map, Instance
+from .list import List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+__all__ = ('ArrayList',)
+
+
+class ArrayList(Functor, Monoid, Sequence):
+    """A List-like Functor and Monoid backed by a one dimensional NumPy
+    array, intended for large amounts of numeric data.
+
+    ``List.fmap`` calls its function once per value from Python. When
+    ArrayList can tell that a function works on entire arrays, it calls it
+    exactly once with the whole array instead:
+
+    - NumPy ufuncs such as ``np.sqrt`` or ``np.negative``
+    - ``np.vectorize`` instances
+    - functions marked with ``ArrayList.vectorized``
+
+    >>> xs = ArrayList([1.0, 4.0, 9.0])
+    >>> xs.fmap(np.sqrt)
+    ... ArrayList([1.0, 2.0, 3.0])
+    >>> double = ArrayList.vectorized(lambda x: x * 2)
+    >>> double % xs
+    ... ArrayList([2.0, 8.0, 18.0])
+
+    Any other function is applied to each value in turn, just as with List.
+
+    Joining ArrayLists with ``mappend`` and ``mconcat`` is a single call to
+    ``np.concatenate``, and ArrayList converts to and from pynads.List with
+    ``to_list`` and ``from_list``.
+
+    Like List, an ArrayList never changes: the values given to it are
+    copied into an array that is marked read only, so neither the caller's
+    array nor the ArrayList can be changed through the other. Arrays that
+    ArrayList creates itself, such as slices and the results of vectorized
+    functions, are adopted without a copy.
+    """
+    __slots__ = ()
+    mempty = Instance()
+
+    def __init__(self, values=(), dtype=None):
+        if np is None:
+            raise ImportError("ArrayList requires NumPy to be installed")
+        values = np.array(values, dtype=dtype)
+        values.flags.writeable = False
+        super(ArrayList, self).__init__(values)
+
+    @classmethod
+    def _wrap(cls, array):
+        """Adopts an array without copying it, through a read only view.
+        """
+        view = array.view()
+        view.flags.writeable = False
+        inst = cls.__new__(cls)
+        inst._v = view
+        return inst
+
+    def __repr__(self):
+        return "ArrayList({!r})".format(self.v.tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        """Hands the values to NumPy as a read only view, or as a copy when
+        one is asked for or a different dtype is needed.
+        """
+        if copy or (dtype is not None and np.dtype(dtype) != self.v.dtype):
+            if copy is False:
+                raise ValueError("ArrayList can't be converted to {!s} "
+                                 "without a copy".format(dtype))
+            return self.v.astype(dtype or self.v.dtype)
+        view = self.v.view()
+        view.flags.writeable = False
+        return view
+
+    @staticmethod
+    def vectorized(func):
+        """Marks a function as accepting and returning entire arrays so
+        ``ArrayList.fmap`` calls it once rather than once per value.
+        Can be used as a decorator.
+        """
+        func.__vectorized__ = True
+        return func
+
+    @staticmethod
+    def _is_vectorized(func):
+        return (isinstance(func, (np.ufunc, np.vectorize)) or
+                getattr(func, '__vectorized__', False))
+
+    @classmethod
+    def from_list(cls, values, dtype=None):
+        """Builds an ArrayList from a pynads.List (or any sequence).
+        """
+        return cls(values.v if isinstance(values, List) else values, dtype)
+
+    def to_list(self):
+        """Converts back to a pynads.List of plain Python values.
+        """
+        return List.from_tuple(tuple(self.v.tolist()))
+
+    def fmap(self, func):
+        """Maps a function over every value. Vectorized functions are called
+        once with the entire array, everything else once per value.
+        """
+        if self._is_vectorized(func):
+            return ArrayList._wrap(np.asarray(func(self.v)))
+        return ArrayList([func(v) for v in self.v.tolist()])
+
+    def mappend(self, other):
+        if not _iter_but_not_str_or_map(other):
+            raise TypeError("Can only append non-str/Mapping iterable to a "
+                            "{!s} instance, not {!s}"
+                            "".format(type(self), type(other)))
+        return ArrayList._wrap(_concatenate([self.v, _as_array(other)]))
+
+    @classmethod
+    def mconcat(cls, *monoids):
+        """Joins every monoid with a single ``np.concatenate``.
+        """
+        if not monoids:
+            return cls.mempty
+        return cls._wrap(_concatenate([_as_array(m) for m in monoids]))
+
+    def __eq__(self, other):
+        if isinstance(other, ArrayList):
+            return np.array_equal(self.v, other.v)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, ArrayList):
+            return not np.array_equal(self.v, other.v)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __bool__(self):
+        return bool(len(self.v))
+
+    __nonzero__ = __bool__
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            # numpy slices are views, so nothing is copied
+            return ArrayList._wrap(self.v[idx])
+        return self.v[idx]
+
+    def __len__(self):
+        return len(self.v)
+
+    def __iter__(self):
+        return iter(self.v)
+
+
+def _concatenate(arrays):
+    # skip empty arrays so joining with mempty (an empty float array)
+    # doesn't upcast the dtype of everything else
+    non_empty = [a for a in arrays if len(a)]
+    return np.concatenate(non_empty or arrays[:1])
+
+
+def _as_array(values):
+    if isinstance(values, ArrayList):
+        return values.v
+    elif isinstance(values, List):
+        return np.asarray(values.v)
+    elif isinstance(values, np.ndarray):
+        return values
+    return np.asarray(list(values))
@@ -0,0 +1,301 @@
+"""A Map of numbers stored as a key index and a single column of values.
+The column is a NumPy array when NumPy is installed, which makes vectorized
+fmap and apply available, and an ``array.array`` otherwise.
+"""
+
+from array import array
+from collections import Mapping
+from ..abc import Applicative, Monoid
+from ..utils.internal import Instance, _items, _mapping_eq, _mapping_ne
+from .arraylist import ArrayList
+from .map import Map
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+__all__ = ('ColumnarMap',)
+
+
+class ColumnarMap(Applicative, Monoid, Mapping):
+    """A pynads.Map for numeric values that keeps its keys in an index,
+    mapping each key to a position, and its values in one typed column
+    rather than as boxed Python objects in a dict.
+
+    >>> prices = ColumnarMap({'apple': 3.0, 'pear': 2.0})
+    >>> prices['pear']
+    ... 2.0
+
+    ColumnarMap is a Functor, Applicative and Monoid like Map. Mapping a
+    function never touches the index, so every fmap of a ColumnarMap shares
+    its index. When NumPy is installed, functions that work on whole arrays
+    -- ufuncs, ``np.vectorize`` and functions marked with
+    ``ArrayList.vectorized`` -- are called once with the entire column:
+
+    >>> (lambda x: x * 2) % prices           # called once per value
+    >>> np.sqrt % prices                     # called once
+    >>> add = ArrayList.vectorized(lambda x: lambda y: x + y)
+    >>> add % prices * ColumnarMap({'pear': 1.0})
+    ... ColumnarMap({'pear': 3.0})
+
+    As the last example shows, apply is supported for ColumnarMaps made by
+    fmapping a curried vectorized function: the keys the two sides share
+    are aligned once through their indexes, and when they share the same
+    index no aligning is done at all. The function is then called once with
+    the aligned columns.
+
+    Without NumPy, or for functions that aren't vectorized, values are
+    computed one at a time. Results that can't be kept in a numeric column
+    fall back to a plain Map.
+
+    ``typecode`` is the ``array.array`` typecode of the column (and its
+    NumPy dtype), double precision floats by default.
+    """
+    __slots__ = ()
+    mempty = Instance()
+
+    def __init__(self, v=None, typecode='d'):
+        index, values = {}, []
+        for k, x in _items(v or ()):
+            if k in index:
+                values[index[k]] = x
+            else:
+                index[k] = len(values)
+                values.append(x)
+        super(ColumnarMap, self).__init__((index, _column(values, typecode)))
+
+    @classmethod
+    def _from_parts(cls, index, column):
+        inst = cls.__new__(cls)
+        inst._v = (index, column)
+        return inst
+
+    @property
+    def index(self):
+        """The dict mapping each key to the position of its value. Shared
+        between ColumnarMaps and must not be changed.
+        """
+        return self._v[0]
+
+    @property
+    def column(self):
+        """The values, in the order of the positions in ``index``.
+        """
+        return self._v[1]
+
+    @property
+    def typecode(self):
+        column = self.column
+        if isinstance(column, _Pending):
+            column = column.args[-1]
+        return column.typecode if isinstance(column, array) else \
+            column.dtype.char
+
+    def __repr__(self):
+        return "ColumnarMap({!r})".format(dict(self.items()))
+
+    @classmethod
+    def unit(cls, v):
+        return cls([v])
+
+    def to_map(self):
+        return Map.wrap(dict(self.items()))
+
+    def _rebuild(self, index, values):
+        """Builds a ColumnarMap from computed values, or a Map if they
+        don't fit in a numeric column.
+        """
+        column = _numeric_column(values, self.typecode)
+        if column is None:
+            return Map.wrap(dict(zip(index, values)))
+        return ColumnarMap._from_parts(index, column)
+
+    def fmap(self, func):
+        if isinstance(self.column, _Pending):
+            return self.to_map().fmap(func)
+        if np is not None and ArrayList._is_vectorized(func):
+            result = func(self.column)
+            if callable(result) and not isinstance(result, np.ndarray):
+                result = _Pending(func, [self.column])
+            return ColumnarMap._from_parts(self.index, result)
+        return self._rebuild(self.index, [func(x) for x in self.column])
+
+    def apply(self, other):
+        """Applies a ColumnarMap of a curried vectorized function to the
+        values of another mapping with the same keys, dropping keys that
+        don't appear in both.
+        """
+        if not isinstance(self.column, _Pending):
+            raise TypeError("Only a ColumnarMap made by fmapping a curried "
+                            "vectorized function can be applied")
+        if not isinstance(other, ColumnarMap):
+            other = ColumnarMap(other, self.typecode)
+        index, mine, theirs = _align(self.index, other.index)
+        pending = self.column
+        args = [_take(a, mine) for a in pending.args]
+        args.append(_take(other.column, theirs))
+        result = pending.func
+        for arg in args:
+            result = result(arg)
+        if callable(result) and not isinstance(result, np.ndarray):
+            result = _Pending(pending.func, args)
+        return ColumnarMap._from_parts(index, result)
+
+    def zip_with(self, other, func):
+        """Combines the values of the keys two mappings share with
+        ``func(this_value, other_value)``, calling a vectorized func once
+        with both aligned columns.
+        """
+        if not isinstance(other, ColumnarMap):
+            other = ColumnarMap(other, self.typecode)
+        index, mine, theirs = _align(self.index, other.index)
+        xs, ys = _take(self.column, mine), _take(other.column, theirs)
+        if np is not None and ArrayList._is_vectorized(func):
+            return ColumnarMap._from_parts(index, func(xs, ys))
+        return self._rebuild(index, [func(x, y) for x, y in zip(xs, ys)])
+
+    def mappend(self, other):
+        """Joins two mappings; the right hand value wins for keys in both.
+        Keys already in this ColumnarMap keep their positions.
+        """
+        if not isinstance(other, ColumnarMap):
+            other = ColumnarMap(other, self.typecode)
+        if other.index is self.index or not self:
+            return other
+        elif not other:
+            return self
+        return ColumnarMap.mconcat(self, other)
+
+    @classmethod
+    def mconcat(cls, *ms):
+        """Joins every mapping in one pass, building a single index and
+        column; the last value for a key wins and keys keep the position of
+        their first appearance. ColumnarMaps of curried functions can't be
+        joined column-wise, so those are joined as plain Maps instead.
+        """
+        if not ms:
+            return cls.mempty
+        columnar = [m for m in ms if isinstance(m, ColumnarMap)]
+        if any(isinstance(m.column, _Pending) for m in columnar):
+            return Map.mconcat(*[m.to_map() if isinstance(m, ColumnarMap)
+                                 else m for m in ms])
+        index, values = {}, []
+        for m in ms:
+            for k, x in _pairs(m):
+                i = index.setdefault(k, len(values))
+                if i == len(values):
+                    values.append(x)
+                else:
+                    values[i] = x
+        typecode = columnar[0].typecode if columnar else 'd'
+        column = _numeric_column(values, typecode)
+        if column is None:
+            return Map.wrap(dict(zip(index, values)))
+        return cls._from_parts(index, column)
+
+    # from collections.Mapping
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, x):
+        return x in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __getitem__(self, k):
+        column, i = self.column, self.index[k]
+        if isinstance(column, _Pending):
+            result = column.func
+            for arg in column.args:
+                result = result(arg[i])
+            return result
+        return column[i]
+
+    def __eq__(self, other):
+        return _mapping_eq(self, other, (ColumnarMap, Map))
+
+    def __ne__(self, other):
+        return _mapping_ne(self, other)
+
+    __hash__ = None
+
+
+class _Pending(object):
+    """A curried vectorized function still waiting on more columns. Every
+    column in args is aligned to the index of the ColumnarMap holding it.
+    """
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, args):
+        self.func = func
+        self.args = args
+
+
+def _column(values, typecode):
+    if np is not None:
+        return np.asarray(values, dtype=typecode)
+    return array(typecode, values)
+
+
+def _pairs(m):
+    """The items of a mapping, read from the column of a ColumnarMap.
+    """
+    if isinstance(m, ColumnarMap):
+        values = m.column.tolist()
+        return ((k, values[i]) for k, i in m.index.items())
+    return _items(m)
+
+
+def _numeric_column(values, typecode):
+    """A column for computed values, or None if they aren't all numbers.
+
+    With NumPy the dtype is whatever NumPy picks for the values. Without
+    it, the typecode follows the values as well: floats are kept in a float
+    column and ints in an integer one, using typecode when it's of the
+    right kind. ``array.array`` has no typecode for bools, so bools (and
+    ints too large for a C long) don't fit and give None.
+    """
+    if np is not None:
+        column = np.asarray(values)
+        if column.dtype.kind not in 'biuf':
+            return None
+        return column if len(column) else np.asarray(values, typecode)
+    if not all(type(v) in (int, float) for v in values):
+        return None
+    if not values:
+        return array(typecode)
+    floats = typecode in 'fd'
+    if any(type(v) is float for v in values):
+        kind = typecode if floats else 'd'
+    else:
+        kind = 'l' if floats else typecode
+    try:
+        return array(kind, values)
+    except (OverflowError, TypeError):
+        return None
+
+
+def _align(this, that):
+    """Returns the index of the keys two indexes share along with the
+    positions of those keys in each, or None when every position is kept.
+    """
+    if this is that:
+        return this, None, None
+    keys = [k for k in this if k in that] if len(this) <= len(that) else \
+        [k for k in that if k in this]
+    if len(keys) == len(this) and all(this[k] == i
+                                      for i, k in enumerate(keys)):
+        return this, None, [that[k] for k in keys]
+    index = dict((k, i) for i, k in enumerate(keys))
+    return index, [this[k] for k in keys], [that[k] for k in keys]
+
+
+def _take(column, positions):
+    if positions is None:
+        return column
+    elif isinstance(column, array):
+        return array(column.typecode, [column[i] for i in positions])
+    return column[np.asarray(positions, dtype=np.intp)]
@@ -0,0 +1,199 @@
+from collections import Sequence
+from itertools import chain, islice
+from ..abc import Monad, Monoid
+from ..utils.compat import filter, map
+from ..utils.internal import _iter_but_not_str_or_map, Instance
+from .list import List
+
+
+__all__ = ('ConsList',)
+
+
+class ConsList(Monad, Monoid, Sequence):
+    """A singly linked take on pynads.List, like Haskell's own ``[]``.
+
+    Each ConsList is a cell holding its first value (``head``) and the rest
+    of the list (``tail``), which is itself a ConsList. That makes prepending
+    a value with ``cons``, and taking ``head`` and ``tail``, O(1) without
+    copying anything. Every list built by consing onto another shares that
+    other list as its tail:
+
+    >>> stack = ConsList(2, 3)
+    >>> pushed = stack.cons(1)
+    >>> pushed
+    ... ConsList(1, 2, 3)
+    >>> pushed.tail == stack  # and shares all of stack's cells
+    ... True
+
+    This suits stacks and other prepend-heavy work, such as a State based
+    stack machine:
+
+    >>> push = lambda a: State(lambda s: ((), s.cons(a)))
+    >>> pop = State(lambda s: (s.head, s.tail))
+
+    Anything that works from the end of the list, such as ``mappend``,
+    ``append`` or indexing, is O(n), as with ``[]``. ConsList implements the
+    same Monad and Monoid behavior as List and converts between the two
+    with ``to_list`` and ``from_list``.
+    """
+    __slots__ = ()
+    mempty = Instance()
+
+    def __init__(self, *vs):
+        super(ConsList, self).__init__(_cells(vs))
+
+    @classmethod
+    def _from_cell(cls, cell):
+        inst = cls.__new__(cls)
+        inst._v = cell
+        return inst
+
+    @classmethod
+    def _build(cls, values, tail=None):
+        """Builds a ConsList of values in front of an existing cell.
+        """
+        return cls._from_cell(_cells(values, tail))
+
+    @classmethod
+    def from_list(cls, values):
+        """Builds a ConsList from a pynads.List or any other iterable.
+        """
+        return cls._build(values)
+
+    def to_list(self):
+        return List.from_iterable(self)
+
+    def __repr__(self):
+        main = "ConsList({!s})"
+        if len(self) > 10:
+            head = list(islice(self, 5))
+            middle = '...{!s} more...'.format(len(self) - 5)
+            return main.format(', '.join([repr(v) for v in head] + [middle]))
+        return main.format(', '.join([repr(v) for v in self]))
+
+    @classmethod
+    def unit(cls, v):
+        return cls(v)
+
+    @property
+    def head(self):
+        """The first value in the ConsList. O(1).
+        """
+        if self._v is None:
+            raise IndexError("head of empty ConsList")
+        return self._v[0]
+
+    @property
+    def tail(self):
+        """Everything after the first value, sharing this ConsList's cells.
+        O(1).
+        """
+        if self._v is None:
+            raise IndexError("tail of empty ConsList")
+        return ConsList._from_cell(self._v[1])
+
+    def uncons(self):
+        """Returns ``(head, tail)``.
+        """
+        return self.head, self.tail
+
+    def cons(self, x):
+        """Prepends a value in O(1). Returns new ConsList.
+        """
+        return ConsList._from_cell((x, self._v, len(self) + 1))
+
+    def append(self, x):
+        return self.mappend((x,))
+
+    def fmap(self, func):
+        return ConsList._build([func(v) for v in self])
+
+    def apply(self, other):
+        return ConsList._build([f(x) for f in self for x in other])
+
+    def bind(self, bindee):
+        return ConsList._build(list(chain.from_iterable(map(bindee, self))))
+
+    def filter(self, predicate):
+        return ConsList._build(list(filter(predicate, self)))
+
+    def mappend(self, other):
+        """Copies this ConsList in front of ``other``. When other is a
+        ConsList its cells are shared rather than copied.
+        """
+        if not _iter_but_not_str_or_map(other):
+            raise TypeError("Can only append non-str/Mapping iterable to a "
+                            "{!s} instance, not {!s}"
+                            "".format(type(self), type(other)))
+        if not isinstance(other, ConsList):
+            other = ConsList._build(other)
+        return ConsList._build(list(self), other._v)
+
+    extend = mappend
+
+    @classmethod
+    def mconcat(cls, *monoids):
+        """Shares the cells of the final monoid and copies the rest once.
+        """
+        if not monoids:
+            return cls.mempty
+        last = monoids[-1]
+        if not isinstance(last, ConsList):
+            last = cls._build(last)
+        return cls._build(list(chain.from_iterable(monoids[:-1])), last._v)
+
+    # here be boring stuff...
+    def __hash__(self):
+        return hash(("ConsList", tuple(self)))
+
+    def __eq__(self, other):
+        if isinstance(other, ConsList):
+            return len(self) == len(other) and \
+                all(a is b or a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, ConsList):
+            return not self == other
+        return NotImplemented
+
+    def __bool__(self):
+        return self._v is not None
+
+    __nonzero__ = __bool__
+
+    def __len__(self):
+        return self._v[2] if self._v else 0
+
+    def __iter__(self):
+        cell = self._v
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step == 1 and stop == len(self):
+                # dropping from the front shares the remaining cells
+                cell = self._v
+                for _ in range(start):
+                    cell = cell[1]
+                return ConsList._from_cell(cell)
+            return ConsList._build(list(self)[idx])
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("ConsList index out of range")
+        return next(islice(self, idx, None))
+
+
+def _cells(values, tail=None):
+    """Links values into (head, tail, length) cells in front of tail.
+    """
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    cell = tail
+    for v in reversed(values):
+        cell = (v, cell, 1 + (cell[2] if cell else 0))
+    return cell
@@ -0,0 +1,285 @@
+"""A Map kept in a SQLite database file rather than in memory, for mappings
+too large to hold in RAM. Only the standard library's sqlite3 is needed.
+"""
+
+import io
+import os
+import pickle
+import sqlite3
+import tempfile
+import weakref
+from collections import Mapping, OrderedDict
+from itertools import chain, islice
+from ..abc import Applicative, Monoid
+from ..utils.internal import Instance, _items, _mapping_eq, _mapping_ne
+from .map import Map
+
+
+__all__ = ('DiskMap',)
+
+
+#: how many rows are written to the database per statement
+BATCH_SIZE = 10000
+
+#: how many recently read values each DiskMap keeps in memory
+CACHE_SIZE = 1024
+
+_SCHEMA = ("CREATE TABLE IF NOT EXISTS map "
+           "(key BLOB PRIMARY KEY, value BLOB NOT NULL)")
+
+_UPSERT = ("INSERT INTO map (key, value) {!s} "
+           "ON CONFLICT(key) DO UPDATE SET value = excluded.value")
+
+
+def _dumps(x):
+    return pickle.dumps(x, pickle.HIGHEST_PROTOCOL)
+
+
+def _dumps_key(k):
+    """Pickles a key without pickle's memo, which otherwise makes the bytes
+    depend on which parts of the key are the same object rather than just
+    on its value. This relies on ``Pickler.fast``, which the pickle docs
+    list as deprecated but which both the C and Python picklers still
+    honor; without it, keys sharing parts would silently stop matching.
+    """
+    buf = io.BytesIO()
+    pickler = pickle.Pickler(buf, pickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(k)
+    return buf.getvalue()
+
+
+def _loads(b):
+    return pickle.loads(b)
+
+
+def _unused(path):
+    """Refuses to write a new DiskMap into a file that already exists,
+    which would otherwise upsert into whatever mapping is stored there.
+    """
+    if path is not None and os.path.exists(path):
+        raise ValueError("{!r} already exists; give fmap, apply, mappend "
+                         "and mconcat a new path".format(path))
+
+
+class DiskMap(Applicative, Monoid, Mapping):
+    """A pynads.Map stored in a SQLite file, with the same Mapping, Functor,
+    Applicative and Monoid behavior as Map.
+
+    >>> m = DiskMap({'a': 1, 'b': 2})           # in a temporary file
+    >>> n = DiskMap(rows, path='counts.sqlite')  # in a file of your own
+    >>> (lambda x: x + 1) % m
+    ... DiskMap(<2 keys in '/tmp/tmpk2v9x1.sqlite'>)
+
+    Like Map, a DiskMap is never changed once built; fmap, apply, mappend
+    and mconcat all write a new DiskMap, in a new temporary file unless a
+    path is given to the method, in which case nothing may exist at that
+    path yet. Temporary files are deleted once the DiskMap using them is
+    closed or garbage collected. Opening an existing file by passing
+    ``path`` to DiskMap itself reuses the data already in it.
+
+    None of these ever hold the whole mapping in memory: rows are streamed
+    out of one database and written into the other ``BATCH_SIZE`` at a
+    time inside a single transaction. When both sides are DiskMaps, apply
+    joins them and mappend copies rows within SQLite without unpickling.
+    Lookups keep the ``CACHE_SIZE`` most recently read values in memory.
+
+    Keys and values are stored pickled, so both must be picklable -- which
+    rules out lambdas and other local functions as values -- and keys are
+    matched by their pickles, so keys that are equal but pickle
+    differently, such as ``1`` and ``1.0``, are different keys. Keys are
+    pickled without the memo (using the deprecated ``Pickler.fast``), so
+    whether the parts of a key are shared objects doesn't matter, but they
+    can't contain themselves.
+    """
+    __slots__ = ('path', '_conn', '_cache', '_size', '_closer')
+    mempty = Instance()
+
+    def __init__(self, v=None, path=None, **kwds):
+        temporary = path is None
+        if temporary:
+            fd, path = tempfile.mkstemp(suffix='.sqlite')
+            os.close(fd)
+        conn = sqlite3.connect(path)
+        conn.execute(_SCHEMA)
+        super(DiskMap, self).__init__(conn)
+        self.path = path
+        self._conn = conn
+        self._cache = OrderedDict()
+        self._closer = weakref.finalize(self, _close, conn,
+                                        path if temporary else None)
+        self._store(chain(_items(v or ()), kwds.items()))
+
+    def _store(self, items):
+        """Writes items in batches within one transaction.
+        """
+        items = iter(items)
+        sql = _UPSERT.format("VALUES (?, ?)")
+        with self._conn:
+            while True:
+                batch = [(_dumps_key(k), _dumps(x))
+                         for k, x in islice(items, BATCH_SIZE)]
+                if not batch:
+                    break
+                self._conn.executemany(sql, batch)
+        self._size = None
+        self._cache.clear()
+
+    def _copy_from(self, other):
+        """Copies every row of another DiskMap within SQLite.
+        """
+        with self._conn:
+            self._conn.execute("ATTACH DATABASE ? AS other", (other.path,))
+        try:
+            with self._conn:
+                # WHERE keeps SQLite from parsing ON CONFLICT as a join
+                select = "SELECT key, value FROM other.map WHERE true"
+                self._conn.execute(_UPSERT.format(select))
+        finally:
+            self._conn.execute("DETACH DATABASE other")
+        self._size = None
+        self._cache.clear()
+
+    def close(self):
+        """Closes the database, deleting it if it was a temporary file.
+        """
+        self._closer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return "DiskMap(<{!s} keys in {!r}>)".format(len(self), self.path)
+
+    @classmethod
+    def unit(cls, v):
+        return cls([v])
+
+    @classmethod
+    def fromkeys(cls, keys, value=None, path=None):
+        return cls(((k, value) for k in keys), path)
+
+    def to_map(self):
+        return Map.wrap(dict(self.items()))
+
+    def items(self):
+        """Streams ``(key, value)`` pairs from the database.
+        """
+        rows = self._conn.execute("SELECT key, value FROM map ORDER BY rowid")
+        return ((_loads(k), _loads(x)) for k, x in rows)
+
+    def values(self):
+        return (x for _, x in self.items())
+
+    def fmap(self, func, path=None):
+        """Maps a function over the values, streaming them into a new
+        DiskMap one row at a time.
+        """
+        _unused(path)
+        return DiskMap(((k, func(x)) for k, x in self.items()), path)
+
+    def apply(self, other, path=None):
+        """Maps functions in this DiskMap to the values with the same key in
+        another mapping, dropping keys that don't appear in both. Two
+        DiskMaps are joined by SQLite.
+        """
+        _unused(path)
+        if isinstance(other, DiskMap):
+            pairs = self._joined(other)
+        else:
+            missing = object()
+            pairs = ((k, f, other.get(k, missing))
+                     for k, f in self.items())
+            pairs = (p for p in pairs if p[2] is not missing)
+        return DiskMap(((k, f(x)) for k, f, x in pairs), path)
+
+    def _joined(self, other):
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.execute("ATTACH DATABASE ? AS other", (other.path,))
+            rows = conn.execute("SELECT a.key, a.value, b.value "
+                                "FROM main.map a JOIN other.map b "
+                                "ON a.key = b.key ORDER BY a.rowid")
+            for k, f, x in rows:
+                yield _loads(k), _loads(f), _loads(x)
+        finally:
+            conn.close()
+
+    def mappend(self, other, path=None):
+        """Joins two mappings into a new DiskMap. If a key appears in both,
+        the value from other wins.
+        """
+        return DiskMap.mconcat(self, other, path=path)
+
+    @classmethod
+    def mconcat(cls, *ms, **kwds):
+        """Joins every mapping into a single new DiskMap; the last
+        appearance of a key wins. Accepts a ``path`` keyword.
+        """
+        path = kwds.pop('path', None)
+        if kwds:
+            raise TypeError("mconcat() got unexpected keyword arguments: "
+                            "{!s}".format(', '.join(sorted(kwds))))
+        _unused(path)
+        result = cls(path=path)
+        for m in ms:
+            if isinstance(m, DiskMap):
+                result._copy_from(m)
+            else:
+                result._store(_items(m))
+        return result
+
+    # from collections.Mapping
+    def __len__(self):
+        if self._size is None:
+            self._size = self._conn.execute(
+                "SELECT COUNT(*) FROM map").fetchone()[0]
+        return self._size
+
+    def __iter__(self):
+        rows = self._conn.execute("SELECT key FROM map ORDER BY rowid")
+        return (_loads(k) for k, in rows)
+
+    def __contains__(self, k):
+        try:
+            self[k]
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, k):
+        cache = self._cache
+        key = _dumps_key(k)
+        try:
+            cache.move_to_end(key)
+            return cache[key]
+        except KeyError:
+            pass
+        row = self._conn.execute("SELECT value FROM map WHERE key = ?",
+                                 (key,)).fetchone()
+        if row is None:
+            raise KeyError(k)
+        value = cache[key] = _loads(row[0])
+        if len(cache) > CACHE_SIZE:
+            cache.popitem(last=False)
+        return value
+
+    def __eq__(self, other):
+        return _mapping_eq(self, other, (DiskMap, Map))
+
+    def __ne__(self, other):
+        return _mapping_ne(self, other)
+
+    __hash__ = None
+
+
+def _close(conn, temporary_path):
+    conn.close()
+    if temporary_path is not None:
+        try:
+            os.remove(temporary_path)
+        except OSError:  # pragma: no cover
+            pass
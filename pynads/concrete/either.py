@@ -1,4 +1,5 @@
 from ..funcs import fmap
+from .list import List
 from ..abc import Monad, Container, Option, Full, Empty
 from ..utils.compat import wraps
 from ..utils.decorators import method_optional_kwargs
@@ -125,6 +126,18 @@ class Either(Monad, Option):
     def unit(v):
         return Right(v)
 
+    @staticmethod
+    def _sequence(eithers):
+        """Fast path for pynads.funcs.sequence and mapM: collects the
+        values in a single pass and stops at the first Left.
+        """
+        values = List.builder()
+        for either in eithers:
+            if not either:
+                return either
+            values.append(either.v)
+        return Right(values.persistent())
+
 
 class Left(Either, Empty):
     """Similar to Nothing in that it only returns itself when fmap, apply
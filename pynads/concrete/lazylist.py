@@ -0,0 +1,242 @@
+from collections import Sized
+from itertools import chain, islice, product
+from ..abc import Monad, Monoid
+from ..funcs.monoid import mappend
+from ..funcs.pure import compose
+from ..utils.compat import filter, map, range, reduce
+from ..utils.internal import _iter_but_not_str_or_map, Instance
+from ..utils.unique import unique
+from .list import List
+
+
+__all__ = ('LazyList',)
+
+
+# pipeline steps, stored as (kind, argument) pairs
+_FMAP, _FILTER, _BIND, _APPLY, _SLICE, _DISTINCT = range(6)
+_step_names = ('fmap', 'filter', 'bind', 'apply', 'slice', 'distinct')
+
+
+class LazyList(Monad, Monoid):
+    """A lazy take on pynads.List.
+
+    Where List.fmap, List.filter and List.bind each build a complete new
+    List, LazyList only records the operation. Nothing is run until the
+    LazyList is iterated, indexed or forced, at which point every recorded
+    step runs over the source in a single pass. This means:
+
+    >>> xs = List(*range(10)).lazy()
+    >>> ys = (lambda x: x*2) % xs.filter(lambda x: x % 3) >> (lambda x: [x, -x])
+
+    hasn't called a single function yet, and iterating ``ys`` never creates
+    the intermediate Lists that the eager version would.
+
+    Because values are only pulled as needed, the source may be infinite:
+
+    >>> from itertools import count
+    >>> LazyList(count()).fmap(lambda x: x*x).take(5).force()
+    ... List(0, 1, 4, 9, 16)
+
+    Consecutive fmaps are composed into a single function before running.
+
+    A LazyList is only as replayable as its source. A List, tuple or other
+    container can be iterated any number of times, but a generator source
+    is exhausted after the first full pass.
+
+    When it can be known without running anything, ``size`` reports how
+    many values the LazyList will produce. This is most useful with
+    ``List.lazy_apply``, which streams the results of applying curried
+    functions over several Lists rather than building every intermediate
+    product:
+
+    >>> add3 = lambda x: lambda y: lambda z: x+y+z
+    >>> sums = List(add3).lazy_apply(List(*range(1000)), List(*range(1000)),
+    ...                              List(*range(1000)))
+    >>> sums.size
+    ... 1000000000
+    >>> sums.filter(lambda x: x == 42).take(3).force()
+    ... List(42, 42, 42)
+
+    ``fold`` reduces the values as they're produced, joining them with
+    their monoidal mappend unless another function is given.
+    """
+    __slots__ = ('_steps',)
+    mempty = Instance()
+
+    def __init__(self, source=(), _steps=()):
+        super(LazyList, self).__init__(source)
+        self._steps = _steps
+
+    def __repr__(self):
+        steps = ', '.join(_step_names[kind] for kind, _ in self._steps)
+        return "LazyList({!r}{!s})".format(self.v,
+                                           ' | ' + steps if steps else '')
+
+    def _then(self, kind, arg):
+        if kind == _FMAP and self._steps and self._steps[-1][0] == _FMAP:
+            # fuse consecutive fmaps into one composed function
+            arg = compose(arg, self._steps[-1][1])
+            return LazyList(self.v, self._steps[:-1] + ((_FMAP, arg),))
+        return LazyList(self.v, self._steps + ((kind, arg),))
+
+    @property
+    def size(self):
+        """The number of values this LazyList produces, or None if that
+        can't be known without running it.
+        """
+        size = _size_of(self.v)
+        for kind, arg in self._steps:
+            if size is None:
+                return None
+            elif kind in (_FILTER, _BIND, _DISTINCT):
+                return None
+            elif kind == _APPLY:
+                other = _size_of(arg)
+                size = None if other is None else size * other
+            elif kind == _SLICE:
+                size = len(range(size)[slice(*arg)])
+        return size
+
+    def __length_hint__(self):
+        return self.size or 0
+
+    def __iter__(self):
+        it = iter(self.v)
+        for kind, arg in self._steps:
+            if kind == _FMAP:
+                it = map(arg, it)
+            elif kind == _FILTER:
+                it = filter(arg, it)
+            elif kind == _BIND:
+                it = chain.from_iterable(map(arg, it))
+            elif kind == _APPLY:
+                it = (f(x) for f in it for x in arg)
+            elif kind == _SLICE:
+                it = islice(it, *arg)
+            elif kind == _DISTINCT:
+                it = unique(it, arg)
+        return it
+
+    @classmethod
+    def unit(cls, v):
+        return cls((v,))
+
+    def fmap(self, func):
+        return self._then(_FMAP, func)
+
+    def apply(self, other):
+        """Applies every function in this LazyList to every value in
+        ``other`` in the same order as pynads.List.apply. ``other`` is
+        iterated once per function so it must be replayable.
+        """
+        return self._then(_APPLY, other)
+
+    def bind(self, bindee):
+        return self._then(_BIND, bindee)
+
+    def filter(self, predicate):
+        return self._then(_FILTER, predicate)
+
+    def distinct(self, key=None):
+        """Drops every value already produced, or whose key already was.
+        Only the distinct values are remembered, never the whole stream, and
+        they needn't be hashable; see pynads.utils.unique.
+        """
+        return self._then(_DISTINCT, key)
+
+    def take(self, n):
+        """Limits the LazyList to at most its first ``n`` values.
+        """
+        return self._then(_SLICE, (n,))
+
+    def mappend(self, other):
+        if not _iter_but_not_str_or_map(other):
+            raise TypeError("Can only append non-str/Mapping iterable to a "
+                            "{!s} instance, not {!s}"
+                            "".format(type(self), type(other)))
+        return LazyList(_Chained((self, other)))
+
+    @classmethod
+    def mconcat(cls, *monoids):
+        return cls(_Chained(monoids))
+
+    def fold(self, func=None, *initial):
+        """Reduces the values one at a time as they are produced, so they
+        never all exist at once. By default values are joined with
+        pynads.funcs.mappend, so numbers are summed, Lists concatenated,
+        Maps merged and so on. An initial value may also be given.
+        """
+        return reduce(func or mappend, self, *initial)
+
+    def force(self):
+        """Runs every recorded step and returns the result as a List.
+        """
+        return List.from_iterable(self)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            if any(i is not None and i < 0
+                   for i in (idx.start, idx.stop, idx.step)):
+                return self.force()[idx]
+            return self._then(_SLICE, (idx.start, idx.stop, idx.step))
+        if idx < 0:
+            return self.force()[idx]
+        try:
+            return next(islice(self, idx, None))
+        except StopIteration:
+            raise IndexError("LazyList index out of range")
+
+
+def _size_of(values):
+    if isinstance(values, (LazyList, _Product)):
+        return values.size
+    elif isinstance(values, Sized):
+        return len(values)
+    return None
+
+
+class _Product(object):
+    """Replayable stream of curried functions applied to every combination
+    of arguments, in the same order as repeated List.apply. Its size is
+    known when every argument's is.
+    """
+    __slots__ = ('funcs', 'args')
+
+    def __init__(self, funcs, args):
+        self.funcs = funcs
+        self.args = args
+
+    @property
+    def size(self):
+        size = len(self.funcs)
+        for arg in self.args:
+            n = _size_of(arg)
+            if n is None:
+                return None
+            size *= n
+        return size
+
+    def __iter__(self):
+        for combo in product(self.funcs, *self.args):
+            result = combo[0]
+            for arg in combo[1:]:
+                result = result(arg)
+            yield result
+
+    def __repr__(self):
+        return ' * '.join(repr(i) for i in (self.funcs,) + self.args)
+
+
+class _Chained(object):
+    """Replayable concatenation of several iterables.
+    """
+    __slots__ = ('iterables',)
+
+    def __init__(self, iterables):
+        self.iterables = iterables
+
+    def __iter__(self):
+        return chain.from_iterable(self.iterables)
+
+    def __repr__(self):
+        return ' + '.join(repr(i) for i in self.iterables)
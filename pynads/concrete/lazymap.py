@@ -0,0 +1,102 @@
+from threading import RLock
+from ..funcs.pure import compose, identity
+from ..utils.internal import Instance
+from .map import Map
+
+
+__all__ = ('LazyMap',)
+
+
+class LazyMap(Map):
+    """A view of a pynads.Map with a function mapped over its values, where
+    each value is only computed the first time it's looked up and then
+    cached. Created by ``Map.lazy_fmap``:
+
+    >>> m = Map({'a': 1, 'b': 2}).lazy_fmap(expensive)
+    >>> m['a']  # calls expensive(1)
+    >>> m['a']  # cached, expensive isn't called again
+
+    Keys, ``len`` and ``in`` come straight from the original Map without
+    computing anything. Chaining ``lazy_fmap`` calls composes the functions
+    so each key still makes a single (fused) call when it's read. Anything
+    else that needs every value -- eager fmap, apply, mappend, equality,
+    ``.v`` -- computes the rest of them first, as does ``force``, which
+    returns a plain Map.
+
+    Computing values is thread-safe: however many threads read a key, the
+    function is called once for it. A reentrant lock is held while
+    computing a value, so values are computed one at a time, but a function
+    may itself read other keys of the same LazyMap.
+
+    A LazyMap can be pickled, along with the values computed so far, as
+    long as its function can be; the lock is left out and a new one made.
+    """
+    __slots__ = ('_func', '_cache', '_lock')
+    mempty = Instance()
+
+    def __init__(self, source=None, func=None):
+        if isinstance(source, LazyMap):
+            func = compose(func, source._func) if func else source._func
+            source = source._v
+        elif isinstance(source, Map):
+            source = source.v
+        else:
+            source = dict(source or ())
+        super(Map, self).__init__(source)
+        self._func = func or identity
+        self._cache = {}
+        self._lock = RLock()
+
+    def __repr__(self):
+        return "LazyMap({!s} values, {!s} computed)".format(len(self._v),
+                                                           len(self._cache))
+
+    @classmethod
+    def wrap(cls, d):
+        return cls(Map.wrap(d))
+
+    def __getstate__(self):
+        return self._v, self._func, dict(self._cache)
+
+    def __setstate__(self, state):
+        self._v, self._func, self._cache = state
+        self._lock = RLock()
+
+    def _get_val(self):
+        return self.force().v
+
+    def __getitem__(self, k):
+        cache = self._cache
+        try:
+            return cache[k]
+        except KeyError:
+            pass
+        with self._lock:
+            try:
+                return cache[k]
+            except KeyError:
+                value = cache[k] = self._func(self._v[k])
+                return value
+
+    def force(self):
+        """Computes every value not yet computed and returns them as a Map.
+        """
+        return Map.wrap({k: self[k] for k in self._v})
+
+    def lazy_fmap(self, func):
+        return LazyMap(self, func)
+
+    def fmap(self, func):
+        return Map.wrap({k: func(self[k]) for k in self._v})
+
+    def __len__(self):
+        return len(self._v)
+
+    def __contains__(self, x):
+        return x in self._v
+
+    def __iter__(self):
+        return iter(self._v)
+
+    def keys(self):
+        return self._v.keys()
@@ -1,10 +1,17 @@
+import operator
 from collections import Sequence
-from itertools import chain
+from heapq import nlargest, nsmallest
+from itertools import chain, product
 from ..abc import Monad, Monoid
+from ..utils.compat import filter, map, range
 from ..utils.internal import _iter_but_not_str_or_map, Instance
+from ..utils.parallel import chunked_map
+from ..utils.unique import Distinct, fingerprint
+from ..utils.vector import Vector, LEAF_SIZE
+from .map import Map
 
 
-__all__ = ('List',)
+__all__ = ('List', 'ListBuilder')
 
 
 class List(Monad, Monoid, Sequence):
@@ -75,24 +82,101 @@ class List(Monad, Monoid, Sequence):
 
     >>> nat_nums.bind(sqrt)
     ... List(1.0, -1.0, 2.0, -2.0, 3.0, -3.0)
+
+    Internally, the values are held in a persistent vector
+    (``pynads.utils.vector.Vector``) rather than a plain tuple. Since the
+    vector shares structure between instances, ``cons``, ``append``,
+    ``mappend`` and slicing only cost O(log n) instead of copying the entire
+    List each time. ``List.v`` still provides the values as a tuple.
     """
-    __slots__ = ()
+    __slots__ = ('_index',)
     mempty = Instance()
 
     def __init__(self, *vs):
         # rather than tyring to do all sorts of
         # complicated stuff with actually being a tuple
         # but also a monad, we'll just proxy all the
-        # needed operations to a tuple
+        # needed operations to a persistent vector
         # also alleviates the need for ``__new__``
-        super(List, self).__init__(vs)
+        super(List, self).__init__(Vector.from_tuple(vs))
+
+    @classmethod
+    def from_tuple(cls, vs):
+        """Creates a List that takes ownership of an existing tuple
+        without copying it. Compare to ``List(*vs)`` which unpacks the
+        tuple into a fresh argument tuple first.
+        """
+        if not isinstance(vs, tuple):
+            raise TypeError("List.from_tuple expects a tuple, not {!s}"
+                            "".format(type(vs)))
+        return cls._from_vector(Vector.from_tuple(vs))
+
+    @classmethod
+    def from_iterable(cls, vs):
+        """Creates a List from any iterable. Tuples are adopted as they
+        are, the contents of another List are shared and everything else
+        is copied exactly once.
+        """
+        if isinstance(vs, List):
+            return cls._from_vector(vs._v)
+        elif isinstance(vs, tuple):
+            return cls.from_tuple(vs)
+        return cls._from_vector(Vector.from_iterable(vs))
+
+    @staticmethod
+    def builder(values=()):
+        """Returns a ListBuilder: a mutable buffer for building up a List
+        one value at a time, which is then frozen into a List in O(1).
+
+        >>> b = List.builder()
+        >>> for x in range(3):
+        ...     b.append(x)
+        >>> b.persistent()
+        ... List(0, 1, 2)
+
+        Also usable as a context manager, freezing the List on exit:
+
+        >>> with List.transient() as b:
+        ...     b.extend(range(3))
+        >>> b.persistent()
+        ... List(0, 1, 2)
+        """
+        return ListBuilder(values)
+
+    transient = builder
+
+    @staticmethod
+    def typed(typecode, values=()):
+        """Creates a pynads.TypedList, a List storing its values in compact
+        ``array.array`` buffers. See ``array.array`` for the typecodes.
+        """
+        from .typedlist import TypedList
+        return TypedList(typecode, values)
+
+    @classmethod
+    def _from_vector(cls, vector):
+        """Creates a List directly from an existing vector, skipping
+        ``List.__init__`` and the argument splatting it requires.
+        """
+        inst = cls.__new__(cls)
+        inst._v = vector
+        return inst
+
+    @staticmethod
+    def _as_vector(other):
+        if isinstance(other, List):
+            return other._v
+        return Vector.from_iterable(other)
+
+    def _get_val(self):
+        return self._v.to_tuple()
 
     def __repr__(self):
         main = "List({!s})"
         if len(self) > 10:
-            head = self.v[:5]
+            head = self[:5]
             middle = '...{!s} more...'.format(len(self) - 10)
-            tail = self.v[-5:]
+            tail = self[-5:]
             body = ', '.join([repr(i) for i in chain(head, [middle], tail)])
 
         else:
@@ -131,7 +215,7 @@ class List(Monad, Monoid, Sequence):
                 instance Functor [] where
                     fmap = map
         """
-        return List(*[func(v) for v in self])
+        return List.from_tuple(tuple(map(func, self)))
 
     def apply(self, other):
         """Using `<*>` between a ``[(a->b)]`` and a `[a]` in Haskell
@@ -150,7 +234,28 @@ class List(Monad, Monoid, Sequence):
 
         Which is exactly how this is implemented.
         """
-        return List(*[f(x) for f in self for x in other])
+        return List.from_tuple(tuple(f(x) for f in self for x in other))
+
+    def lazy_apply(self, *others):
+        """Streaming version of applying this List to one or more Lists,
+        i.e. ``fs * xs * ys``, that doesn't build the intermediate products.
+
+        The result is a pynads.LazyList that knows its size before anything
+        is computed, and which can be iterated, sliced, filtered or reduced
+        with ``LazyList.fold`` while only holding one combination at a time.
+
+        >>> add = lambda x: lambda y: x+y
+        >>> sums = List(add).lazy_apply(List(1, 2), List(10, 20))
+        >>> sums.size
+        ... 4
+        >>> sums.force()
+        ... List(11, 21, 12, 22)
+
+        Every List after the first is iterated many times, so they need to
+        be replayable (not generators).
+        """
+        from .lazylist import LazyList, _Product
+        return LazyList(_Product(self, others))
 
     def bind(self, bindee):
         """Binding a List monad to a function requires a little more
@@ -213,7 +318,15 @@ class List(Monad, Monoid, Sequence):
         >>> List(1, 4, 9) >> true_root
         List(1.0, -1.0, 2.0, -2.0, 3.0, -3.0)
         """
-        return List(*chain.from_iterable(self.fmap(bindee)))
+        return List.from_iterable(chain.from_iterable(map(bindee, self)))
+
+    @staticmethod
+    def _sequence(lists):
+        """Fast path for pynads.funcs.sequence and mapM: every combination
+        of one value from each List, generated by itertools.product rather
+        than by repeatedly consing onto intermediate Lists.
+        """
+        return List.from_iterable(map(List.from_tuple, product(*lists)))
 
     def mappend(self, other):
         """In Haskell. the ``mappend`` for ``[]`` is defined as ``(++)``
@@ -227,16 +340,16 @@ class List(Monad, Monoid, Sequence):
 
         However, this can be greatly inefficient if a bunch of lists are
         being combined as we're constantly prepending to the beginning of
-        a list. In Python, we can cheat some and simply use ``itertools.chain``
-        to combine many iterables into one iterable, and then feeding the
-        result to ``pynads.List``.
+        a list. Since List is backed by a persistent vector, the two
+        Lists are joined in O(log n) while sharing their storage with the
+        result. Other iterables are copied once into a vector first.
         """
         if not _iter_but_not_str_or_map(other):
             raise TypeError("Can only append non-str/Mapping iterable to a "
                             "{!s} instance, not {!s}"
                             "".format(type(self), type(other)))
         else:
-            return List(*chain(self, other))
+            return List._from_vector(self._v.concat(List._as_vector(other)))
 
     @classmethod
     def mconcat(cls, *monoids):
@@ -245,138 +358,369 @@ class List(Monad, Monoid, Sequence):
         end up just creating a bunch of List instances that would be
         instantly garbage collected. Instead, we can define our own
         implementation of mconcat that will create only one new instance.
+
+        Runs of small monoids are gathered in a ListBuilder and copied once,
+        while larger Lists are joined by sharing their storage.
+        """
+        vector = Vector.from_tuple(())
+        builder = ListBuilder()
+        for monoid in monoids:
+            if isinstance(monoid, List) and len(monoid) >= LEAF_SIZE:
+                vector = vector.concat(builder.persistent()._v)
+                vector = vector.concat(monoid._v)
+                builder = ListBuilder()
+            else:
+                builder.extend(monoid)
+        return cls._from_vector(vector.concat(builder.persistent()._v))
+
+    def par_fmap(self, func, executor=None, chunksize=None, workers=None):
+        """Parallel version of fmap. The List is split into chunks which are
+        mapped over on a ``concurrent.futures`` executor and reassembled in
+        their original order.
+
+        Without an executor, a process pool is created for the call, so
+        func and the values must be picklable. Pass a ThreadPoolExecutor
+        for I/O bound functions. Unless a chunksize is given, one is picked
+        by timing func on the first few values and balancing the chunks
+        across ``workers``, the number of CPUs unless given.
+
+        See: pynads.utils.parallel.chunked_map
+        """
+        return List.from_iterable(chunked_map(func, self.v, executor,
+                                              chunksize, workers=workers))
+
+    def par_bind(self, bindee, executor=None, chunksize=None, workers=None):
+        """Parallel version of bind, with the same chunking and executor
+        handling as par_fmap. Each chunk is flattened in the worker so only
+        the resulting values travel back.
         """
-        return cls(*chain.from_iterable(monoids))
+        return List.from_iterable(chunked_map(bindee, self.v, executor,
+                                              chunksize, flatten=True,
+                                              workers=workers))
 
     def filter(self, predicate):
-        return List(*filter(predicate, self))
+        return List.from_iterable(filter(predicate, self))
+
+    def lazy(self):
+        """Returns a pynads.LazyList view of this List. fmap, filter, bind
+        and apply on the view are recorded rather than run and then run
+        together in a single pass when the view is iterated or forced.
+        """
+        from .lazylist import LazyList
+        return LazyList(self)
+
+    def chunks(self, n):
+        """Splits the List into consecutive Lists of ``n`` values each, the
+        last of which may be shorter. See ``windows``.
+
+        >>> List(1, 2, 3, 4, 5).chunks(2).force()
+        ... List(List(1, 2), List(3, 4), List(5))
+        """
+        return self.windows(n, n, partial=True)
+
+    def windows(self, n, step=1, partial=False):
+        """Slides a window of ``n`` values across the List, moving ``step``
+        values at a time. Windows that would run off the end of the List
+        are only included when partial is true.
+
+        >>> List(1, 2, 3, 4).windows(3).force()
+        ... List(List(1, 2, 3), List(2, 3, 4))
+
+        The windows are produced lazily as a pynads.LazyList, so they can be
+        streamed, filtered or mapped without creating them all at once, and
+        each is a view sharing storage with this List rather than a copy.
+        """
+        from .lazylist import LazyList
+        if n < 1 or step < 1:
+            raise ValueError("window size and step must be positive")
+        return LazyList(_Windows(self, n, step, partial))
+
+    def batched_bind(self, bindee, n):
+        """Like bind, except the bindee is called once per chunk of ``n``
+        values -- each a List -- rather than once per value, and returns an
+        iterable of results for the whole chunk. Suits bindees that work in
+        bulk, such as one database query or vectorized call per chunk.
+        The results are joined into a single List.
+        """
+        builder = ListBuilder()
+        for chunk in self.chunks(n):
+            builder.extend(bindee(chunk))
+        return builder.persistent()
 
     def cons(self, x):
         """Prepends an item to an existing List.
         Returns new List.
         """
-        return List(x).mappend(self)
+        return List._from_vector(self._v.cons(x))
 
     def append(self, x):
         """Appends an item to an existing Listing.
         Returns new List.
         """
-        return self.mappend(List(x))
+        return List._from_vector(self._v.append(x))
 
     extend = mappend
 
+    def _lookup(self):
+        """Returns a dict mapping every value in the List to the position
+        of its first appearance, or None if any value is unhashable.
+
+        Since a List never changes, the dict is built the first time it's
+        needed and then cached on the instance. Its keys are also the
+        distinct values of the List in the order they first appear.
+        """
+        try:
+            return self._index
+        except AttributeError:
+            pass
+        index = {}
+        try:
+            for i, v in enumerate(self):
+                index.setdefault(v, i)
+        except TypeError:
+            index = None
+        self._index = index
+        return index
+
+    @staticmethod
+    def _hash_index(values, key=None):
+        """The ordered hash index of a List, list or tuple, or None when
+        its values can't be hashed or are compared by a key function.
+        """
+        if key is None:
+            if isinstance(values, List):
+                return values._lookup()
+            try:
+                return dict.fromkeys(values)
+            except TypeError:
+                pass
+        return None
+
+    @staticmethod
+    def _distinct_index(values, key=None):
+        """Ordered, de-duplicated lookup for the values of a List or any
+        other iterable. Values that can't be hashed, or values compared by
+        a key function, are tracked with pynads.utils.unique.Distinct.
+        """
+        if not isinstance(values, (List, list, tuple)):
+            values = tuple(values)
+        index = List._hash_index(values, key)
+        return Distinct(values, key) if index is None else index
+
+    @staticmethod
+    def _distinct_indexes(this, that, key=None):
+        """Lookups for both sides of a set operation. Hash indexes are only
+        used when both sides have one, since looking an unhashable value up
+        in a dict raises TypeError.
+        """
+        this, that = [v if isinstance(v, (List, list, tuple)) else tuple(v)
+                      for v in (this, that)]
+        indexes = List._hash_index(this, key), List._hash_index(that, key)
+        if indexes[0] is None or indexes[1] is None:
+            return Distinct(this, key), Distinct(that, key)
+        return indexes
+
     # set like operations
-    # use of filter and chain is to avoid creation
-    # of intermediate List objects which are expensive
-    # but immediately garbage collected
-    # saw times drop from ~180ms to ~1.5ms
-    # when tested with List(*range(3, 10001, 3) and
-    # List(*range(5, 10001, 5) as the test subjects
-    # The restriction with these is the same as Python's set
-    # the contained objects must be hashable
-    def union(self, other):
+    # these are answered from the cached hash index of each List
+    # so repeated operations against the same List don't rehash it
+    # Unhashable values (dicts, lists, ...) are fingerprinted or sorted
+    # rather than compared pairwise, see pynads.utils.unique
+    # Each also accepts a key function, in which case values are
+    # considered the same when their keys are equal
+    def union(self, other, key=None):
         """Unique union of two Lists, i.e. every item in both lists
         """
-        return List.distinct(chain(self, other))
+        this, that = List._distinct_indexes(self, other, key)
+        return List.from_iterable(chain(this, (v for v in that
+                                               if v not in this)))
 
     def __or__(self, other):
         return self.union(other)
 
     __ior__ = __or__
 
-    def intersect(self, other):
+    def intersect(self, other, key=None):
         """Unique intersection of two Lists, i.e.
         every item that appears in both Lists.
         """
-        intersect_set = set(self).intersection(set(other))
-        in_set = lambda n: n in intersect_set
-        this = filter(in_set, self)
-        that = filter(in_set, other)
-        return List.distinct(chain(this, that))
+        this, that = List._distinct_indexes(self, other, key)
+        return List.from_iterable(v for v in this if v in that)
 
     def __and__(self, other):
         return self.intersect(other)
 
     __iand__ = __and__
 
-    def difference(self, other):
+    def difference(self, other, key=None):
         """Difference of two lists, i.e. every item in this list
         that's not in the other
         """
-        diff_set = set(self).difference(set(other))
-        this = filter(lambda n: n in diff_set, self)
-        return List.distinct(this)
+        this, that = List._distinct_indexes(self, other, key)
+        return List.from_iterable(v for v in this if v not in that)
 
     def __sub__(self, other):
         return self.difference(other)
 
     __isub__ = __sub__
 
-    def symmetric_difference(self, other):
+    def symmetric_difference(self, other, key=None):
         """Symmetric difference of two lists, i.e. every item that only
         appears in each list.
         """
-        sym_diff_set = set(self).symmetric_difference(set(other))
-        in_set = lambda n: n in sym_diff_set
-        this = filter(in_set, self)
-        that = filter(in_set, other)
-        return List.distinct(chain(this, that))
+        this, that = List._distinct_indexes(self, other, key)
+        return List.from_iterable(chain((v for v in this if v not in that),
+                                        (v for v in that if v not in this)))
 
     def __xor__(self, other):
         return self.symmetric_difference(other)
 
     __ixor__ = __xor__
 
-    def distinct(self):
-        unique_list = []
-        unique_set = set()
-        for item in self:
-            if item not in unique_set:
-                unique_set.add(item)
-                unique_list.append(item)
-        return List(*unique_list)
+    def distinct(self, key=None):
+        """Every value of the List once, in the order each first appears.
+        """
+        return ListBuilder(List._distinct_index(self, key)).persistent()
 
     def __invert__(self):
         return self.distinct()
 
+    # relational operations
+    # each makes a single pass over each List involved rather than
+    # building them out of nested binds
+    def join(self, other, key, other_key=None, how='inner'):
+        """Hash join of two Lists, pairing each value of this List with every
+        value of other that has an equal key. Produces a List of
+        ``(this, that)`` tuples in this List's order.
+
+        ``key`` is called on the values of this List and ``other_key``, which
+        defaults to ``key``, on the values of other. ``how`` is one of:
+
+        - ``'inner'``: only values with a match on both sides
+        - ``'left'``: also every unmatched value of this List, paired with
+          None
+        - ``'outer'``: also every unmatched value of other, paired with None
+          and placed after everything else
+
+        >>> users = List({'id': 1, 'name': 'alice'}, {'id': 2, 'name': 'bob'})
+        >>> posts = List({'user': 1, 'title': 'hello'})
+        >>> users.join(posts, lambda u: u['id'], lambda p: p['user'])
+        ... List(({'id': 1, 'name': 'alice'}, {'user': 1, 'title': 'hello'}))
+
+        Only other is indexed, so pass the smaller List as other. Keys that
+        aren't hashable are fingerprinted as pynads.utils.unique does.
+        """
+        if how not in ('inner', 'left', 'outer'):
+            raise ValueError("how must be 'inner', 'left' or 'outer', "
+                             "not {!r}".format(how))
+        other_key = other_key or key
+        table = {}
+        for i, v in enumerate(other):
+            table.setdefault(fingerprint(other_key(v)), []).append((i, v))
+
+        pairs, matched = [], set()
+        for v in self:
+            matches = table.get(fingerprint(key(v)))
+            if matches:
+                pairs.extend((v, w) for _, w in matches)
+                if how == 'outer':
+                    matched.update(i for i, _ in matches)
+            elif how != 'inner':
+                pairs.append((v, None))
+        if how == 'outer':
+            unmatched = sorted((i, w) for rows in table.values()
+                               for i, w in rows if i not in matched)
+            pairs.extend((None, w) for _, w in unmatched)
+        return ListBuilder(pairs).persistent()
+
+    def group_by(self, key):
+        """Groups the values of the List by ``key`` into a Map of key to the
+        List of values with that key, each in their original order.
+
+        >>> List(1, 2, 3, 4).group_by(lambda x: x % 2)
+        ... Map({0: List(2, 4), 1: List(1, 3)})
+
+        Keys that aren't hashable are fingerprinted as pynads.utils.unique
+        does, and since a Map's keys must be hashable, their groups are
+        found under ``fingerprint(key)`` rather than the key itself.
+        """
+        groups = {}
+        for v in self:
+            k = fingerprint(key(v))
+            try:
+                group = groups[k]
+            except KeyError:
+                group = groups[k] = []
+            group.append(v)
+        return Map.wrap({k: ListBuilder(g).persistent()
+                         for k, g in groups.items()})
+
+    def sort_by(self, key=None, reverse=False):
+        """Sorts the List by ``key``, which is called exactly once per value.
+        Like ``sorted``, the sort is stable and values with equal keys are
+        never compared to each other.
+        """
+        return ListBuilder(sorted(self, key=key, reverse=reverse)).persistent()
+
+    def top_k(self, k, key=None, largest=True):
+        """The ``k`` largest values of the List, or smallest if largest is
+        false, in sorted order. Uses a heap of k values, which is O(n log k)
+        rather than sorting the whole List.
+        """
+        select = nlargest if largest else nsmallest
+        return ListBuilder(select(k, self, key=key)).persistent()
+
 
 # here be boring stuff...
     def __hash__(self):
-        return hash(("List", self.v))
+        # the hash is cached rather than the tuple it's computed from
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(("List", tuple(self._v)))
+            return self._hash
 
     def __eq__(self, other):
         if isinstance(other, List):
-            return self.v == other.v
+            return self._v == other._v
         return NotImplemented
 
     def __ne__(self, other):
         if isinstance(other, List):
-            return not self.v == other.v
+            return not self._v == other._v
         return NotImplemented
 
     def __bool__(self):
-        return bool(self.v)
+        return bool(self._v)
+
+    __nonzero__ = __bool__
 
     # functools.total_ordering (2.7+)
     # I miss thee! D:
+    # Lists compare as tuples do, but without flattening either vector
+    def _compare(self, other, op):
+        pair = self._v.mismatch(other._v)
+        if pair is None:
+            return op(len(self), len(other))
+        return op(*pair)
+
     def __lt__(self, other):
         if isinstance(other, List):
-            return self.v < other.v
+            return self._compare(other, operator.lt)
         return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, List):
-            return self.v > other.v
+            return self._compare(other, operator.gt)
         return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, List):
-            return self.v <= other.v
+            return self._compare(other, operator.le)
         return NotImplemented
 
     def __ge__(self, other):
         if isinstance(other, List):
-            return self.v >= other.v
+            return self._compare(other, operator.ge)
         return NotImplemented
 
     def __iadd__(self, other):
@@ -384,23 +728,142 @@ class List(Monad, Monoid, Sequence):
 
     def __getitem__(self, idx):
         if isinstance(idx, slice):
-            return List(*self.v[idx])
-        return self.v[idx]
+            return List._from_vector(self._v.slice(*idx.indices(len(self))))
+        return self._v[idx]
 
     def __len__(self):
-        return len(self.v)
+        return len(self._v)
 
     def __iter__(self):
-        return iter(self.v)
+        return iter(self._v)
 
     def __contains__(self, x):
-        return x in self.v
+        index = self._lookup()
+        if index is not None:
+            try:
+                return x in index
+            except TypeError:
+                pass
+        return x in self._v
 
     def __reversed__(self):
-        return List(*reversed(self.v))
+        return List._from_vector(self._v.reverse())
+
+    def view(self, start=None, stop=None, step=None):
+        """Equivalent to ``self[start:stop:step]`` except the result always
+        shares storage with this List and nothing is copied, whatever the
+        step and wherever the bounds fall.
+
+        Plain slicing mostly shares storage too, but copies values when the
+        slice would only show a small fraction of a much larger List (since
+        the slice would otherwise keep all of that storage alive), when the
+        small pieces either side of a cut between leaves get merged, and
+        when a step other than 1 or -1 crosses more than one leaf. When
+        taking many slices of a List that is going to stay alive anyway,
+        such as pages or sliding windows, use view to skip those copies.
+        """
+        indices = slice(start, stop, step).indices(len(self))
+        return List._from_vector(self._v.slice(*indices, share=True))
 
     def index(self, x):
-        return self.v.index(x)
+        index = self._lookup()
+        if index is not None:
+            try:
+                return index[x]
+            except (KeyError, TypeError):
+                pass
+        return self._v.index(x)
 
     def count(self, x):
-        return self.v.count(x)
+        if x not in self:
+            return 0
+        return self._v.count(x)
+
+
+class ListBuilder(object):
+    """A transient, mutable buffer for building a List in a loop.
+
+    Growing a List one value at a time -- ``xs = xs.append(x)`` or
+    ``xs += [x]`` -- creates a new List at every step. A builder instead
+    appends to a plain Python list and hands that list over to a new List
+    when ``persistent`` is called, so freezing costs O(1) no matter how many
+    values were added. This is the same idea as a pyrsistent evolver or a
+    Clojure transient.
+
+    The builder stays usable after freezing. The next change copies the
+    buffer first, so the frozen List is never affected.
+    """
+    __slots__ = ('_items', '_frozen')
+
+    def __init__(self, values=()):
+        self._items = list(values)
+        self._frozen = None
+
+    def __repr__(self):
+        return "ListBuilder({!r})".format(self._items)
+
+    def _writable(self):
+        if self._frozen is not None:
+            self._items = list(self._items)
+            self._frozen = None
+        return self._items
+
+    def append(self, x):
+        self._writable().append(x)
+        return self
+
+    def extend(self, xs):
+        self._writable().extend(xs)
+        return self
+
+    def __iadd__(self, xs):
+        return self.extend(xs)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def persistent(self):
+        """Freezes the buffer into a List without copying it.
+        """
+        if self._frozen is None:
+            self._frozen = List._from_vector(Vector.from_tuple(self._items))
+        return self._frozen
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.persistent()
+
+
+class _Windows(object):
+    """Replayable, sized stream of views over a List, used as the source
+    of the LazyLists produced by List.windows.
+    """
+    __slots__ = ('values', 'size', 'step', 'partial')
+
+    def __init__(self, values, size, step, partial):
+        self.values = values
+        self.size = size
+        self.step = step
+        self.partial = partial
+
+    def _starts(self):
+        last = len(self.values) if self.partial else \
+            len(self.values) - self.size + 1
+        return range(0, max(last, 0), self.step)
+
+    def __len__(self):
+        return len(self._starts())
+
+    def __iter__(self):
+        view, size = self.values.view, self.size
+        for start in self._starts():
+            yield view(start, start + size)
+
+    def __repr__(self):
+        return "windows({!r}, {!r}, {!r})".format(self.values, self.size,
+                                                 self.step)
@@ -1,7 +1,10 @@
 from collections import Mapping
 from ..abc import Applicative, Monoid
-from ..utils.internal import Instance
+from ..funcs import monoid
+from ..utils.internal import Instance, _mapping_ne
 from ..utils import chain_dict_update
+from ..utils.compat import reduce
+from ..utils.parallel import chunked_map
 
 
 class Map(Applicative, Monoid, Mapping):
@@ -44,6 +47,19 @@ class Map(Applicative, Monoid, Mapping):
     def __repr__(self):
         return "Map({!r})".format(self.v)
 
+    @classmethod
+    def wrap(cls, d):
+        """Creates a Map that takes ownership of an existing dict without
+        copying it, unlike ``Map(d)`` which copies d into a new dict. The
+        dict must not be changed afterwards.
+        """
+        if not isinstance(d, dict):
+            raise TypeError("Map.wrap expects a dict, not {!s}"
+                            "".format(type(d)))
+        inst = cls.__new__(cls)
+        inst._v = d
+        return inst
+
     @classmethod
     def unit(cls, v):
         """Similar to Data.Map.singleton: accepts a tuple with key-value
@@ -58,9 +74,32 @@ class Map(Applicative, Monoid, Mapping):
         >>> m.fmap(lambda x: x+1)
         ... Map({'a': 2, 'b': 3, 'c': 4})
         """
-        return Map({k: func(v) for k, v in self.v.items()})
+        return Map.wrap({k: func(v) for k, v in self.v.items()})
+
+    def par_fmap(self, func, executor=None, chunksize=None, workers=None):
+        """Parallel version of fmap. Only values, not keys, are sent to the
+        workers, and the result has the same key order as this Map. The
+        arguments are handled as in List.par_fmap.
+
+        See: pynads.utils.parallel.chunked_map
+        """
+        results = chunked_map(func, tuple(self.v.values()), executor,
+                              chunksize, workers=workers)
+        return Map.wrap(dict(zip(self.v, results)))
+
+    def lazy_fmap(self, func):
+        """Like fmap, except func is only called on a value the first time
+        its key is looked up, and the result is cached. Returns a
+        pynads.LazyMap view of this Map.
 
-    def apply(self, other):
+        >>> m = Map({'a': 1, 'b': 2}).lazy_fmap(lambda x: x+1)
+        >>> m['a']  # only 'a' is computed
+        ... 2
+        """
+        from .lazymap import LazyMap
+        return LazyMap(self, func)
+
+    def apply(self, other, how='inner', fillvalue=None, presorted=False):
         """Maps functions that appear in this mapping to their
         corresponding values in another mapping, ignoring keys that
         don't appear in either.
@@ -79,10 +118,48 @@ class Map(Applicative, Monoid, Mapping):
         ... Map({})
 
         This can be useful for filter with the pynads.funcs.identity function.
+
+        Other joins may be asked for with ``how``, see ``Map.zip_with``.
+        With a ``'left'`` join every function is kept, and those without a
+        value are called with ``fillvalue``. An ``'outer'`` join also keeps
+        values without a function as they are.
         """
-        keys = set(self.keys()) & set(other.keys())
-        staging = {k: self[k](other[k]) for k in keys}
-        return Map(staging)
+        staging = {}
+        for k, f, x in _align(self, other, how, presorted):
+            if f is _missing:
+                staging[k] = x
+            else:
+                staging[k] = f(fillvalue if x is _missing else x)
+        return Map.wrap(staging)
+
+    def zip_with(self, other, func, how='inner', fillvalue=None,
+                 presorted=False):
+        """Combines the values of two mappings that share a key with
+        ``func(this_value, other_value)``.
+
+        >>> prices = Map({'apple': 3, 'pear': 2})
+        >>> counts = Map({'apple': 10, 'plum': 1})
+        >>> prices.zip_with(counts, operator.mul)
+        ... Map({'apple': 30})
+        >>> prices.zip_with(counts, operator.mul, how='outer', fillvalue=0)
+        ... Map({'apple': 30, 'pear': 0, 'plum': 0})
+
+        ``how`` picks which keys are kept, like a database join:
+
+        - ``'inner'``: keys in both mappings
+        - ``'left'``: every key of this Map
+        - ``'outer'``: every key of either mapping
+
+        and ``fillvalue`` stands in for a missing value on either side.
+
+        Keys are matched by hashing, without building any sets. If both
+        mappings are known to have their keys in ascending order, such as
+        timestamps inserted in order, ``presorted`` walks the two side by
+        side instead and the result is in ascending order as well.
+        """
+        return Map.wrap({k: func(fillvalue if a is _missing else a,
+                                 fillvalue if b is _missing else b)
+                         for k, a, b in _align(self, other, how, presorted)})
 
     @classmethod
     def fromkeys(cls, keys, value=None):
@@ -92,13 +169,13 @@ class Map(Applicative, Monoid, Mapping):
         Allows easily constructing a Map from an iterable of keys and
         provides them with a default value.
         """
-        return cls(dict.fromkeys(keys, value))
+        return cls.wrap(dict.fromkeys(keys, value))
 
     def mappend(self, other):
         """Joining two mapping together is as easy as creating a new mapping
         representing the values from both mappings.
         """
-        return Map(chain_dict_update(self, other))
+        return Map.wrap(chain_dict_update(self, other))
 
     @classmethod
     def mconcat(cls, *ds):
@@ -106,7 +183,59 @@ class Map(Applicative, Monoid, Mapping):
         implementation of mconcat so it doesn't create a bunch of
         orphanded dictionaries to be garbage collected.
         """
-        return cls(chain_dict_update(*ds))
+        return cls.wrap(chain_dict_update(*ds))
+
+    def merge_with(self, other, combine=None):
+        """Joins two mappings like mappend, except that values for a key in
+        both are combined rather than the last one winning.
+
+        >>> counts = Map({'a': 1, 'b': 2})
+        >>> counts.merge_with(Map({'b': 3, 'c': 4}))
+        ... Map({'a': 1, 'b': 5, 'c': 4})
+
+        See ``Map.mconcat_with`` for how values are combined.
+        """
+        return Map.mconcat_with(self, other, combine=combine)
+
+    @classmethod
+    def mconcat_with(cls, *ds, **kwds):
+        """Merges any number of mappings in a single pass, combining all the
+        values found for a key at once, like Haskell's Data.Map.unionsWith.
+
+        >>> shards = [Map({'a': 1}), Map({'a': 2, 'b': 1}), Map({'a': 3})]
+        >>> Map.mconcat_with(*shards)
+        ... Map({'a': 6, 'b': 1})
+
+        The ``combine`` keyword picks how values are combined:
+
+        - by default they're monoids, and every value for a key is joined
+          with one call to pynads.funcs.mconcat -- so numbers are summed,
+          lists and Lists concatenated, Maps merged and so on
+        - a pynads.abc.Monoid class, whose mconcat is called the same way
+        - a binary function, which is folded over the values left to right
+
+        Keys only in one mapping keep their value as it is.
+        """
+        combine = kwds.pop('combine', None)
+        if kwds:
+            raise TypeError("mconcat_with got unexpected keyword arguments: "
+                            "{!s}".format(', '.join(sorted(kwds))))
+        groups = {}
+        for d in ds:
+            for k, v in d.items():
+                try:
+                    groups[k].append(v)
+                except KeyError:
+                    groups[k] = [v]
+
+        if combine is None:
+            join = lambda vs: monoid.mconcat(*vs)
+        elif isinstance(combine, type) and issubclass(combine, Monoid):
+            join = lambda vs: combine.mconcat(*vs)
+        else:
+            join = lambda vs: reduce(combine, vs)
+        return cls.wrap({k: vs[0] if len(vs) == 1 else join(vs)
+                         for k, vs in groups.items()})
 
     # from collections.Mapping
     def __len__(self):
@@ -131,4 +260,66 @@ class Map(Applicative, Monoid, Mapping):
         return NotImplemented
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        return _mapping_ne(self, other)
+
+
+_missing = object()
+
+
+def _items_of(mapping):
+    # read a plain Map's dict directly rather than through Mapping methods
+    return mapping.v if type(mapping) is Map else mapping
+
+
+def _align(this, other, how, presorted):
+    """Yields ``(key, this value, other value)`` for every key kept by the
+    join, with _missing in place of a missing value.
+    """
+    if how not in ('inner', 'left', 'outer'):
+        raise ValueError("how must be 'inner', 'left' or 'outer', "
+                         "not {!r}".format(how))
+    this, other = _items_of(this), _items_of(other)
+    if presorted:
+        return _align_sorted(this, other, how)
+    return _align_hashed(this, other, how)
+
+
+def _align_hashed(this, other, how):
+    if how == 'inner' and len(other) < len(this):
+        # walk whichever side is smaller
+        for k, b in other.items():
+            a = this.get(k, _missing)
+            if a is not _missing:
+                yield k, a, b
+        return
+    for k, a in this.items():
+        b = other.get(k, _missing)
+        if b is not _missing or how != 'inner':
+            yield k, a, b
+    if how == 'outer':
+        for k, b in other.items():
+            if k not in this:
+                yield k, _missing, b
+
+
+def _align_sorted(this, other, how):
+    xs, ys = iter(this.items()), iter(other.items())
+    x, y = next(xs, None), next(ys, None)
+    while x is not None and y is not None:
+        if x[0] < y[0]:
+            if how != 'inner':
+                yield x[0], x[1], _missing
+            x = next(xs, None)
+        elif y[0] < x[0]:
+            if how == 'outer':
+                yield y[0], _missing, y[1]
+            y = next(ys, None)
+        else:
+            yield x[0], x[1], y[1]
+            x, y = next(xs, None), next(ys, None)
+    while x is not None and how != 'inner':
+        yield x[0], x[1], _missing
+        x = next(xs, None)
+    while y is not None and how == 'outer':
+        yield y[0], _missing, y[1]
+        y = next(ys, None)
@@ -1,4 +1,5 @@
 from .either import Left, Right
+from .list import List
 from ..abc import Monad, Container, Option, Full, Empty
 from ..utils.compat import wraps
 from ..utils.decorators import method_optional_kwargs
@@ -149,6 +150,18 @@ class Maybe(Monad, Option):
             return cls(func(*args, **kwargs), checker=checker)
         return wrapper
 
+    @staticmethod
+    def _sequence(maybes):
+        """Fast path for pynads.funcs.sequence and mapM: collects the
+        values in a single pass and stops at the first Nothing.
+        """
+        values = List.builder()
+        for maybe in maybes:
+            if not maybe:
+                return maybe
+            values.append(maybe.v)
+        return Just(values.persistent())
+
     def to_either(self, error):
         return Right(self.v) if isinstance(self, Just) else Left(error)
 
@@ -0,0 +1,402 @@
+"""Batch counterparts of Maybe and Either that hold many optional values at
+once as columns rather than as one Just, Nothing, Right or Left per value.
+The columns are NumPy arrays when NumPy is installed, which lets vectorized
+functions run over every value in a single call, and lists otherwise.
+"""
+
+from numbers import Number
+from ..abc import Monad
+from .arraylist import ArrayList
+from .either import Left, Right
+from .maybe import Just, Nothing
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+__all__ = ('MaybeArray', 'EitherArray')
+
+
+def _column(values):
+    """Stores values as a numeric NumPy array when possible, an object
+    array when they're something else, or a list without NumPy.
+    """
+    if np is None:
+        return list(values)
+    if isinstance(values, np.ndarray):
+        return values
+    values = list(values)
+    column = np.asarray(values) if values else np.asarray(values, float)
+    if column.dtype.kind not in 'biufc' or column.ndim != 1:
+        return _objects(values)
+    return column
+
+
+def _objects(values):
+    """Stores arbitrary values, such as errors, as an object array, or a
+    list without NumPy. Unlike np.asarray, tuples and lists stay values.
+    """
+    if np is None:
+        return list(values)
+    if isinstance(values, np.ndarray):
+        return values.astype(object, copy=False)
+    values = list(values)
+    column = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        column[i] = v
+    return column
+
+
+def _fill(x, size):
+    """A single value standing in for a whole column in _where. Only
+    values np.where would take apart, such as tuples, are copied out.
+    """
+    if np is None:
+        return [x] * size
+    if x is None or isinstance(x, (np.ndarray, Number, str, bytes)):
+        return x
+    column = np.empty(size, dtype=object)
+    column.fill(x)
+    return column
+
+
+def _where(mask, this, that):
+    """Picks from the column this where mask is set and from the column
+    that elsewhere. Either may be a value from _fill instead.
+    """
+    if np is not None:
+        return np.where(mask, this, that)
+    return [x if ok else y for ok, x, y in zip(mask, this, that)]
+
+
+def _both(this, that):
+    if np is None:
+        return [a and b for a, b in zip(this, that)]
+    return this & that
+
+
+def _replaced(column, mask, new):
+    """Copies an object column with new values, in order, at the positions
+    set in mask.
+    """
+    if np is None:
+        new = iter(new)
+        return [next(new) if ok else x for x, ok in zip(column, mask)]
+    column = column.copy()
+    column[mask] = _objects(new)
+    return column
+
+
+def _mask(flags):
+    if np is None:
+        return [bool(f) for f in flags]
+    return np.asarray(list(flags) if not isinstance(flags, np.ndarray)
+                      else flags, dtype=bool)
+
+
+def _valid(column, mask):
+    """The values at valid positions, as a column. An object column is
+    narrowed to a numeric one when only numbers remain.
+    """
+    if np is None:
+        return [v for v, ok in zip(column, mask) if ok]
+    valid = column[mask]
+    return _column(valid.tolist()) if valid.dtype == object else valid
+
+
+def _scatter(results, mask, fill=None):
+    """Spreads results back over the valid positions of a full column,
+    with fill everywhere else.
+    """
+    if np is None:
+        it = iter(results)
+        return [next(it) if ok else fill for ok in mask]
+    results = _column(results)
+    column = np.zeros(len(mask), dtype=results.dtype)
+    if results.dtype == object:
+        column[:] = fill
+    column[mask] = results
+    return column
+
+
+def _pylist(column):
+    """The values of a column as plain Python objects.
+    """
+    return column.tolist() if np is not None else column
+
+
+def _item(column, idx):
+    v = column[idx]
+    return v.item() if np is not None and isinstance(v, np.generic) else v
+
+
+def _vectorized(func):
+    return np is not None and ArrayList._is_vectorized(func)
+
+
+class _OptionArray(Monad):
+    """Shared implementation of MaybeArray and EitherArray: a column of
+    values and a column of flags marking which values are valid.
+    """
+    __slots__ = ('mask',)
+
+    def __len__(self):
+        return len(self.mask)
+
+    @property
+    def values(self):
+        """Every valid value, as a column.
+        """
+        return _valid(self._v, self.mask)
+
+    def _flags(self):
+        return (bool(ok) for ok in self.mask)
+
+    def get_or(self, default):
+        """Returns a column of the values, with default in place of every
+        invalid one.
+        """
+        return _where(self.mask, self._v, _fill(default, len(self)))
+
+    def _computed(self, func):
+        """Calls func on every valid value, or once with all of them when
+        it's vectorized, and returns a full column of the results.
+        """
+        valid = self.values
+        if _vectorized(func):
+            results = func(valid)
+        else:
+            results = [func(v) for v in _pylist(valid)]
+        return _scatter(results, self.mask)
+
+    def _kept(self, predicate):
+        """Returns the mask narrowed to values passing predicate.
+        """
+        valid = self.values
+        if _vectorized(predicate):
+            passed = _mask(predicate(valid))
+        else:
+            passed = _mask(predicate(v) for v in _pylist(valid))
+        return _scatter(passed, self.mask, False)
+
+
+class MaybeArray(_OptionArray):
+    """Many Maybe values held as a column of values and a validity mask.
+
+    >>> xs = MaybeArray([1, None, 3])
+    >>> xs
+    ... MaybeArray([Just 1, Nothing, Just 3])
+    >>> xs.fmap(lambda x: x * 10).get_or(0)
+    ... [10, 0, 30]
+
+    Like Maybe, values are Just unless they fail the checker, ``v is not
+    None`` by default, and an explicit mask may be given instead. fmap,
+    apply, bind and filter treat every value as Maybe would, but without
+    creating a Just or Nothing per value; only valid values are passed to
+    functions. With NumPy, functions recognized by ``ArrayList.vectorized``
+    are called once with a column of every valid value: fmap with values,
+    filter with a column of bools, and bind with a MaybeArray as long as the
+    column it was given.
+
+    ``get_or`` returns the column of values with a default filled in and
+    ``to_either`` converts to an EitherArray with an error in place of each
+    Nothing. Iterating or indexing a MaybeArray produces Maybe values.
+    """
+    __slots__ = ()
+
+    def __init__(self, values=(), mask=None, checker=lambda v: v is not None):
+        values = _column(values)
+        if mask is None:
+            mask = (checker(v) for v in _pylist(values))
+        super(MaybeArray, self).__init__(values)
+        self.mask = _mask(mask)
+
+    @classmethod
+    def _from_columns(cls, values, mask):
+        inst = cls.__new__(cls)
+        inst._v = values
+        inst.mask = mask
+        return inst
+
+    @classmethod
+    def from_maybes(cls, maybes):
+        maybes = list(maybes)
+        return cls([m.v if m else None for m in maybes],
+                   mask=[bool(m) for m in maybes])
+
+    @classmethod
+    def unit(cls, v):
+        return cls([v], mask=[True])
+
+    def __repr__(self):
+        return "MaybeArray({!r})".format(list(self))
+
+    def __iter__(self):
+        for v, ok in zip(_pylist(self._v), self._flags()):
+            yield Just(v) if ok else Nothing
+
+    def __getitem__(self, idx):
+        return Just(_item(self._v, idx)) if self.mask[idx] else Nothing
+
+    def __eq__(self, other):
+        if isinstance(other, MaybeArray):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def fmap(self, func):
+        return MaybeArray._from_columns(self._computed(func), self.mask)
+
+    def apply(self, other):
+        """Pairs up the functions in this MaybeArray with the values at the
+        same positions of another; a Nothing on either side is Nothing.
+        """
+        mask = _both(self.mask, other.mask)
+        values = [f(x) for f, x in zip(_pylist(_valid(self._v, mask)),
+                                       _pylist(_valid(other._v, mask)))]
+        return MaybeArray._from_columns(_scatter(values, mask), mask)
+
+    def bind(self, bindee):
+        valid = self.values
+        if _vectorized(bindee):
+            bound = bindee(valid)
+            values, flags = bound._v, bound.mask
+        else:
+            bound = [bindee(v) for v in _pylist(valid)]
+            values = [m.v if m else None for m in bound]
+            flags = [bool(m) for m in bound]
+        mask = _scatter(_mask(flags), self.mask, False)
+        values = _scatter(_valid(_column(values), _mask(flags)), mask)
+        return MaybeArray._from_columns(values, mask)
+
+    def filter(self, predicate):
+        return MaybeArray._from_columns(self._v, self._kept(predicate))
+
+    def to_either(self, error):
+        """Converts to an EitherArray with error as the error of every
+        Nothing.
+        """
+        n = len(self)
+        return EitherArray._from_columns(self._v, self.mask,
+                                         _where(self.mask, _fill(None, n),
+                                                _fill(error, n)))
+
+
+class EitherArray(_OptionArray):
+    """Many Either values held as a column of values, a column of errors
+    and a mask marking which are Right.
+
+    >>> xs = EitherArray([1, 2, 3])
+    >>> xs.filter(lambda x: x % 2)
+    ... EitherArray([Right 1, Left 'lambda false with input 2', Right 3])
+
+    EitherArray behaves the same as MaybeArray except that each invalid
+    position keeps an error, as Left does: filter records why a value
+    failed and bind records the Left its bindee returned. A vectorized
+    bindee returns an EitherArray. ``to_maybe`` drops the errors.
+    """
+    __slots__ = ('errors',)
+
+    def __init__(self, values=(), mask=None, errors=None):
+        values = _column(values)
+        super(EitherArray, self).__init__(values)
+        self.mask = _mask([True] * len(values) if mask is None else mask)
+        self.errors = _objects([None] * len(values) if errors is None
+                               else errors)
+
+    @classmethod
+    def _from_columns(cls, values, mask, errors):
+        inst = cls.__new__(cls)
+        inst._v = values
+        inst.mask = mask
+        inst.errors = errors
+        return inst
+
+    @classmethod
+    def from_eithers(cls, eithers):
+        eithers = list(eithers)
+        return cls([e.v if e else None for e in eithers],
+                   mask=[bool(e) for e in eithers],
+                   errors=[None if e else e.v for e in eithers])
+
+    @classmethod
+    def unit(cls, v):
+        return cls([v])
+
+    def __repr__(self):
+        return "EitherArray({!r})".format(list(self))
+
+    def __iter__(self):
+        for v, e, ok in zip(_pylist(self._v), _pylist(self.errors),
+                            self._flags()):
+            yield Right(v) if ok else Left(e)
+
+    def __getitem__(self, idx):
+        if self.mask[idx]:
+            return Right(_item(self._v, idx))
+        return Left(self.errors[idx])
+
+    def __eq__(self, other):
+        if isinstance(other, EitherArray):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def fmap(self, func):
+        return EitherArray._from_columns(self._computed(func), self.mask,
+                                         self.errors)
+
+    def apply(self, other):
+        """Pairs up the functions in this EitherArray with the values at the
+        same positions of another. Errors from this side come first.
+        """
+        mask = _both(self.mask, other.mask)
+        errors = _where(mask, _fill(None, len(mask)),
+                        _where(self.mask, other.errors, self.errors))
+        values = [f(x) for f, x in zip(_pylist(_valid(self._v, mask)),
+                                       _pylist(_valid(other._v, mask)))]
+        return EitherArray._from_columns(_scatter(values, mask), mask, errors)
+
+    def bind(self, bindee):
+        valid = self.values
+        if _vectorized(bindee):
+            bound = bindee(valid)
+            values, flags, errors = bound._v, bound.mask, bound.errors
+        else:
+            bound = [bindee(v) for v in _pylist(valid)]
+            values = [e.v if e else None for e in bound]
+            errors = [None if e else e.v for e in bound]
+            flags = [bool(e) for e in bound]
+        flags = _mask(flags)
+        mask = _scatter(flags, self.mask, False)
+        values = _scatter(_valid(_column(values), flags), mask)
+        errors = _replaced(self.errors, self.mask, errors)
+        return EitherArray._from_columns(values, mask, errors)
+
+    def filter(self, predicate):
+        mask = self._kept(predicate)
+        name = getattr(predicate, '__name__', repr(predicate))
+        failed = _where(mask, _fill(False, len(mask)), self.mask)
+        errors = _replaced(self.errors, failed,
+                           ["{!s} false with input {!r}".format(name, v)
+                            for v in _pylist(_valid(self._v, failed))])
+        return EitherArray._from_columns(self._v, mask, errors)
+
+    def to_maybe(self):
+        return MaybeArray._from_columns(self._v, self.mask)
@@ -0,0 +1,137 @@
+from collections import Mapping
+from ..abc import Applicative, Monoid
+from ..utils.hamt import EMPTY
+from ..utils.internal import Instance, _items, _mapping_eq, _mapping_ne
+from .map import Map
+
+
+__all__ = ('PMap',)
+
+
+class PMap(Applicative, Monoid, Mapping):
+    """A persistent take on pynads.Map, backed by a hash array mapped trie
+    rather than a dict.
+
+    PMap behaves the same as Map as a Functor, Applicative and Monoid, but
+    never copies itself wholesale. Adding or removing a single key with
+    ``assoc`` and ``dissoc`` is O(log n) and the result shares everything
+    but the path to that key with the original:
+
+    >>> config = PMap({'debug': False, 'workers': 4})
+    >>> config.assoc('debug', True)
+    ... PMap({'debug': True, 'workers': 4})
+    >>> config.dissoc('workers')
+    ... PMap({'debug': False})
+
+    The same goes for ``mappend``: merging k keys into a PMap of n keys is
+    O(k log n) whichever side is larger, which suits layering a handful of
+    overrides over a large, long lived base mapping. As with Map, if a key
+    appears in both, the value on the right wins.
+
+    ``to_map`` converts to a plain Map and ``PMap(some_map)`` converts back.
+    """
+    __slots__ = ()
+    mempty = Instance()
+
+    def __init__(self, v=None, **kwds):
+        trie = v._v if isinstance(v, PMap) else EMPTY.update(_items(v or ()))
+        super(PMap, self).__init__(trie.update(kwds.items()))
+
+    @classmethod
+    def _from_trie(cls, trie):
+        inst = cls.__new__(cls)
+        inst._v = trie
+        return inst
+
+    def __repr__(self):
+        return "PMap({!r})".format(dict(self._v.items()))
+
+    @classmethod
+    def unit(cls, v):
+        """Accepts a tuple with a key-value pair in it and returns a mapping
+        with that single value.
+        """
+        return cls([v])
+
+    def to_map(self):
+        return Map.wrap(dict(self._v.items()))
+
+    def assoc(self, key, value):
+        """Returns a PMap with key mapped to value.
+        """
+        return PMap._from_trie(self._v.assoc(key, value))
+
+    def dissoc(self, key):
+        """Returns a PMap without key. Missing keys are ignored.
+        """
+        return PMap._from_trie(self._v.dissoc(key))
+
+    def fmap(self, func):
+        """Maps a function over the values, reusing the layout of the trie
+        so no key is hashed again.
+        """
+        return PMap._from_trie(self._v.fmap(func))
+
+    def apply(self, other):
+        """Maps functions in this PMap to the values with the same key in
+        another mapping, dropping keys that don't appear in both.
+        """
+        small, large = (self, other) if len(self) <= len(other) else \
+            (other, self)
+        return PMap._from_trie(EMPTY.update((k, self[k](other[k]))
+                                            for k in small if k in large))
+
+    @classmethod
+    def fromkeys(cls, keys, value=None):
+        return cls._from_trie(EMPTY.update((k, value) for k in keys))
+
+    def mappend(self, other):
+        """Merges other into this PMap, starting from whichever is larger
+        so the work done is proportional to the smaller one.
+        """
+        if isinstance(other, PMap) and len(other) > len(self):
+            return PMap._from_trie(other._v.update(self._v.items(),
+                                                   replace=False))
+        return PMap._from_trie(self._v.update(_items(other)))
+
+    @classmethod
+    def mconcat(cls, *ms):
+        """Merges every mapping in turn. Since each merge starts from the
+        larger side, a large PMap anywhere in ms is never copied.
+        """
+        result = cls.mempty
+        for m in ms:
+            result = result.mappend(m)
+        return result
+
+    # from collections.Mapping
+    def __len__(self):
+        return len(self._v)
+
+    def __contains__(self, x):
+        return x in self._v
+
+    def __iter__(self):
+        return iter(self._v)
+
+    _missing = object()
+
+    def __getitem__(self, k):
+        v = self._v.get(k, PMap._missing)
+        if v is PMap._missing:
+            raise KeyError(k)
+        return v
+
+    def get(self, k, default=None):
+        return self._v.get(k, default)
+
+    def items(self):
+        return self._v.items()
+
+    def __eq__(self, other):
+        return _mapping_eq(self, other, (PMap, Map))
+
+    def __ne__(self, other):
+        return _mapping_ne(self, other)
+
+    __hash__ = None
@@ -4,6 +4,7 @@
 from ..abc import Monad, Container
 from ..utils import iscallable, _get_names
 from ..funcs import const, compose
+from .list import List
 
 
 class Reader(Monad):
@@ -126,6 +127,20 @@ class Reader(Monad):
         """
         return cls(const(v))
 
+    @staticmethod
+    def _sequence(readers):
+        """Fast path for pynads.funcs.sequence and mapM: a single Reader
+        running every Reader against the environment in one loop.
+        """
+        readers = tuple(readers)
+
+        def sequenced(env):
+            return List.builder(r(env) for r in readers).persistent()
+
+        names = _get_names(*readers)
+        sequenced.__doc__ = "Sequence of {!s}".format(', '.join(names))
+        return Reader(sequenced)
+
     def fmap(self, func):
         r"""Compare to Haskell's impelementation of fmap for Reader and (->)
 
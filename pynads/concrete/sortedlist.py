@@ -0,0 +1,291 @@
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import chain
+from ..utils.compat import filter
+from ..utils.internal import _iter_but_not_str_or_map, Instance
+from ..utils.vector import Vector
+from .list import List
+
+
+__all__ = ('SortedList',)
+
+
+class SortedList(List):
+    """A pynads.List that keeps its values in sorted order, optionally by a
+    key function, as ``sorted`` would.
+
+    >>> SortedList([3, 1, 2])
+    ... SortedList([1, 2, 3])
+    >>> SortedList(['bb', 'a', 'ccc'], key=len)
+    ... SortedList(['a', 'bb', 'ccc'])
+
+    Because the values are ordered, lookups are binary searches rather than
+    scans or hashes: ``in``, ``index``, ``count`` and ``irange``, which
+    returns every value with a key inside a range, are all O(log n) (plus
+    the size of the answer).
+
+    As a Monoid, ``mappend`` and ``mconcat`` merge sorted runs together in
+    linear time. The set operations -- union, intersect, difference and
+    symmetric_difference, as well as distinct -- are also done as linear
+    merges, so unlike List they never build sets. They only require values
+    (or their keys) to be orderable, not hashable. Two values with equal
+    keys are considered the same value by these operations. Passing them a
+    different ``key`` than the SortedList's own hands them to List instead.
+
+    Operations that can't keep the values sorted return a plain List:
+    fmap, apply and bind, reversing, and appending or consing a value that
+    doesn't belong at that end.
+    """
+    __slots__ = ('key',)
+    mempty = Instance()
+
+    def __init__(self, values=(), key=None):
+        # skip List.__init__, which only knows how to adopt a tuple
+        values = tuple(sorted(values, key=key))
+        super(List, self).__init__(Vector.from_tuple(values))
+        self.key = key
+
+    def __repr__(self):
+        if self.key is None:
+            return "SortedList({!r})".format(list(self))
+        return "SortedList({!r}, key={!r})".format(list(self), self.key)
+
+    def _wrap(self, vector):
+        inst = SortedList.__new__(SortedList)
+        inst._v = vector
+        inst.key = self.key
+        return inst
+
+    def _key(self, x):
+        return x if self.key is None else self.key(x)
+
+    def _keys(self):
+        return _KeyView(self._v, self.key) if self.key else self._v
+
+    def _sorted(self, other):
+        """Returns the values of other sorted by this SortedList's key.
+        """
+        if isinstance(other, SortedList) and other.key is self.key:
+            return other
+        return sorted(other, key=self.key)
+
+    @classmethod
+    def unit(cls, v):
+        return cls((v,))
+
+    @classmethod
+    def from_tuple(cls, vs, key=None):
+        """Creates a SortedList from a tuple. Unlike List.from_tuple the
+        tuple isn't adopted, since its values have to be sorted.
+        """
+        if not isinstance(vs, tuple):
+            raise TypeError("SortedList.from_tuple expects a tuple, not {!s}"
+                            "".format(type(vs)))
+        return cls.from_iterable(vs, key)
+
+    @classmethod
+    def from_iterable(cls, vs, key=None):
+        """Creates a SortedList from any iterable, sharing the values of a
+        SortedList already sorted by the same key.
+        """
+        if isinstance(vs, SortedList) and vs.key is key:
+            return vs
+        return cls(vs, key)
+
+    # lookups by bisection
+    def __contains__(self, x):
+        return self._find(x) is not None
+
+    def _find(self, x):
+        k = self._key(x)
+        keys = self._keys()
+        i = bisect_left(keys, k)
+        while i < len(keys) and keys[i] == k:
+            v = self._v[i]
+            if x is v or x == v:
+                return i
+            i += 1
+        return None
+
+    def index(self, x):
+        i = self._find(x)
+        if i is None:
+            raise ValueError("{!r} is not in SortedList".format(x))
+        return i
+
+    def count(self, x):
+        k = self._key(x)
+        keys = self._keys()
+        lo, hi = bisect_left(keys, k), bisect_right(keys, k)
+        return sum(1 for i in range(lo, hi) if self._v[i] == x)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Returns a SortedList view of every value whose key lies between
+        minimum and maximum. Either bound may be None to leave that side
+        open and ``inclusive`` controls whether each bound is included.
+        """
+        keys = self._keys()
+        if minimum is None:
+            lo = 0
+        else:
+            lo = (bisect_left if inclusive[0] else bisect_right)(keys, minimum)
+        if maximum is None:
+            hi = len(keys)
+        else:
+            hi = (bisect_right if inclusive[1] else bisect_left)(keys, maximum)
+        return self._wrap(self._v.slice(lo, max(lo, hi), share=True))
+
+    def add(self, x):
+        """Returns a new SortedList with x inserted in order in O(log n).
+        """
+        i = bisect_right(self._keys(), self._key(x))
+        single = Vector.from_tuple((x,))
+        return self._wrap(self._v.slice(0, i).concat(single)
+                          .concat(self._v.slice(i, len(self))))
+
+    def cons(self, x):
+        if self and self._key(x) > self._key(self[0]):
+            return List.cons(self, x)
+        return self._wrap(self._v.cons(x))
+
+    def append(self, x):
+        if self and self._key(x) < self._key(self[-1]):
+            return List.append(self, x)
+        return self._wrap(self._v.append(x))
+
+    def filter(self, predicate):
+        return self._wrap(Vector.from_tuple(tuple(filter(predicate, self))))
+
+    # monoid, by merging sorted runs
+    def mappend(self, other):
+        if not _iter_but_not_str_or_map(other):
+            raise TypeError("Can only append non-str/Mapping iterable to a "
+                            "{!s} instance, not {!s}"
+                            "".format(type(self), type(other)))
+        if not self and isinstance(other, SortedList):
+            return other
+        merged = merge(self, self._sorted(other), key=self.key)
+        return self._wrap(Vector.from_tuple(tuple(merged)))
+
+    extend = mappend
+
+    @classmethod
+    def mconcat(cls, *monoids):
+        """Merges every monoid in a single k-way pass. Uses the key of the
+        first non-empty SortedList given.
+        """
+        first = next((m for m in monoids
+                      if isinstance(m, SortedList) and m), None)
+        if first is None:
+            return cls(chain.from_iterable(monoids))
+        runs = [first._sorted(m) for m in monoids]
+        return first._wrap(Vector.from_tuple(tuple(merge(*runs,
+                                                          key=first.key))))
+
+    # set like operations, as linear merges
+    # a key function other than the SortedList's own doesn't follow its
+    # order, so those are left to List, keeping the result sorted when it's
+    # a subsequence of this SortedList
+    def _merged(self, other, left, both, right):
+        values = _merge_distinct(self, self._sorted(other), self._key,
+                                 left, both, right)
+        return self._wrap(Vector.from_tuple(tuple(values)))
+
+    def _other_key(self, key):
+        return key is not None and key is not self.key
+
+    def union(self, other, key=None):
+        if self._other_key(key):
+            return List.union(self, other, key)
+        return self._merged(other, True, True, True)
+
+    def intersect(self, other, key=None):
+        if self._other_key(key):
+            return self._wrap(List.intersect(self, other, key)._v)
+        return self._merged(other, False, True, False)
+
+    def difference(self, other, key=None):
+        if self._other_key(key):
+            return self._wrap(List.difference(self, other, key)._v)
+        return self._merged(other, True, False, False)
+
+    def symmetric_difference(self, other, key=None):
+        if self._other_key(key):
+            return List.symmetric_difference(self, other, key)
+        return self._merged(other, True, False, True)
+
+    def distinct(self, key=None):
+        if self._other_key(key):
+            return self._wrap(List.distinct(self, key)._v)
+        return self._merged((), True, False, False)
+
+    # slicing keeps order, reversing doesn't
+    def __getitem__(self, idx):
+        if isinstance(idx, slice) and (idx.step is None or idx.step > 0):
+            return self._wrap(self._v.slice(*idx.indices(len(self))))
+        return List.__getitem__(self, idx)
+
+    def view(self, start=None, stop=None, step=None):
+        if step is not None and step < 0:
+            return List.view(self, start, stop, step)
+        indices = slice(start, stop, step).indices(len(self))
+        return self._wrap(self._v.slice(*indices, share=True))
+
+
+class _KeyView(object):
+    """Read only sequence of the keys of a vector's values, for bisect.
+    """
+    __slots__ = ('vector', 'key')
+
+    def __init__(self, vector, key):
+        self.vector = vector
+        self.key = key
+
+    def __len__(self):
+        return len(self.vector)
+
+    def __getitem__(self, idx):
+        return self.key(self.vector[idx])
+
+
+def _first_of_each_key(values, key):
+    it = iter(values)
+    for v in it:
+        last = key(v)
+        yield last, v
+        break
+    for v in it:
+        k = key(v)
+        if k != last:
+            last = k
+            yield k, v
+
+
+def _merge_distinct(xs, ys, key, left, both, right):
+    """Walks two sorted iterables in step, yielding the first value of each
+    distinct key that appears only on the left, in both, or only on the
+    right, according to the flags.
+    """
+    xs, ys = _first_of_each_key(xs, key), _first_of_each_key(ys, key)
+    x, y = next(xs, None), next(ys, None)
+    while x is not None and y is not None:
+        if x[0] < y[0]:
+            if left:
+                yield x[1]
+            x = next(xs, None)
+        elif y[0] < x[0]:
+            if right:
+                yield y[1]
+            y = next(ys, None)
+        else:
+            if both:
+                yield x[1]
+            x, y = next(xs, None), next(ys, None)
+    while x is not None:
+        if left:
+            yield x[1]
+        x = next(xs, None)
+    while y is not None:
+        if right:
+            yield y[1]
+        y = next(ys, None)
@@ -3,6 +3,7 @@ terms rather than relying on things scoping and global mutation.
 """
 from ..abc import Monad, Container
 from ..utils import iscallable, _get_names, wraps
+from .list import List
 
 
 class State(Monad):
@@ -112,6 +113,22 @@ class State(Monad):
         """
         return cls(lambda s: (v, s))
 
+    @staticmethod
+    def _sequence(states):
+        """Fast path for pynads.funcs.sequence and mapM: a single State
+        threading the state through every transition in one loop.
+        """
+        states = tuple(states)
+
+        def sequenced(state):
+            values = List.builder()
+            for runner in states:
+                value, state = runner(state)
+                values.append(value)
+            return values.persistent(), state
+
+        return State(sequenced)
+
     def fmap(self, func):
         r"""Mapping a function over a stateful computation is similar, in
         a fashion to function composition. Rather than compose the stateful
@@ -0,0 +1,192 @@
+from array import array
+from ..utils.compat import filter
+from ..utils.vector import Vector
+from .list import List
+
+
+__all__ = ('TypedList',)
+
+
+# the Python type array.array hands back for each typecode
+_typecode_types = dict.fromkeys('bBhHiIlLqQ', int)
+_typecode_types.update({'f': float, 'd': float, 'u': str})
+
+
+class TypedList(List):
+    """A pynads.List that stores homogeneous ints, floats or bytes in
+    ``array.array`` buffers rather than as a tuple of boxed Python objects,
+    which typically takes a quarter of the memory or less. Unlike
+    pynads.ArrayList, it doesn't need NumPy.
+
+    The typecode is the same as the one ``array.array`` accepts:
+
+    >>> xs = TypedList('d', [1.0, 2.0, 3.0])
+    >>> xs = List.typed('d', [1.0, 2.0, 3.0])  # same thing
+    >>> ys = TypedList('B', b'bytes')
+
+    TypedList is a full List: it's a Monad, Monoid and Sequence, and slicing,
+    set operations and mappend with another TypedList of the same typecode
+    keep the result typed. When an operation produces values the array can't
+    hold -- fmap to strings, appending a float to ints, mappend with a plain
+    List -- the result falls back to a plain List.
+
+    ``to_array`` returns a copy of the contents as a contiguous array, which
+    supports the buffer protocol (``memoryview``, ``bytes``, file writes).
+    On Python 3.12+ TypedList supports the buffer protocol itself.
+    """
+    __slots__ = ('typecode',)
+    #: an empty TypedList of any typecode is an identity for mappend, but
+    #: without a typecode to choose mempty is a plain List, as with unit
+    mempty = List()
+
+    def __init__(self, typecode, values=()):
+        # skip List.__init__, which only knows how to adopt a tuple
+        super(List, self).__init__(Vector.from_tuple(array(typecode, values)))
+        self.typecode = typecode
+
+    def __repr__(self):
+        return "TypedList({!r}, {!r})".format(self.typecode, list(self))
+
+    def _wrap(self, vector):
+        inst = TypedList.__new__(TypedList)
+        inst._v = vector
+        inst.typecode = self.typecode
+        return inst
+
+    def _single(self, x):
+        """Creates a one value vector for x, or None if x doesn't fit.
+        """
+        if type(x) is not _typecode_types[self.typecode]:
+            return None
+        try:
+            return Vector.from_tuple(array(self.typecode, [x]))
+        except OverflowError:
+            return None
+
+    def _retyped(self, values):
+        """Builds a TypedList of this typecode from values if they all fit,
+        otherwise falls back to a plain List.
+        """
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        kind = _typecode_types[self.typecode]
+        if all(type(v) is kind for v in values):
+            try:
+                return self._wrap(Vector.from_tuple(array(self.typecode,
+                                                          values)))
+            except (OverflowError, TypeError):
+                pass
+        return List.from_iterable(values)
+
+    @classmethod
+    def from_tuple(cls, vs, typecode=None):
+        """Creates a TypedList from a tuple, copying it into an array. The
+        typecode is required unless vs is already a TypedList.
+        """
+        if not isinstance(vs, tuple):
+            raise TypeError("TypedList.from_tuple expects a tuple, not {!s}"
+                            "".format(type(vs)))
+        return cls.from_iterable(vs, typecode)
+
+    @classmethod
+    def from_iterable(cls, vs, typecode=None):
+        """Creates a TypedList from any iterable. Another TypedList of the
+        same typecode has its storage shared; anything else is copied into
+        an array, which requires a typecode.
+        """
+        if isinstance(vs, TypedList):
+            if typecode is None or typecode == vs.typecode:
+                return vs
+        elif typecode is None:
+            raise TypeError("TypedList.from_iterable requires a typecode")
+        return cls(typecode, vs)
+
+    @classmethod
+    def unit(cls, v):
+        """The type of an arbitrary value is unknown, so unit produces a
+        plain List.
+        """
+        return List.unit(v)
+
+    def to_array(self):
+        """Copies the contents into a single contiguous ``array.array``.
+        """
+        result = array(self.typecode)
+        for leaf in self._v.leaves():
+            r = leaf.indices
+            stop = r.stop if r.stop >= 0 else None
+            result.extend(leaf.items[r.start:stop:r.step])
+        return result
+
+    def __buffer__(self, flags):
+        return memoryview(self.to_array())
+
+    def tobytes(self):
+        return self.to_array().tobytes()
+
+    def fmap(self, func):
+        return self._retyped([func(v) for v in self])
+
+    def filter(self, predicate):
+        return self._retyped(filter(predicate, self))
+
+    def mappend(self, other):
+        if isinstance(other, TypedList) and other.typecode == self.typecode:
+            return self._wrap(self._v.concat(other._v))
+        elif not self:
+            return other if isinstance(other, List) else \
+                List.from_iterable(other)
+        elif isinstance(other, List) and not other:
+            return self
+        return List.mappend(self, other)
+
+    extend = mappend
+
+    @classmethod
+    def mconcat(cls, *monoids):
+        if not monoids:
+            return cls.mempty
+        first, rest = monoids[0], monoids[1:]
+        if not isinstance(first, List):
+            first = List.from_iterable(first)
+        for monoid in rest:
+            first = first.mappend(monoid)
+        return first
+
+    def cons(self, x):
+        head = self._single(x)
+        if head is None:
+            return List.cons(self, x)
+        return self._wrap(head.concat(self._v))
+
+    def append(self, x):
+        last = self._single(x)
+        if last is None:
+            return List.append(self, x)
+        return self._wrap(self._v.concat(last))
+
+    def distinct(self, key=None):
+        return self._retyped(List.distinct(self, key))
+
+    def union(self, other, key=None):
+        return self._retyped(List.union(self, other, key))
+
+    def intersect(self, other, key=None):
+        return self._retyped(List.intersect(self, other, key))
+
+    def difference(self, other, key=None):
+        return self._retyped(List.difference(self, other, key))
+
+    def symmetric_difference(self, other, key=None):
+        return self._retyped(List.symmetric_difference(self, other, key))
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self._wrap(self._v.slice(*idx.indices(len(self))))
+        return self._v[idx]
+
+    def __reversed__(self):
+        return self._wrap(self._v.reverse())
+
+    def view(self, start=None, stop=None, step=None):
+        indices = slice(start, stop, step).indices(len(self))
+        return self._wrap(self._v.slice(*indices, share=True))
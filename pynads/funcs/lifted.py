@@ -1,6 +1,8 @@
 from functools import reduce
+from itertools import chain
 from operator import mul, rshift
 from ..concrete.list import List
+from ..utils.compat import map
 from ..utils.decorators import annotate
 from .monoid import mappend
 from .pure import identity
@@ -63,7 +65,12 @@ def cons(x, xs):
 
         cons(1, List(2,3)) # List(1,2,3)
         cons(1, cons(2, cons(3, List()))) # List(1,2,3)
+
+    Anything providing its own cons method, such as pynads.List or
+    pynads.ConsList, is consed onto with it and keeps its type.
     """
+    if hasattr(xs, 'cons'):
+        return xs.cons(x)
     return mappend(List(x), xs)
 
 
@@ -83,6 +90,29 @@ def mcons(p, q):
                        p.unit(cons(x, xs))))
 
 
+def _sequence(monads):
+    """Implementation of sequence over an iterator of monads.
+
+    Monads may define a ``_sequence`` static or class method accepting an
+    iterable of monads of the same type, similar to how monoids may provide
+    their own mconcat. Maybe, Either, List, Reader and State all do, which
+    turns sequence into a single linear pass for them rather than a fold of
+    nested binds. Anything else uses the generic fold with mcons.
+    """
+    try:
+        first = next(monads)
+    except StopIteration:
+        raise TypeError("Need at least one monad to sequence")
+    fast = getattr(first, '_sequence', None)
+    if fast is not None:
+        return fast(chain([first], monads))
+
+    monads = [first] + list(monads)
+    return reduce(lambda q, p: mcons(p, q),
+                  reversed(monads),
+                  first.unit(List()))
+
+
 @annotate(type="Monad m => [m a] -> m [a]")
 def sequence(*monads):
     """Folds a list of monads into a monad containing a list of the
@@ -94,9 +124,7 @@ def sequence(*monads):
         # In: List(Just 0, Just 2, Just 3, Just 4)
         # Just List(0, 1, 2, 3, 4)
     """
-    return reduce(lambda q, p: mcons(p, q),
-                  reversed(monads),
-                  monads[0].unit(List()))
+    return _sequence(iter(monads))
 
 
 @annotate(type="Moand m => (a -> m b) -> [a] -> m [b]")
@@ -105,4 +133,4 @@ def mapM(func, *xs):
     each into a monadic context then uses sequence to convert the iterable
     of monads into a monad containing a pynads.List of values.
     """
-    return sequence(*map(func, xs))
+    return _sequence(map(func, xs))
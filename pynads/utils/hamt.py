@@ -0,0 +1,278 @@
+"""A small persistent hash array mapped trie (HAMT) used as the backing
+storage for pynads.concrete.PMap.
+
+Keys are placed in the trie by their hash, ``BITS`` bits at a time: each
+node covers one slice of the hash and stores a bitmap of which of its
+``2 ** BITS`` slots are occupied along with a tuple holding only the
+occupied slots. A slot holds either a single ``(hash, key, value)`` entry or
+the node for the next slice of the hash. Keys whose entire hashes are equal
+share a collision node that's searched linearly.
+
+Nothing in the trie is ever mutated after construction. Adding, replacing
+or removing a key copies only the nodes on the path to that key -- at most
+``ceil(64 / BITS)`` small tuples -- and shares every other node with the
+original trie, so each update is O(log n) in both time and memory.
+"""
+
+
+__all__ = ('HashTrie', 'BITS')
+
+
+#: how many bits of the hash each level of the trie consumes
+BITS = 5
+
+_MASK = (1 << BITS) - 1
+
+#: hashes are treated as unsigned integers of this many bits
+_HASH_BITS = 64
+
+
+def _hash(key):
+    return hash(key) & ((1 << _HASH_BITS) - 1)
+
+
+def _popcount(n):
+    return bin(n).count('1')
+
+
+def _matches(entry, key):
+    return entry[1] is key or entry[1] == key
+
+
+class _Bitmap(object):
+    """An interior node: ``entries`` holds the occupied slots in slot order
+    and ``bitmap`` marks which slots those are.
+    """
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries
+
+    def _replace(self, idx, entry):
+        entries = self.entries
+        return _Bitmap(self.bitmap,
+                       entries[:idx] + (entry,) + entries[idx + 1:])
+
+    def _remove(self, bit, idx):
+        if self.bitmap == bit:
+            return None
+        entries = self.entries
+        return _Bitmap(self.bitmap ^ bit, entries[:idx] + entries[idx + 1:])
+
+    def single(self):
+        """The node's only entry, if it has exactly one and it isn't a node.
+        """
+        if len(self.entries) == 1 and type(self.entries[0]) is tuple:
+            return self.entries[0]
+        return None
+
+    def get(self, h, key, shift, default):
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return default
+        entry = self.entries[_popcount(self.bitmap & (bit - 1))]
+        if type(entry) is tuple:
+            return entry[2] if _matches(entry, key) else default
+        return entry.get(h, key, shift + BITS, default)
+
+    def assoc(self, h, key, value, shift, replace):
+        """Returns the updated node and whether a new key was added.
+        """
+        bit = 1 << ((h >> shift) & _MASK)
+        idx = _popcount(self.bitmap & (bit - 1))
+        if not self.bitmap & bit:
+            entries = self.entries
+            return _Bitmap(self.bitmap | bit, entries[:idx] +
+                           ((h, key, value),) + entries[idx:]), True
+        entry = self.entries[idx]
+        if type(entry) is tuple:
+            if _matches(entry, key):
+                if not replace or entry[2] is value:
+                    return self, False
+                return self._replace(idx, (h, key, value)), False
+            child = _pair(entry, (h, key, value), shift + BITS)
+            return self._replace(idx, child), True
+        child, added = entry.assoc(h, key, value, shift + BITS, replace)
+        if child is entry:
+            return self, False
+        return self._replace(idx, child), added
+
+    def dissoc(self, h, key, shift):
+        """Returns the node without key: itself if key is missing, None if
+        nothing is left.
+        """
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self
+        idx = _popcount(self.bitmap & (bit - 1))
+        entry = self.entries[idx]
+        if type(entry) is tuple:
+            return self._remove(bit, idx) if _matches(entry, key) else self
+        child = entry.dissoc(h, key, shift + BITS)
+        if child is entry:
+            return self
+        elif child is None:
+            return self._remove(bit, idx)
+        # pull lone entries back up so removals don't leave long chains
+        return self._replace(idx, child.single() or child)
+
+    def fmap(self, func):
+        return _Bitmap(self.bitmap, tuple(
+            (e[0], e[1], func(e[2])) if type(e) is tuple else e.fmap(func)
+            for e in self.entries))
+
+    def __iter__(self):
+        for entry in self.entries:
+            if type(entry) is tuple:
+                yield entry[1], entry[2]
+            else:
+                for item in entry:
+                    yield item
+
+
+class _Collision(object):
+    """Leaf node for keys with identical hashes.
+    """
+    __slots__ = ('hash', 'entries')
+
+    def __init__(self, h, entries):
+        self.hash = h
+        self.entries = entries
+
+    def single(self):
+        return self.entries[0] if len(self.entries) == 1 else None
+
+    def _find(self, key):
+        for i, entry in enumerate(self.entries):
+            if _matches(entry, key):
+                return i
+        return None
+
+    def get(self, h, key, shift, default):
+        if h == self.hash:
+            i = self._find(key)
+            if i is not None:
+                return self.entries[i][2]
+        return default
+
+    def assoc(self, h, key, value, shift, replace):
+        if h != self.hash:
+            # a different hash that agrees so far, nest beneath a bitmap
+            nested = _Bitmap(1 << ((self.hash >> shift) & _MASK), (self,))
+            return nested.assoc(h, key, value, shift, replace)
+        i = self._find(key)
+        if i is None:
+            return _Collision(h, self.entries + ((h, key, value),)), True
+        elif not replace or self.entries[i][2] is value:
+            return self, False
+        entries = self.entries
+        return _Collision(h, entries[:i] + ((h, key, value),) +
+                          entries[i + 1:]), False
+
+    def dissoc(self, h, key, shift):
+        i = self._find(key) if h == self.hash else None
+        if i is None:
+            return self
+        entries = self.entries[:i] + self.entries[i + 1:]
+        return _Collision(h, entries) if entries else None
+
+    def fmap(self, func):
+        return _Collision(self.hash, tuple((h, k, func(v))
+                                           for h, k, v in self.entries))
+
+    def __iter__(self):
+        return ((k, v) for _, k, v in self.entries)
+
+
+def _pair(a, b, shift):
+    """Builds the smallest subtrie holding two entries with different keys.
+    """
+    if a[0] == b[0] or shift >= _HASH_BITS:
+        return _Collision(a[0], (a, b))
+    ia, ib = (a[0] >> shift) & _MASK, (b[0] >> shift) & _MASK
+    if ia == ib:
+        return _Bitmap(1 << ia, (_pair(a, b, shift + BITS),))
+    return _Bitmap((1 << ia) | (1 << ib), (a, b) if ia < ib else (b, a))
+
+
+_EMPTY_NODE = _Bitmap(0, ())
+
+
+class HashTrie(object):
+    """A persistent mapping. Supports ``len``, iteration over keys,
+    ``in`` and ``get``; ``assoc`` and ``dissoc`` return new tries that share
+    all unchanged nodes with the original.
+    """
+    __slots__ = ('root', 'size')
+
+    def __init__(self, root=_EMPTY_NODE, size=0):
+        self.root = root
+        self.size = size
+
+    @classmethod
+    def from_items(cls, items):
+        trie = EMPTY
+        for k, v in items:
+            trie = trie.assoc(k, v)
+        return trie
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        return (k for k, _ in self.root)
+
+    def items(self):
+        return iter(self.root)
+
+    def values(self):
+        return (v for _, v in self.root)
+
+    _missing = object()
+
+    def get(self, key, default=None):
+        return self.root.get(_hash(key), key, 0, default)
+
+    def __contains__(self, key):
+        missing = HashTrie._missing
+        return self.root.get(_hash(key), key, 0, missing) is not missing
+
+    def assoc(self, key, value, replace=True):
+        """Returns a trie with key mapped to value. When replace is false
+        and key is already present, its current value is kept.
+        """
+        root, added = self.root.assoc(_hash(key), key, value, 0, replace)
+        if root is self.root:
+            return self
+        return HashTrie(root, self.size + added)
+
+    def dissoc(self, key):
+        """Returns a trie without key. Missing keys are ignored.
+        """
+        root = self.root.dissoc(_hash(key), key, 0)
+        if root is self.root:
+            return self
+        return HashTrie(root or _EMPTY_NODE, self.size - 1)
+
+    def update(self, items, replace=True):
+        """Associates every ``(key, value)`` pair of items in turn.
+        """
+        trie = self
+        for k, v in items:
+            trie = trie.assoc(k, v, replace)
+        return trie
+
+    def fmap(self, func):
+        """Maps func over every value, keeping the shape of the trie so no
+        key is rehashed.
+        """
+        return HashTrie(self.root.fmap(func), self.size)
+
+
+EMPTY = HashTrie()
@@ -8,7 +8,8 @@ from inspect import isfunction
 
 __all__ = ('_iter_but_not_str_or_map', '_propagate_self',
            '_single_value_iter', 'with_metaclass', '_get_names',
-           '_get_name', 'iscallable', 'chain_dict_update', 'Instance')
+           '_get_name', 'iscallable', 'chain_dict_update', 'Instance',
+           '_items', '_mapping_eq', '_mapping_ne')
 
 
 def _iter_but_not_str_or_map(maybe_iter):
@@ -36,6 +37,37 @@ def _propagate_self(self, *_, **__):
     return self
 
 
+def _items(mapping):
+    """Helper for the Map-like types in pynads.concrete, which accept either
+    a Mapping or an iterable of key-value pairs wherever dict does.
+    """
+    if isinstance(mapping, Mapping):
+        return mapping.items()
+    return mapping
+
+
+def _mapping_eq(this, other, types):
+    """Helper for the Map-like types in pynads.concrete: compares a mapping
+    to another mapping of one of the given types by looking up each of its
+    keys in the other, rather than copying either one into a dict. Returns
+    NotImplemented for anything else.
+    """
+    if not isinstance(other, types):
+        return NotImplemented
+    missing = object()
+    return len(this) == len(other) and \
+        all(other.get(k, missing) == v for k, v in this.items())
+
+
+def _mapping_ne(this, other):
+    """Helper for the Map-like types in pynads.concrete: negates their
+    ``__eq__`` while passing NotImplemented on, so the other operand still
+    gets to compare itself.
+    """
+    result = this.__eq__(other)
+    return result if result is NotImplemented else not result
+
+
 def _single_value_iter(x):
     """Helper function for pynads.concrete.list.Generator that allows
     placing a single value into an iteration context.
@@ -0,0 +1,101 @@
+"""Helpers for running a function over many values on a
+``concurrent.futures`` executor, used by the ``par_*`` methods on pynads'
+collections.
+
+Values are dispatched to the executor in chunks rather than one at a time
+since, especially with a process pool, the cost of shipping a single value
+to a worker usually dwarfs the cost of calling the function on it. When no
+chunk size is given, one is picked by timing the function on the first few
+values.
+
+``concurrent.futures`` is only imported when a function here is called
+without an executor, so importing pynads doesn't require it (it's not in
+the standard library on Python 2).
+"""
+
+from itertools import chain, islice, repeat
+from timeit import default_timer
+
+
+__all__ = ('chunked_map', 'adaptive_chunksize')
+
+
+#: roughly how long a single chunk should take to run
+TARGET_CHUNK_SECONDS = 0.05
+
+#: how many chunks each worker should get at minimum, so work stays balanced
+CHUNKS_PER_WORKER = 4
+
+#: the most values timed when estimating the cost of a function
+SAMPLE_SIZE = 16
+
+
+def _run_chunk(func, chunk):
+    return [func(v) for v in chunk]
+
+
+def _run_flat_chunk(func, chunk):
+    return list(chain.from_iterable(func(v) for v in chunk))
+
+
+def adaptive_chunksize(per_item, total, workers,
+                       target=TARGET_CHUNK_SECONDS,
+                       per_worker=CHUNKS_PER_WORKER):
+    """Picks a chunk size so a chunk takes about ``target`` seconds given
+    each value costs ``per_item`` seconds, while still producing at least
+    ``per_worker`` chunks for each worker.
+    """
+    by_cost = int(target / per_item) if per_item > 0 else total
+    by_balance = -(-total // (workers * per_worker))
+    return max(1, min(by_cost, by_balance))
+
+
+def _chunks(values, size, start=0):
+    it = islice(values, start, None)
+    chunk = tuple(islice(it, size))
+    while chunk:
+        yield chunk
+        chunk = tuple(islice(it, size))
+
+
+def chunked_map(func, values, executor=None, chunksize=None, flatten=False,
+                workers=None):
+    """Calls ``func`` with every value in ``values`` on ``executor`` and
+    returns a list of the results in their original order.
+
+    If no executor is given, a ProcessPoolExecutor with ``workers``
+    processes is created for the call and shut down afterwards; anything
+    run in a process pool must be picklable. If no chunksize is given, it's
+    chosen by ``adaptive_chunksize`` after timing the first few values in
+    the calling thread (those results are kept rather than recomputed).
+    ``workers`` is also how many workers the chunks are balanced across,
+    and defaults to the number of CPUs, so pass the size of an executor
+    that has a different one.
+
+    When ``flatten`` is true, ``func`` is expected to return an iterable for
+    every value and the iterables are concatenated, like bind does.
+    """
+    values = values if isinstance(values, (list, tuple)) else tuple(values)
+    if not workers:
+        from multiprocessing import cpu_count
+        workers = cpu_count() or 1
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as executor:
+            return chunked_map(func, values, executor, chunksize, flatten,
+                               workers)
+
+    runner = _run_flat_chunk if flatten else _run_chunk
+    head, start = [], 0
+    if chunksize is None:
+        sample = values[:SAMPLE_SIZE]
+        started = default_timer()
+        head = runner(func, sample)
+        per_item = (default_timer() - started) / max(len(sample), 1)
+        start = len(sample)
+        chunksize = adaptive_chunksize(per_item, len(values) - start,
+                                       workers)
+
+    chunks = _chunks(values, chunksize, start)
+    results = executor.map(runner, repeat(func), chunks)
+    return head + list(chain.from_iterable(results))
@@ -0,0 +1,135 @@
+"""De-duplication of values that aren't necessarily hashable, used by
+pynads.List's ``distinct`` and set operations and by LazyList.distinct.
+
+Each value (or its key, if a key function is given) is remembered by the
+cheapest strategy that works for it:
+
+1. Hashable values go in a set, as usual.
+2. Unhashable containers built out of dicts, lists, sets and hashable
+   values -- such as decoded JSON -- are converted to a hashable
+   fingerprint that compares equal exactly when the originals do, then go
+   in the same set. A set's fingerprint is a frozenset, which is equal to
+   the sets and frozensets equal to the original, while the fingerprints
+   of dicts and lists are tagged so they're never equal to other values.
+3. Anything else must be orderable and is kept in a sorted list searched by
+   bisection.
+
+The first two are O(1) per value, the third O(log n) to search, so
+de-duplicating never falls back to comparing every pair of values. A value
+that is neither hashable, made of containers nor orderable raises
+TypeError; giving a key function that returns one of those sorts of values
+is the way out.
+"""
+
+from bisect import bisect_left
+from collections import Mapping, Set
+
+
+__all__ = ('Seen', 'Distinct', 'unique', 'fingerprint')
+
+
+# tags that keep fingerprints of different containers apart from each
+# other and from hashable tuples that happen to look the same
+_SEQUENCE, _MAPPING = object(), object()
+
+
+def fingerprint(value):
+    """Returns a hashable stand in for ``value`` that's equal to another
+    fingerprint exactly when the values are equal. Hashable values are
+    their own fingerprint. Raises TypeError for values that are neither
+    hashable nor a dict, list or set of fingerprintable values.
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+    if isinstance(value, Mapping):
+        return (_MAPPING, frozenset((k, fingerprint(v))
+                                    for k, v in value.items()))
+    elif isinstance(value, Set):
+        return frozenset(value)
+    elif isinstance(value, list):
+        return (_SEQUENCE, tuple(fingerprint(v) for v in value))
+    raise TypeError("can't fingerprint {!r}".format(value))
+
+
+class Seen(object):
+    """A set-like record of the values seen so far, which also accepts
+    unhashable values. ``add`` returns whether the value was new.
+    """
+    __slots__ = ('key', '_hashed', '_ordered')
+
+    def __init__(self, key=None):
+        self.key = key
+        self._hashed = set()
+        self._ordered = []
+
+    def _find(self, k):
+        """Returns the container k belongs in, the form it's stored in
+        there and, for the sorted list, its position.
+        """
+        try:
+            return self._hashed, fingerprint(k), None
+        except TypeError:
+            pass
+        try:
+            return self._ordered, k, bisect_left(self._ordered, k)
+        except TypeError:
+            raise TypeError("{!r} is unhashable and unorderable, provide a "
+                            "key function to distinguish values".format(k))
+
+    def _located(self, found):
+        store, k, i = found
+        if i is None:
+            return k in store
+        return i < len(store) and store[i] == k
+
+    def __contains__(self, value):
+        k = value if self.key is None else self.key(value)
+        return self._located(self._find(k))
+
+    def add(self, value):
+        k = value if self.key is None else self.key(value)
+        found = self._find(k)
+        if self._located(found):
+            return False
+        store, k, i = found
+        if i is None:
+            store.add(k)
+        else:
+            store.insert(i, k)
+        return True
+
+
+def unique(values, key=None):
+    """Yields each distinct value of an iterable the first time it's seen,
+    without materializing the iterable.
+    """
+    seen = Seen(key)
+    add = seen.add
+    for v in values:
+        if add(v):
+            yield v
+
+
+class Distinct(object):
+    """The distinct values of an iterable in the order they first appear,
+    with O(1) (or O(log n)) membership tests. Stands in for the dicts
+    pynads.List uses as hash indexes when its values aren't hashable.
+    """
+    __slots__ = ('values', 'seen')
+
+    def __init__(self, values, key=None):
+        self.seen = Seen(key)
+        add = self.seen.add
+        self.values = [v for v in values if add(v)]
+
+    def __contains__(self, value):
+        return value in self.seen
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
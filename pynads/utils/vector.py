@@ -0,0 +1,403 @@
+"""A small persistent vector used as the backing storage for
+pynads.concrete.List.
+
+The vector is a height balanced concatenation tree (a rope) whose leaves are
+windows onto immutable sequences, usually tuples. Nothing in the tree is ever
+mutated after construction, so any two vectors may freely share subtrees.
+That sharing is what allows appending, prepending, concatenating and slicing
+to cost O(log n) rather than copying every element on every operation.
+
+Rather than the relaxed radix nodes of an RRB-tree, rebalancing is done with
+the same rotations an AVL tree uses. The asymptotics are the same for what
+List needs and the code is considerably smaller.
+
+Small leaves that meet during a join are merged together so that building a
+vector one element at a time still ends up with leaves of roughly
+``LEAF_SIZE`` elements instead of a tree with one node per element.
+
+A leaf addresses its storage through a ``range`` of indices, so slicing with
+any step and reversing produce views over the same storage rather than
+copies. A view can keep a far larger sequence alive than it shows, so unless
+sharing is explicitly requested, slicing a leaf copies the window when it
+would show less than ``1 / PIN_RATIO`` of the storage it would pin.
+
+Leaves may also be backed by a Python list handed over by
+pynads.concrete.list.ListBuilder or by an ``array.array``. Whenever leaves
+are copied or merged, array storage is kept as an array of the same typecode
+so a compact vector stays compact. Either kind of storage is owned by the
+vector and must never be mutated after being handed over.
+"""
+
+from array import array
+from itertools import chain, islice
+from .compat import map, range
+
+
+__all__ = ('Vector', 'LEAF_SIZE', 'PIN_RATIO')
+
+
+#: leaves smaller than this are merged when they meet during a join
+LEAF_SIZE = 32
+
+#: slices showing less than 1/PIN_RATIO of their storage are copied
+PIN_RATIO = 8
+
+
+class Vector(object):
+    """Base class for the nodes of a persistent vector.
+
+    Vectors support ``len``, iteration, integer indexing and equality. All
+    other operations return new vectors and leave the original untouched.
+
+    ``Vector.from_tuple`` adopts an existing tuple without copying it and
+    ``Vector.from_iterable`` builds a vector with a single copy.
+    """
+    __slots__ = ('size', 'depth', '_flat')
+
+    @staticmethod
+    def from_tuple(items):
+        """Adopts an existing tuple (or other immutable sequence) as the
+        storage of a single leaf. The sequence is not copied.
+        """
+        return _Leaf(items, range(len(items)))
+
+    @classmethod
+    def from_iterable(cls, items):
+        """Builds a vector from any iterable, copying it exactly once.
+        """
+        if isinstance(items, Vector):
+            return items
+        return cls.from_tuple(tuple(items))
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        return chain.from_iterable(leaf._iter_leaf() for leaf in self.leaves())
+
+    def __contains__(self, x):
+        return any(leaf._contains_leaf(x) for leaf in self.leaves())
+
+    def index(self, x):
+        offset = 0
+        for leaf in self.leaves():
+            try:
+                return offset + leaf._index_leaf(x)
+            except ValueError:
+                offset += leaf.size
+        raise ValueError("{!r} is not in vector".format(x))
+
+    def count(self, x):
+        return sum(leaf._count_leaf(x) for leaf in self.leaves())
+
+    def __eq__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
+        if self is other:
+            return True
+        if self.size != other.size:
+            return False
+        return self.mismatch(other) is None
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self.size
+        if not 0 <= idx < self.size:
+            raise IndexError("vector index out of range")
+        return self._get(idx)
+
+    def mismatch(self, other):
+        """Returns the first pair of values at the same position of two
+        vectors that aren't equal, or None if one vector is a prefix of the
+        other. Values are compared as tuples compare them, but nothing is
+        flattened.
+        """
+        for x, y in zip(self, other):
+            if not (x is y or x == y):
+                return x, y
+        return None
+
+    def to_tuple(self):
+        """Returns the contents of the vector as a tuple. The tuple is
+        cached on the node since the node can never change.
+        """
+        if self._flat is None:
+            self._flat = tuple(self)
+        return self._flat
+
+    def concat(self, other):
+        """Joins two vectors together in O(log n).
+        """
+        return _join(self, other)
+
+    def append(self, x):
+        return _join(self, Vector.from_tuple((x,)))
+
+    def cons(self, x):
+        return _join(Vector.from_tuple((x,)), self)
+
+    def slice(self, start, stop, step=1, share=False):
+        """Returns the vector holding ``self[start:stop:step]``. The bounds
+        are expected to already be normalized, e.g. by ``slice.indices``.
+
+        If ``share`` is true, nothing is copied: the result is made of views
+        onto the leaves of this vector. Otherwise, leaves that would pin
+        much more storage than they show are copied, small leaves meeting
+        where the slice was cut are merged, and a slice with a step other
+        than 1 or -1 spanning several leaves is copied into a single leaf.
+        """
+        indices = range(start, stop, step)
+        if not indices:
+            return EMPTY
+        if step == 1:
+            if start == 0 and stop == self.size:
+                return self
+            return self._slice(start, stop, share)
+        elif not self.depth:
+            return self._view(indices, share)
+        elif step < 0:
+            # walk the mirrored tree forwards instead
+            last = self.size - 1
+            return self.reverse().slice(last - start, last - stop,
+                                        -step, share)
+        elif share:
+            return self._stepped_views(indices)
+        window = self._slice(indices[0], indices[-1] + 1, share)
+        return Vector.from_tuple(_copy_like(_common_storage(window),
+                                            islice(window, 0, None, step)))
+
+
+    def _stepped_views(self, indices):
+        """Joins views of every leaf onto the positions in indices, an
+        increasing range, without copying or merging any leaves.
+        """
+        start, stop, step = indices[0], indices[-1] + 1, indices.step
+        result, offset = EMPTY, 0
+        for leaf in self.leaves():
+            end = offset + leaf.size
+            if end > start:
+                skip = -(-(offset - start) // step) if offset > start else 0
+                first = start + skip * step
+                local = range(first - offset, min(stop, end) - offset, step)
+                if local:
+                    result = _join(result, leaf._view(local, True),
+                                   merge=False)
+            if end >= stop:
+                break
+            offset = end
+        return result
+
+
+class _Leaf(Vector):
+    """A view of ``items`` through a range of indices into it.
+    """
+    __slots__ = ('items', 'indices')
+
+    def __init__(self, items, indices):
+        self.items = items
+        self.indices = indices
+        self.size = len(indices)
+        self.depth = 0
+        self._flat = None
+
+    def leaves(self):
+        yield self
+
+    def _owns_all(self):
+        return self.indices == range(len(self.items))
+
+    def _iter_leaf(self):
+        if self._owns_all():
+            return iter(self.items)
+        elif self.indices.step == 1:
+            return islice(self.items, self.indices.start, self.indices.stop)
+        return map(self.items.__getitem__, self.indices)
+
+    def __iter__(self):
+        return self._iter_leaf()
+
+    def _contains_leaf(self, x):
+        if self._owns_all():
+            return x in self.items
+        return any(x is v or x == v for v in self._iter_leaf())
+
+    def _index_leaf(self, x):
+        indices = self.indices
+        if indices.step == 1:
+            return self.items.index(x, indices.start, indices.stop) - \
+                indices.start
+        for i, v in enumerate(self._iter_leaf()):
+            if x is v or x == v:
+                return i
+        raise ValueError("{!r} is not in vector".format(x))
+
+    def _count_leaf(self, x):
+        if self._owns_all():
+            return self.items.count(x)
+        return sum(1 for v in self._iter_leaf() if x is v or x == v)
+
+    def _get(self, idx):
+        return self.items[self.indices[idx]]
+
+    def _slice(self, start, stop, share):
+        return self._view(range(start, stop), share)
+
+    def _view(self, indices, share):
+        """Creates a leaf over the positions of this leaf in ``indices``.
+        """
+        first = self.indices[indices[0]]
+        step = self.indices.step * indices.step
+        view = _Leaf(self.items, range(first, first + step * len(indices),
+                                       step))
+        if not share and view.size * PIN_RATIO < len(self.items):
+            return Vector.from_tuple(_copy_like(self.items, view))
+        return view
+
+    def reverse(self):
+        return _Leaf(self.items, self.indices[::-1])
+
+    def to_tuple(self):
+        if self._owns_all() and type(self.items) is tuple:
+            return self.items
+        return super(_Leaf, self).to_tuple()
+
+
+class _Concat(Vector):
+    """An interior node joining two balanced subtrees.
+    """
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.size = left.size + right.size
+        self.depth = max(left.depth, right.depth) + 1
+        self._flat = None
+
+    def leaves(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.depth:
+                stack.append(node.right)
+                stack.append(node.left)
+            else:
+                yield node
+
+    def _get(self, idx):
+        node = self
+        while node.depth:
+            if idx < node.left.size:
+                node = node.left
+            else:
+                idx -= node.left.size
+                node = node.right
+        return node._get(idx)
+
+    def _slice(self, start, stop, share):
+        split = self.left.size
+        if stop <= split:
+            return self.left.slice(start, stop, 1, share)
+        if start >= split:
+            return self.right.slice(start - split, stop - split, 1, share)
+        return _join(self.left.slice(start, split, 1, share),
+                     self.right.slice(0, stop - split, 1, share),
+                     merge=not share)
+
+    def reverse(self):
+        """Mirrors the tree. Only nodes are created, every leaf still
+        views the same storage.
+        """
+        return _Concat(self.right.reverse(), self.left.reverse())
+
+
+EMPTY = Vector.from_tuple(())
+
+
+def _copy_like(items, values):
+    """Copies values into new leaf storage of the same kind as items.
+    """
+    if isinstance(items, array):
+        return array(items.typecode, values)
+    return tuple(values)
+
+
+def _common_storage(vector):
+    """Returns the storage of the first leaf of vector if every leaf is an
+    array of the same typecode, so copies of it can stay arrays, and an
+    empty tuple otherwise.
+    """
+    leaves = vector.leaves()
+    items = next(leaves).items
+    if isinstance(items, array) and all(
+            isinstance(leaf.items, array) and
+            leaf.items.typecode == items.typecode for leaf in leaves):
+        return items
+    return ()
+
+
+def _merge_items(left, right):
+    """Creates the storage for a leaf merging two smaller leaves.
+    """
+    if (isinstance(left.items, array) and isinstance(right.items, array) and
+            left.items.typecode == right.items.typecode):
+        return array(left.items.typecode, chain(left, right))
+    return tuple(chain(left, right))
+
+
+def _node(left, right):
+    """Creates an interior node from two subtrees whose depths differ by at
+    most two, rotating as needed to restore balance.
+    """
+    if left.depth > right.depth + 1:
+        if left.left.depth >= left.right.depth:
+            return _Concat(left.left, _Concat(left.right, right))
+        inner = left.right
+        return _Concat(_Concat(left.left, inner.left),
+                       _Concat(inner.right, right))
+    elif right.depth > left.depth + 1:
+        if right.right.depth >= right.left.depth:
+            return _Concat(_Concat(left, right.left), right.right)
+        inner = right.left
+        return _Concat(_Concat(left, inner.left),
+                       _Concat(inner.right, right.right))
+    return _Concat(left, right)
+
+
+def _join(left, right, merge=True):
+    """Concatenates two balanced trees into a single balanced tree. Unless
+    merge is false, small leaves meeting at the seam are copied into one.
+    """
+    if not left.size:
+        return right
+    if not right.size:
+        return left
+
+    if not left.depth and not right.depth:
+        if merge and left.size + right.size <= LEAF_SIZE:
+            return Vector.from_tuple(_merge_items(left, right))
+        return _Concat(left, right)
+
+    # descend toward the seam when one side is deeper or when the other
+    # side is a small leaf that could be merged with a boundary leaf
+    small_right = merge and not right.depth and right.size < LEAF_SIZE
+    small_left = merge and not left.depth and left.size < LEAF_SIZE
+
+    if left.depth > right.depth + 1 or (left.depth and small_right):
+        return _node(left.left, _join(left.right, right, merge))
+    elif right.depth > left.depth + 1 or (right.depth and small_left):
+        return _node(_join(left, right.left, merge), right.right)
+    return _Concat(left, right)
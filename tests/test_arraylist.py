@@ -0,0 +1,89 @@
+import pytest
+from pynads import ArrayList, List
+
+np = pytest.importorskip('numpy')
+
+
+class CountingFunc(object):
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.func(x)
+
+
+def test_ArrayList_fmap_ufunc():
+    xs = ArrayList([1.0, 4.0, 9.0])
+    assert xs.fmap(np.sqrt) == ArrayList([1.0, 2.0, 3.0])
+
+
+def test_ArrayList_fmap_vectorized_called_once():
+    f = ArrayList.vectorized(CountingFunc(lambda x: x * 2))
+    assert f % ArrayList([1, 2, 3]) == ArrayList([2, 4, 6])
+    assert f.calls == 1
+
+
+def test_ArrayList_fmap_plain_func_per_value():
+    f = CountingFunc(lambda x: x + 1)
+    assert ArrayList([1, 2, 3]).fmap(f) == ArrayList([2, 3, 4])
+    assert f.calls == 3
+
+
+def test_ArrayList_mappend_and_mconcat():
+    xs, ys = ArrayList([1, 2]), ArrayList([3])
+    assert xs + ys == ArrayList([1, 2, 3])
+    assert ArrayList.mconcat(xs, ys, List(4)) == ArrayList([1, 2, 3, 4])
+    assert (ArrayList.mempty + xs).v.dtype == xs.v.dtype
+
+
+def test_ArrayList_mappend_raises_with_str():
+    with pytest.raises(TypeError):
+        ArrayList([1]) + 'a'
+
+
+def test_ArrayList_List_round_trip():
+    l = List(1, 2, 3)
+    assert ArrayList.from_list(l).to_list() == l
+
+
+def test_ArrayList_slice_is_view():
+    xs = ArrayList([1, 2, 3, 4])
+    assert np.shares_memory(xs[1:3].v, xs.v)
+    assert xs[1:3] == ArrayList([2, 3])
+    assert xs[0] == 1
+
+
+def test_ArrayList_array_protocol():
+    import warnings
+    xs = ArrayList([1, 2, 3])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        view = np.asarray(xs)
+    assert not view.flags.writeable
+    with pytest.raises(ValueError):
+        view[0] = 10
+    copied = np.array(xs, copy=True)
+    copied[0] = 10
+    assert xs[0] == 1
+    assert np.asarray(xs, dtype=float).dtype == np.float64
+    with pytest.raises(ValueError):
+        np.array(xs, dtype=float, copy=False)
+    assert not ArrayList._is_vectorized(np.add.reduce)
+
+
+def test_ArrayList_mconcat_without_monoids_is_mempty():
+    assert ArrayList.mconcat() is ArrayList.mempty
+
+
+def test_ArrayList_copies_its_input():
+    values = np.array([1, 2, 3])
+    xs = ArrayList(values)
+    values[0] = 10
+    assert xs[0] == 1 and values.flags.writeable
+    assert not xs.v.flags.writeable
+    with pytest.raises(ValueError):
+        xs.v[0] = 10
+    assert not (xs + xs).v.flags.writeable
+    assert not xs[1:].v.flags.writeable
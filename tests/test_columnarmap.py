@@ -0,0 +1,126 @@
+from array import array
+import pytest
+from pynads import ArrayList, ColumnarMap, Map
+from pynads.concrete import columnarmap
+
+np = columnarmap.np
+needs_numpy = pytest.mark.skipif(np is None, reason="requires NumPy")
+
+
+def test_ColumnarMap_is_a_mapping():
+    m = ColumnarMap({'a': 1.0, 'b': 2.0})
+    assert m['a'] == 1.0 and 'b' in m and 'c' not in m
+    assert sorted(m) == ['a', 'b'] and len(m) == 2
+    assert m == Map({'a': 1.0, 'b': 2.0})
+    assert m.to_map() == Map({'a': 1.0, 'b': 2.0})
+    assert ColumnarMap.unit(('a', 3)) == Map({'a': 3})
+    with pytest.raises(KeyError):
+        m['c']
+
+
+def test_ColumnarMap_stores_a_column():
+    m = ColumnarMap({'a': 1, 'b': 2}, typecode='i')
+    assert m.typecode == 'i'
+    assert list(m.column) == [1, 2]
+    if np is None:
+        assert isinstance(m.column, array)
+
+
+def test_ColumnarMap_fmap_shares_index():
+    m = ColumnarMap({'a': 1.0, 'b': 2.0})
+    n = (lambda x: x + 1) % m
+    assert isinstance(n, ColumnarMap)
+    assert n.index is m.index
+    assert n == Map({'a': 2.0, 'b': 3.0})
+
+
+def test_ColumnarMap_fmap_falls_back_to_Map():
+    m = ColumnarMap({'a': 1.0}).fmap(str)
+    assert type(m) is Map and m == Map({'a': '1.0'})
+
+
+def test_ColumnarMap_curried_apply_without_vectorizing():
+    add = lambda x: lambda y: x + y
+    m = add % ColumnarMap({'a': 1.0, 'b': 2.0})
+    assert type(m) is Map
+    assert m * ColumnarMap({'a': 10.0}) == Map({'a': 11.0})
+
+
+def test_ColumnarMap_apply_needs_functions():
+    with pytest.raises(TypeError):
+        ColumnarMap({'a': 1.0}) * ColumnarMap({'a': 1.0})
+
+
+def test_ColumnarMap_zip_with():
+    m = ColumnarMap({'a': 1.0, 'b': 2.0, 'c': 3.0})
+    n = ColumnarMap({'c': 10.0, 'a': 20.0, 'd': 1.0})
+    assert m.zip_with(n, lambda x, y: x * y) == Map({'a': 20.0, 'c': 30.0})
+    assert m.zip_with({'b': 2}, lambda x, y: x - y) == Map({'b': 0.0})
+
+
+def test_ColumnarMap_mappend():
+    m = ColumnarMap({'a': 1.0, 'b': 2.0})
+    n = ColumnarMap({'b': 5.0, 'c': 6.0})
+    assert m + n == Map({'a': 1.0, 'b': 5.0, 'c': 6.0})
+    assert ColumnarMap.mempty + m == m + ColumnarMap.mempty == m
+    assert ColumnarMap.mconcat(m, n, {'a': 0}) == \
+        Map({'a': 0.0, 'b': 5.0, 'c': 6.0})
+    assert (m + n) + m == m + (n + m)
+
+
+
+def test_ColumnarMap_mconcat_single_pass():
+    ms = [ColumnarMap({'a': 1.0, 'b': 2.0}), {'c': 3.0},
+          ColumnarMap({'b': 4.0, 'd': 5.0})]
+    joined = ColumnarMap.mconcat(*ms)
+    assert isinstance(joined, ColumnarMap)
+    assert list(joined) == ['a', 'b', 'c', 'd']
+    assert joined == Map({'a': 1.0, 'b': 4.0, 'c': 3.0, 'd': 5.0})
+    assert ColumnarMap.mconcat() is ColumnarMap.mempty
+
+
+def test_ColumnarMap_mappend_curried_is_Map():
+    add = ArrayList.vectorized(lambda x: lambda y: x + y)
+    m = add % ColumnarMap({'a': 1.0})
+    joined = m + ColumnarMap({'b': 2.0})
+    assert type(joined) is Map and sorted(joined) == ['a', 'b']
+    assert joined['a'](1.0) == 2.0 and joined['b'] == 2.0
+
+
+def test_ColumnarMap_column_follows_results():
+    m = ColumnarMap({'a': 1.5, 'b': 2.5})
+    ints = m.fmap(int)
+    assert ints == Map({'a': 1, 'b': 2})
+    if np is None:
+        assert ints.typecode == 'l'
+        assert all(type(x) is int for x in ints.values())
+        assert type(m.fmap(lambda x: x > 2)) is Map
+    else:
+        assert ints.column.dtype.kind == 'i'
+
+
+@needs_numpy
+def test_ColumnarMap_vectorized_fmap():
+    calls = []
+
+    @ArrayList.vectorized
+    def double(xs):
+        calls.append(xs)
+        return xs * 2
+
+    m = double % ColumnarMap({'a': 1.0, 'b': 2.0})
+    assert m == Map({'a': 2.0, 'b': 4.0})
+    assert len(calls) == 1
+    assert np.sqrt % ColumnarMap({'a': 4.0}) == Map({'a': 2.0})
+
+
+@needs_numpy
+def test_ColumnarMap_vectorized_apply():
+    add = ArrayList.vectorized(lambda x: lambda y: lambda z: x + y + z)
+    xs = ColumnarMap({'a': 1.0, 'b': 2.0, 'c': 3.0})
+    ys = ColumnarMap({'c': 10.0, 'a': 20.0})
+    zs = ColumnarMap({'a': 100.0, 'c': 200.0})
+    assert add % xs * ys * zs == Map({'a': 121.0, 'c': 213.0})
+    same = add % xs * xs
+    assert same.index is xs.index
+    assert same * xs == Map({'a': 3.0, 'b': 6.0, 'c': 9.0})
@@ -0,0 +1,89 @@
+import pytest
+from pynads import ConsList, Just, List, Nothing, State
+from pynads.funcs import cons, mcons, mappend, mconcat
+
+
+add_two = lambda x: x+2
+minus_or_plus_two = lambda x: [x-2, x+2]
+
+
+def test_ConsList_cons_shares_tail():
+    stack = ConsList(2, 3)
+    pushed = stack.cons(1)
+    assert pushed == ConsList(1, 2, 3)
+    assert pushed.tail is not stack
+    assert pushed.tail._v is stack._v
+    assert pushed.head == 1
+    assert pushed.uncons() == (1, stack)
+
+
+def test_ConsList_head_tail_of_empty():
+    with pytest.raises(IndexError):
+        ConsList().head
+    with pytest.raises(IndexError):
+        ConsList().tail
+
+
+def test_ConsList_len_and_bool():
+    assert len(ConsList(1, 2, 3).cons(0)) == 4
+    assert not ConsList()
+    assert ConsList(None)
+
+
+def test_ConsList_monad():
+    l = ConsList(1, 2, 3)
+    assert l.fmap(add_two) == ConsList(3, 4, 5)
+    assert ConsList(add_two) * l == ConsList(3, 4, 5)
+    assert l >> minus_or_plus_two == ConsList(-1, 3, 0, 4, 1, 5)
+    assert l.filter(lambda x: x % 2) == ConsList(1, 3)
+    assert ConsList.unit([1]) == ConsList([1])
+
+
+def test_ConsList_monoid():
+    l, m = ConsList(1, 2), ConsList(3)
+    assert l + m == ConsList(1, 2, 3)
+    assert (l + m)._v[1][1] is m._v
+    assert l + [3] == ConsList(1, 2, 3)
+    assert ConsList.mconcat(l, (3,), m) == ConsList(1, 2, 3, 3)
+    assert ConsList.mempty + l == l
+    assert l.append(3) == ConsList(1, 2, 3)
+
+    with pytest.raises(TypeError):
+        l + 'a'
+
+
+def test_ConsList_List_round_trip():
+    assert ConsList.from_list(List(1, 2, 3)).to_list() == List(1, 2, 3)
+
+
+def test_ConsList_indexing():
+    l = ConsList(*range(10))
+    assert l[3] == 3
+    assert l[-1] == 9
+    assert l[7:]._v is l._v[1][1][1][1][1][1][1]
+    assert l[::3] == ConsList(0, 3, 6, 9)
+
+    with pytest.raises(IndexError):
+        l[10]
+
+
+def test_ConsList_with_funcs():
+    assert cons(1, ConsList(2)) == ConsList(1, 2)
+    assert isinstance(cons(1, ConsList()), ConsList)
+    assert mappend(ConsList(1), ConsList(2)) == ConsList(1, 2)
+    assert mconcat(ConsList(1), ConsList(2)) == ConsList(1, 2)
+    assert mcons(Just(1), Just(ConsList(2, 3))) == Just(ConsList(1, 2, 3))
+    assert isinstance(mcons(Just(1), Just(ConsList())).v, ConsList)
+    assert mcons(Nothing, Just(ConsList(1))) is Nothing
+
+
+def test_ConsList_stack_machine():
+    push = lambda a: State(lambda s: ((), s.cons(a)))
+    pop = State(lambda s: (s.head, s.tail))
+    machine = push(1) >> (lambda _: push(2) >> (lambda _: pop))
+    assert machine(ConsList(0)) == (2, ConsList(1, 0))
+
+
+def test_ConsList_repr():
+    assert repr(ConsList(1, 2)) == "ConsList(1, 2)"
+    assert "...10 more..." in repr(ConsList(*range(15)))
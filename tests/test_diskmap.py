@@ -0,0 +1,97 @@
+import os
+from functools import partial
+from operator import add, mul
+import pytest
+from pynads import DiskMap, Map
+from pynads.concrete import diskmap
+
+
+def test_DiskMap_is_a_mapping():
+    with DiskMap({'a': 1}, b=2) as m:
+        assert m['a'] == 1 and 'b' in m and 'c' not in m
+        assert list(m) == ['a', 'b'] and len(m) == 2
+        assert dict(m.items()) == {'a': 1, 'b': 2}
+        assert m == Map({'a': 1, 'b': 2})
+        assert m.to_map() == Map({'a': 1, 'b': 2})
+        with pytest.raises(KeyError):
+            m['c']
+
+
+def test_DiskMap_equal_keys_match_regardless_of_sharing():
+    a, b = ''.join(['ab', 'cd']), ''.join(['a', 'bcd'])
+    with DiskMap({(a, a): 1}) as m:
+        assert m.get((a, b)) == 1 and (b, a) in m
+        assert (m + DiskMap({(b, a): 2}))[(a, a)] == 2
+        assert len(m + {(a, b): 3}) == 1
+
+
+def test_DiskMap_temporary_file_removed_on_close():
+    m = DiskMap({'a': 1})
+    path = m.path
+    assert os.path.exists(path)
+    m.close()
+    assert not os.path.exists(path)
+
+
+def test_DiskMap_reopen_path(tmpdir):
+    path = str(tmpdir.join('m.sqlite'))
+    DiskMap({'a': [1, 2]}, path=path).close()
+    assert os.path.exists(path)
+    with DiskMap(path=path) as m:
+        assert m == Map({'a': [1, 2]})
+
+
+def test_DiskMap_batched_writes(monkeypatch):
+    monkeypatch.setattr(diskmap, 'BATCH_SIZE', 7)
+    m = DiskMap.fromkeys(range(100), 0)
+    assert len(m) == 100 and m[99] == 0
+
+
+def test_DiskMap_lru_cache(monkeypatch):
+    monkeypatch.setattr(diskmap, 'CACHE_SIZE', 3)
+    m = DiskMap.fromkeys(range(10), 'x')
+    for k in range(5):
+        m[k]
+    assert len(m._cache) == 3
+    m[2]
+    assert list(m._cache)[-1] == diskmap._dumps(2)
+
+
+def test_DiskMap_fmap():
+    m = DiskMap({'a': 1, 'b': 2})
+    n = (lambda x: x * 10) % m
+    assert isinstance(n, DiskMap) and n.path != m.path
+    assert n == Map({'a': 10, 'b': 20})
+
+
+def test_DiskMap_apply():
+    fs = DiskMap({'a': partial(add, 1), 'b': partial(mul, 2)})
+    assert fs * DiskMap({'a': 1, 'c': 3}) == Map({'a': 2})
+    assert fs * Map({'b': 4}) == Map({'b': 8})
+
+
+def test_DiskMap_mappend_and_mconcat():
+    m, n = DiskMap({'a': 1, 'b': 2}), DiskMap({'b': 3})
+    assert m + n == Map({'a': 1, 'b': 3})
+    assert m + {'c': 4} == Map({'a': 1, 'b': 2, 'c': 4})
+    assert DiskMap.mconcat(m, n, Map({'a': 0})) == Map({'a': 0, 'b': 3})
+    assert DiskMap.mempty + m == m + DiskMap.mempty == m
+    assert list(m + n) == ['a', 'b']
+
+
+def test_DiskMap_refuses_existing_path(tmpdir):
+    path = str(tmpdir.join('m.sqlite'))
+    m = DiskMap({'a': 1}, path=path)
+    with pytest.raises(ValueError):
+        m.fmap(str, path=path)
+    with pytest.raises(ValueError):
+        m.mappend({'b': 2}, path=path)
+    with pytest.raises(ValueError):
+        DiskMap.mconcat(m, path=path)
+    with pytest.raises(TypeError):
+        DiskMap.mconcat(m, pth=str(tmpdir.join('n.sqlite')))
+    assert m == Map({'a': 1})
+    fresh = str(tmpdir.join('n.sqlite'))
+    with m.fmap(str, path=fresh) as n:
+        assert n.path == fresh and n == Map({'a': '1'})
+    m.close()
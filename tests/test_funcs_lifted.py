@@ -49,3 +49,42 @@ def test_sequence():
 
 def test_mapM():
     assert lifted.mapM(m_add_two, *range(5)) == Just(List(2,3,4,5,6))
+
+
+def test_sequence_stops_at_first_failure():
+    from pynads import Left, Right
+    calls = []
+
+    def check(x):
+        calls.append(x)
+        return Just(x) if x < 3 else Nothing
+
+    assert lifted.mapM(check, *range(10)) is Nothing
+    assert calls == [0, 1, 2, 3]
+    assert lifted.sequence(Right(1), Left('err'), Right(2)) == Left('err')
+    assert lifted.sequence(Right(1), Right(2)) == Right(List(1, 2))
+
+
+def test_sequence_many_justs():
+    justs = [Just(x) for x in range(10000)]
+    assert lifted.sequence(*justs) == Just(List(*range(10000)))
+
+
+def test_sequence_list():
+    assert lifted.sequence(List(1, 2), List(3, 4)) == \
+        List(List(1, 3), List(1, 4), List(2, 3), List(2, 4))
+    assert lifted.sequence(List(1, 2), List()) == List()
+
+
+def test_sequence_reader_and_state():
+    from pynads import Reader, State
+    readers = [Reader(lambda e, i=i: e + i) for i in range(3)]
+    assert lifted.sequence(*readers)(10) == List(10, 11, 12)
+
+    tick = State(lambda s: (s, s + 1))
+    assert lifted.sequence(tick, tick, tick)(0) == (List(0, 1, 2), 3)
+
+
+def test_sequence_generic_monad():
+    from pynads import Identity
+    assert lifted.sequence(Identity(1), Identity(2)).v == List(1, 2)
@@ -0,0 +1,127 @@
+from itertools import count
+import pytest
+from pynads import LazyList, List
+
+
+add_two = lambda x: x+2
+is_even = lambda x: not x % 2
+minus_or_plus_two = lambda x: [x-2, x+2]
+
+
+class CountingFunc(object):
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.func(x)
+
+
+def test_LazyList_defers_work():
+    f = CountingFunc(add_two)
+    l = List(1, 2, 3).lazy().fmap(f)
+    assert f.calls == 0
+    assert l.force() == List(3, 4, 5)
+    assert f.calls == 3
+
+
+def test_LazyList_matches_eager_pipeline():
+    eager = (add_two % List(*range(10))).filter(is_even) >> minus_or_plus_two
+    lazy = (add_two % List(*range(10)).lazy()).filter(is_even) \
+        >> minus_or_plus_two
+    assert lazy.force() == eager
+
+
+def test_LazyList_fuses_fmaps():
+    l = LazyList((1, 2)).fmap(add_two).fmap(add_two).fmap(add_two)
+    assert len(l._steps) == 1
+    assert l.force() == List(7, 8)
+
+
+def test_LazyList_apply():
+    fs = LazyList([add_two, lambda x: x*10])
+    assert fs.apply(List(1, 2)).force() == List(3, 4, 10, 20)
+    assert fs.force() * List(1, 2) == (fs * List(1, 2)).force()
+
+
+def test_LazyList_infinite_source():
+    l = LazyList(count()).filter(is_even).fmap(add_two).take(4)
+    assert l.force() == List(2, 4, 6, 8)
+
+
+def test_LazyList_getitem():
+    assert LazyList(count()).fmap(add_two)[10] == 12
+    assert LazyList(count()).fmap(add_two)[5:8].force() == List(7, 8, 9)
+    assert List(1, 2, 3).lazy()[-1] == 3
+
+    with pytest.raises(IndexError):
+        List(1, 2, 3).lazy()[3]
+
+
+def test_LazyList_unit():
+    assert LazyList.unit(1).force() == List(1)
+
+
+def test_LazyList_mappend_and_mconcat():
+    l = LazyList((1, 2)) + [3]
+    assert l.force() == List(1, 2, 3)
+    assert LazyList.mconcat(l, (4,), List(5)).force() == List(*range(1, 6))
+    assert LazyList.mempty.force() == List()
+
+
+def test_LazyList_is_replayable_over_sequences():
+    l = List(1, 2, 3).lazy().fmap(add_two)
+    assert list(l) == list(l) == [3, 4, 5]
+
+
+def test_LazyList_size():
+    l = List(1, 2, 3).lazy()
+    assert l.size == 3
+    assert l.fmap(add_two).size == 3
+    assert l.filter(is_even).size is None
+    assert LazyList(count()).size is None
+    assert l.take(2).size == 2
+    assert l[1:].size == 2
+    assert LazyList([add_two, add_two]).apply(l).size == 6
+
+
+def test_LazyList_fold():
+    assert List(1, 2, 3).lazy().fold() == 6
+    assert LazyList([List(1), List(2, 3)]).fold() == List(1, 2, 3)
+    assert List(1, 2, 3).lazy().fold(lambda a, b: a * b, 10) == 60
+
+
+def test_List_lazy_apply_matches_multiapply():
+    from pynads.funcs import multiapply
+    add3 = lambda x: lambda y: lambda z: x + y + z
+    args = List(1, 2, 3), List(10, 20), List(100, 200)
+    lazy = List(add3, lambda x: lambda y: lambda z: x * y * z) \
+        .lazy_apply(*args)
+    eager = multiapply(List(add3, lambda x: lambda y: lambda z: x * y * z),
+                       *args)
+    assert lazy.size == len(eager) == 24
+    assert lazy.force() == eager
+
+
+def test_List_lazy_apply_is_streaming():
+    xs = List(*range(1000))
+    f = lambda x: lambda y: lambda z: x + y + z
+    sums = List(f).lazy_apply(xs, xs, xs)
+    assert sums.size == 10 ** 9
+    assert sums[:3].force() == List(0, 1, 2)
+
+
+def test_List_lazy_apply_size_unknown_for_iterators():
+    f = lambda x: lambda y: x * y
+    products = List(f, f).lazy_apply(iter([1, 2]), List(3, 4))
+    assert products.size is None
+    assert products.force() == List(3, 4, 6, 8, 3, 4, 6, 8)
+
+
+def test_LazyList_distinct_streams():
+    from itertools import count
+    xs = LazyList(count()).fmap(lambda x: [x % 3]).distinct()
+    assert xs.take(3).force() == List([0], [1], [2])
+    assert xs.size is None
+    assert LazyList('aAbB').distinct(key=str.lower).force() == List('a', 'b')
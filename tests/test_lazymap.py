@@ -0,0 +1,97 @@
+import pickle
+from threading import Thread
+from pynads import LazyMap, Map
+from pynads.funcs import mempty
+
+
+def counting(func):
+    def counted(x):
+        counted.calls.append(x)
+        return func(x)
+    counted.calls = []
+    return counted
+
+
+def test_LazyMap_computes_on_access():
+    inc = counting(lambda x: x + 1)
+    m = Map({'a': 1, 'b': 2, 'c': 3}).lazy_fmap(inc)
+    assert isinstance(m, LazyMap)
+    assert len(m) == 3 and 'a' in m and sorted(m) == ['a', 'b', 'c']
+    assert inc.calls == []
+    assert m['a'] == 2 and m['a'] == 2
+    assert inc.calls == [1]
+
+
+def test_LazyMap_fuses_chained_fmaps():
+    inc = counting(lambda x: x + 1)
+    source = Map({'a': 1})
+    m = source.lazy_fmap(inc).lazy_fmap(lambda x: x * 10)
+    assert m['a'] == 20
+    assert inc.calls == [1]
+    # the second view reads straight from the original dict
+    assert m._v is source.v
+
+
+def test_LazyMap_force():
+    m = Map({'a': 1, 'b': 2}).lazy_fmap(str)
+    forced = m.force()
+    assert type(forced) is Map
+    assert forced == Map({'a': '1', 'b': '2'})
+    assert m == forced
+    assert m.v == {'a': '1', 'b': '2'}
+
+
+def test_LazyMap_is_still_a_Map():
+    m = Map({'a': 1, 'b': 2}).lazy_fmap(lambda x: x * 2)
+    assert m.fmap(str) == Map({'a': '2', 'b': '4'})
+    assert m + Map({'c': 0}) == Map({'a': 2, 'b': 4, 'c': 0})
+    assert Map({'a': lambda x: -x}) * m == Map({'a': -2})
+
+
+def test_LazyMap_thread_safe():
+    square = counting(lambda x: x * x)
+    m = Map.fromkeys(range(100), 3).lazy_fmap(square)
+
+    def read():
+        for k in range(100):
+            assert m[k] == 9
+
+    threads = [Thread(target=read) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(square.calls) == 100
+
+
+def test_LazyMap_classmethods_make_views():
+    m = LazyMap.mconcat(Map({'a': 1}), Map({'b': 2}))
+    assert isinstance(m, LazyMap) and m == Map({'a': 1, 'b': 2})
+    assert LazyMap.fromkeys('ab', 0)['a'] == 0
+
+
+def test_LazyMap_has_own_mempty():
+    for _ in range(2):
+        assert type(LazyMap.mempty) is LazyMap
+        assert type(Map.mempty) is Map
+    assert type(mempty(Map({'a': 1}))) is Map
+    assert LazyMap.mempty == Map()
+
+
+def test_LazyMap_reentrant_function():
+    m = None
+
+    def plus_b(x):
+        return x if x == 'b' else x + m['b']
+
+    m = Map({'a': 'a', 'b': 'b'}).lazy_fmap(plus_b)
+    assert m['a'] == 'ab'
+
+
+def test_LazyMap_pickles_without_lock():
+    m = Map({'a': 1, 'b': 2}).lazy_fmap(str)
+    m['a']
+    copied = pickle.loads(pickle.dumps(m))
+    assert isinstance(copied, LazyMap) and copied._cache == {'a': '1'}
+    assert copied == Map({'a': '1', 'b': '2'})
+    assert copied._lock is not m._lock
@@ -1,6 +1,8 @@
 import pytest
-from pynads import List
+from itertools import chain
+from pynads import List, Map
 from pynads.funcs import multiapply, multibind
+from pynads.utils.unique import fingerprint
 
 
 add_two = lambda x: x+2
@@ -205,6 +207,17 @@ def test_List_eq():
     assert List.unit(1) != List(1,2)
 
 
+def test_List_compare_and_hash_do_not_flatten():
+    xs = List.mconcat(*[List(*range(i, i + 40)) for i in range(0, 200, 40)])
+    ys = List(*range(200))
+    assert xs == ys and hash(xs) == hash(ys)
+    assert xs < ys.append(0) and ys.append(0) > xs
+    assert xs <= ys and xs >= ys
+    assert not xs < ys and xs < ys[:-1].append(200)
+    assert List(1, 2) < List(1, 3) and not List(2) <= List(1, 5)
+    assert xs._v._flat is None
+
+
 def test_List_iter():
     tuple_iter_type = type(iter(tuple()))
     List_monad_iter = iter(List())
@@ -236,3 +249,256 @@ def test_List_count():
 
 def test_List_reversed():
     assert reversed(List(1,2,3)) == List(3,2,1)
+
+
+def test_List_incremental_append():
+    l = List()
+    for x in range(1000):
+        l = l.append(x)
+    assert l == List(*range(1000))
+    assert l.v == tuple(range(1000))
+
+
+def test_List_incremental_cons():
+    l = List()
+    for x in range(1000):
+        l = l.cons(x)
+    assert l == List(*range(999, -1, -1))
+
+
+def test_List_slice_after_mappend():
+    l = List(*range(50)) + List(*range(50, 100))
+    assert l[25:75] == List(*range(25, 75))
+    assert l[::2] == List(*range(0, 100, 2))
+    assert l[-3] == 97
+
+
+def test_List_from_tuple_adopts():
+    t = (1, 2, 3)
+    l = List.from_tuple(t)
+    assert l == List(1, 2, 3)
+    assert l.v is t
+
+    with pytest.raises(TypeError):
+        List.from_tuple([1, 2, 3])
+
+
+def test_List_from_iterable():
+    assert List.from_iterable(x for x in range(3)) == List(0, 1, 2)
+    assert List.from_iterable([1, 2]) == List(1, 2)
+    l = List(1, 2)
+    assert List.from_iterable(l)._v is l._v
+
+
+def test_List_view_shares_storage():
+    l = List(*range(1000))
+    v = l.view(100, 110)
+    assert v == l[100:110] == List(*range(100, 110))
+    assert next(v._v.leaves()).items is l.v
+    assert l.view(step=-1) == reversed(l)
+
+
+def test_List_view_across_leaves_never_copies():
+    l = List.mconcat(*[List(*range(i, i + 40)) for i in range(0, 200, 40)])
+    storage = set(id(leaf.items) for leaf in l._v.leaves())
+    for args in [(0, 200, 2), (90, 110), (195, 3, -7), (5, 199, 13)]:
+        v = l.view(*args)
+        assert v == l[slice(*args)]
+        assert all(id(leaf.items) in storage for leaf in v._v.leaves())
+
+
+def test_List_par_fmap_and_par_bind():
+    from concurrent.futures import ThreadPoolExecutor
+    l = List(*range(100))
+    with ThreadPoolExecutor(4) as pool:
+        assert l.par_fmap(add_two, pool) == l.fmap(add_two)
+        assert l.par_bind(minus_or_plus_two, pool, chunksize=7) == \
+            l.bind(minus_or_plus_two)
+
+
+def test_List_hash_index_is_cached():
+    l = List(3, 1, 3, 2)
+    assert 2 in l
+    index = l._lookup()
+    assert index == {3: 0, 1: 1, 2: 3}
+    assert l.index(2) == 3
+    assert l.intersect(List(2)) == List(2)
+    assert l._lookup() is index
+
+
+def test_List_lookup_with_unhashable_values():
+    l = List([1], [2], [1])
+    assert l._lookup() is None
+    assert [2] in l
+    assert l.index([1]) == 0
+    assert l.count([1]) == 2
+    assert 3 not in List(1, 2)
+    assert List(1, 2).count(3) == 0
+    assert l.distinct() == List([1], [2])
+
+
+def test_List_set_operations_with_unhashable_values():
+    records = List({'id': 1, 'tags': ['a']}, {'id': 2},
+                   {'id': 1, 'tags': ['a']})
+    assert records.distinct() == List({'id': 1, 'tags': ['a']}, {'id': 2})
+    assert records - [{'id': 2}] == List({'id': 1, 'tags': ['a']})
+    assert records & [{'id': 2}, {'id': 3}] == List({'id': 2})
+    assert List([1], [2]) | [[2], [3]] == List([1], [2], [3])
+    assert List([1], [2]) ^ List([2], [3]) == List([1], [3])
+
+
+def test_List_set_operations_mixing_hashable_and_unhashable():
+    assert List(1, 2) | List([1], 3) == List(1, 2, [1], 3)
+    assert List(1, 2) ^ List([1], 2) == List(1, [1])
+    assert List([1], 2) & List(2, 3) == List(2)
+    assert List([1], 2) - List(2, 3) == List([1])
+    assert List(1, 2) - (x for x in [[1], 1]) == List(2)
+    assert List({1, 2}, frozenset([1, 2])).distinct() == List({1, 2})
+
+
+def test_List_set_operations_with_key():
+    l = List('apple', 'avocado', 'banana', 'blueberry', 'cherry')
+    first = lambda s: s[0]
+    assert l.distinct(key=first) == List('apple', 'banana', 'cherry')
+    assert l.difference(['bread'], key=first) == List('apple', 'cherry')
+    assert l.intersect(['cake'], key=first) == List('cherry')
+    assert List({'id': 1, 'v': 'a'}, {'id': 1, 'v': 'b'}).distinct(
+        key=lambda r: r['id']) == List({'id': 1, 'v': 'a'})
+
+
+def test_List_set_operations_with_iterables():
+    l = List(1, 2, 3, 2)
+    assert l | [4, 1] == List(1, 2, 3, 4)
+    assert l & (x for x in [3, 2]) == List(2, 3)
+    assert l - {1} == List(2, 3)
+    assert l ^ (3, 5, 5) == List(1, 2, 5)
+
+
+def test_ListBuilder():
+    b = List.builder()
+    for x in range(100):
+        b.append(x)
+    b += [100, 101]
+    l = b.persistent()
+    assert l == List(*range(102))
+    assert b.persistent() is l
+
+
+def test_ListBuilder_freeze_does_not_copy():
+    b = List.builder([1, 2, 3])
+    assert next(b.persistent()._v.leaves()).items is b._items
+
+
+def test_ListBuilder_usable_after_freeze():
+    b = List.builder([1, 2])
+    l = b.persistent()
+    b.append(3)
+    assert l == List(1, 2)
+    assert b.persistent() == List(1, 2, 3)
+
+
+def test_List_transient():
+    with List.transient() as b:
+        b.extend(range(3))
+        b.append(3)
+    assert b.persistent() == List(0, 1, 2, 3)
+
+
+def test_List_mconcat_mixed_sizes():
+    big = List(*range(100))
+    parts = [List(1), big, (2, 3), List(4), big]
+    assert List.mconcat(*parts) == List(*chain.from_iterable(parts))
+
+
+def test_List_join():
+    users = List({'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'},
+                 {'id': 3, 'name': 'c'})
+    posts = List({'user': 1, 'post': 'x'}, {'user': 4, 'post': 'y'},
+                 {'user': 1, 'post': 'z'})
+    uid, author = (lambda u: u['id']), (lambda p: p['user'])
+
+    inner = users.join(posts, uid, author)
+    assert inner == List((users[0], posts[0]), (users[0], posts[2]))
+    left = users.join(posts, uid, author, how='left')
+    assert left == inner + List((users[1], None), (users[2], None))
+    outer = users.join(posts, uid, author, how='outer')
+    assert outer == left + List((None, posts[1]))
+
+
+def test_List_join_rejects_unknown_how():
+    with pytest.raises(ValueError):
+        List(1).join(List(1), abs, how='cross')
+
+
+def test_List_join_unhashable_keys():
+    l = List([1, 2], [3])
+    assert l.join(List([3]), lambda x: x) == List(([3], [3]))
+
+
+def test_List_group_by():
+    groups = List(1, 2, 3, 4, 5).group_by(lambda x: x % 2)
+    assert isinstance(groups, Map)
+    assert groups == Map({0: List(2, 4), 1: List(1, 3, 5)})
+    assert List().group_by(abs) == Map()
+
+
+def test_List_group_by_unhashable_keys():
+    rows = List({'tags': ['a']}, {'tags': ['b']}, {'tags': ['a']})
+    groups = rows.group_by(lambda r: r['tags'])
+    assert len(groups) == 2
+    assert groups[fingerprint(['a'])] == List({'tags': ['a']},
+                                              {'tags': ['a']})
+
+
+def test_List_sort_by():
+    l = List('ccc', 'a', 'bb', 'd')
+    assert l.sort_by(len) == List('a', 'd', 'bb', 'ccc')
+    assert l.sort_by(len, reverse=True) == List('ccc', 'bb', 'a', 'd')
+    assert List(3, 1, 2).sort_by() == List(1, 2, 3)
+
+
+def test_List_top_k():
+    l = List(5, 1, 4, 2, 3)
+    assert l.top_k(2) == List(5, 4)
+    assert l.top_k(2, largest=False) == List(1, 2)
+    assert List('aaa', 'b', 'cc').top_k(1, key=len) == List('aaa')
+    assert l.top_k(10) == List(5, 4, 3, 2, 1)
+
+
+def test_List_chunks():
+    l = List(*range(5))
+    chunks = l.chunks(2)
+    assert chunks.size == 3
+    assert chunks.force() == List(List(0, 1), List(2, 3), List(4))
+    assert List().chunks(3).force() == List()
+    assert next(iter(chunks)).v[0] == 0
+
+
+def test_List_windows():
+    l = List(*range(5))
+    assert l.windows(3).force() == List(List(0, 1, 2), List(1, 2, 3),
+                                        List(2, 3, 4))
+    assert l.windows(2, step=2).force() == List(List(0, 1), List(2, 3))
+    assert l.windows(9).force() == List()
+    with pytest.raises(ValueError):
+        l.windows(0)
+
+
+def test_List_windows_share_storage():
+    l = List(*range(1000))
+    window = next(iter(l.windows(10, step=10)))
+    assert next(window._v.leaves()).items is next(l._v.leaves()).items
+    sums = (lambda w: sum(w)) % l.windows(10, step=10)
+    assert sums.take(2).force() == List(45, 145)
+
+
+def test_List_batched_bind():
+    calls = []
+
+    def bulk(chunk):
+        calls.append(chunk)
+        return [x * 2 for x in chunk]
+
+    l = List(*range(7))
+    assert l.batched_bind(bulk, 3) == l.fmap(lambda x: x * 2)
+    assert calls == [List(0, 1, 2), List(3, 4, 5), List(6)]
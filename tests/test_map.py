@@ -1,4 +1,5 @@
-from pynads import Map
+import pytest
+from pynads import List, Map
 from pynads.funcs import identity
 
 
@@ -121,3 +122,118 @@ def test_Map_eq():
 def test_Map_ne():
     assert Map({'a':1}) != Map({'a':2})
     assert Map({'a':1}) != Map({'b':1})
+
+
+def test_Map_wrap_adopts_dict():
+    d = {'a': 1}
+    m = Map.wrap(d)
+    assert m.v is d
+    assert Map(d).v is not d
+
+    with pytest.raises(TypeError):
+        Map.wrap([('a', 1)])
+
+
+def test_Map_results_own_their_dicts():
+    m = Map({'a': 1})
+    assert m.fmap(lambda x: x).v is not m.v
+    assert (m + Map()).v is not m.v
+    assert Map.mconcat(m).v is not m.v
+
+
+def test_Map_apply_joins():
+    fs = Map({'a': lambda x: x + 1, 'b': lambda x: x * 2})
+    xs = Map({'a': 1, 'c': 5})
+    assert fs * xs == Map({'a': 2})
+    assert fs.apply(xs, how='left', fillvalue=10) == Map({'a': 2, 'b': 20})
+    assert fs.apply(xs, how='outer', fillvalue=10) == \
+        Map({'a': 2, 'b': 20, 'c': 5})
+
+
+def test_Map_zip_with():
+    prices = Map({'apple': 3, 'pear': 2})
+    counts = Map({'apple': 10, 'plum': 1})
+    mul = lambda a, b: a * b
+    assert prices.zip_with(counts, mul) == Map({'apple': 30})
+    assert prices.zip_with(counts, mul, how='left', fillvalue=0) == \
+        Map({'apple': 30, 'pear': 0})
+    assert prices.zip_with(counts, mul, how='outer', fillvalue=0) == \
+        Map({'apple': 30, 'pear': 0, 'plum': 0})
+    assert prices.zip_with({'pear': 4}, mul) == Map({'pear': 8})
+
+    with pytest.raises(ValueError):
+        prices.zip_with(counts, mul, how='cross')
+
+
+def test_Map_zip_with_presorted():
+    this = Map.wrap({1: 'a', 3: 'c', 5: 'e'})
+    that = Map.wrap({2: 'B', 3: 'C', 6: 'F'})
+    pair = lambda a, b: (a, b)
+    for how in ['inner', 'left', 'outer']:
+        merged = this.zip_with(that, pair, how=how, presorted=True)
+        assert merged == this.zip_with(that, pair, how=how)
+        assert list(merged) == sorted(merged)
+
+
+def test_Map_merge_with():
+    counts = Map({'a': 1, 'b': 2})
+    assert counts.merge_with(Map({'b': 3, 'c': 4})) == \
+        Map({'a': 1, 'b': 5, 'c': 4})
+    assert counts.merge_with({'a': 5}, max) == Map({'a': 5, 'b': 2})
+
+
+def test_Map_mconcat_with_monoid_values():
+    shards = [Map({'a': List(1), 'b': List(2)}), Map({'a': List(3)}),
+              Map({'a': List(4)})]
+    assert Map.mconcat_with(*shards) == Map({'a': List(1, 3, 4),
+                                             'b': List(2)})
+    assert Map.mconcat_with(Map({'a': [1]}), Map({'a': [2]})) == \
+        Map({'a': [1, 2]})
+    assert Map.mconcat_with() == Map()
+
+
+def test_Map_mconcat_with_combines_each_key_once():
+    calls = []
+
+    class Counted(List):
+        __slots__ = ()
+
+        @classmethod
+        def mconcat(cls, *monoids):
+            calls.append(len(monoids))
+            return List.mconcat(*monoids)
+
+    merged = Map.mconcat_with(*[Map({'a': List(i)}) for i in range(4)],
+                              combine=Counted)
+    assert merged == Map({'a': List(0, 1, 2, 3)})
+    assert calls == [4]
+
+
+def test_Map_mconcat_with_function():
+    assert Map.mconcat_with(Map({'a': 2}), Map({'a': 3}), Map({'a': 4}),
+                            combine=lambda x, y: x * y) == Map({'a': 24})
+
+
+def test_Map_mconcat_with_rejects_unknown_keywords():
+    with pytest.raises(TypeError) as error:
+        Map.mconcat_with(Map({'a': 1}), Map({'a': 2}), monoid_or_fn=max)
+    assert 'monoid_or_fn' in str(error.value)
+
+
+def inc(x):
+    return x + 1
+
+
+def test_Map_par_fmap():
+    from concurrent.futures import ThreadPoolExecutor
+    m = Map.wrap(dict((str(i), i) for i in range(200)))
+    with ThreadPoolExecutor(4) as pool:
+        result = m.par_fmap(inc, pool)
+        assert result == m.fmap(inc)
+        assert list(result) == list(m)
+        assert m.par_fmap(inc, pool, chunksize=7) == m.fmap(inc)
+
+
+def test_Map_par_fmap_process_pool():
+    m = Map({'a': 1, 'b': 2})
+    assert m.par_fmap(inc) == Map({'a': 2, 'b': 3})
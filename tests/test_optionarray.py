@@ -0,0 +1,180 @@
+import pytest
+from pynads import (ArrayList, EitherArray, Just, Left, MaybeArray, Nothing,
+                    Right)
+from pynads.concrete import optionarray
+
+np = optionarray.np
+needs_numpy = pytest.mark.skipif(np is None, reason="requires NumPy")
+
+
+def test_MaybeArray_uses_checker():
+    xs = MaybeArray([1, None, 3])
+    assert list(xs) == [Just(1), Nothing, Just(3)]
+    assert len(xs) == 3
+    assert xs[0] == Just(1) and xs[1] is Nothing
+    assert list(xs.values) == [1, 3]
+
+    evens = MaybeArray([1, 2, 3, 4], checker=lambda x: x % 2 == 0)
+    assert list(evens) == [Nothing, Just(2), Nothing, Just(4)]
+
+
+def test_MaybeArray_with_mask():
+    xs = MaybeArray([1, 2, 3], mask=[True, False, True])
+    assert xs == MaybeArray([1, None, 3])
+    assert xs != MaybeArray([1, 2, 3])
+
+
+def test_MaybeArray_from_maybes():
+    xs = MaybeArray.from_maybes([Just(1), Nothing, Just('a')])
+    assert list(xs) == [Just(1), Nothing, Just('a')]
+    assert MaybeArray.unit(4) == MaybeArray([4])
+
+
+def test_MaybeArray_fmap_skips_invalid():
+    seen = []
+
+    def times_ten(x):
+        seen.append(x)
+        return x * 10
+
+    xs = times_ten % MaybeArray([1, None, 3])
+    assert seen == [1, 3]
+    assert list(xs) == [Just(10), Nothing, Just(30)]
+    assert list(xs.get_or(0)) == [10, 0, 30]
+
+
+def test_MaybeArray_apply():
+    fs = MaybeArray([lambda x: x + 1, lambda x: x * 2, None])
+    xs = MaybeArray([1, None, 3])
+    assert list(fs * xs) == [Just(2), Nothing, Nothing]
+
+
+def test_MaybeArray_bind():
+    def half(x):
+        return Just(x // 2) if x % 2 == 0 else Nothing
+
+    xs = MaybeArray([2, None, 3, 8]) >> half
+    assert list(xs) == [Just(1), Nothing, Nothing, Just(4)]
+
+
+def test_MaybeArray_filter():
+    xs = MaybeArray([1, 2, None, 4]).filter(lambda x: x > 1)
+    assert list(xs) == [Nothing, Just(2), Nothing, Just(4)]
+
+
+def test_MaybeArray_to_either():
+    xs = MaybeArray([1, None]).to_either('missing')
+    assert list(xs) == [Right(1), Left('missing')]
+
+
+def test_EitherArray_defaults_to_Right():
+    xs = EitherArray([1, 2])
+    assert list(xs) == [Right(1), Right(2)]
+    assert EitherArray.unit(1) == EitherArray([1])
+
+
+def test_EitherArray_from_eithers():
+    xs = EitherArray.from_eithers([Right(1), Left('no'), Right(3)])
+    assert list(xs) == [Right(1), Left('no'), Right(3)]
+    assert xs[1] == Left('no') and xs[2] == Right(3)
+    assert list(xs.errors) == [None, 'no', None]
+
+
+def test_EitherArray_fmap_keeps_errors():
+    xs = EitherArray.from_eithers([Right(1), Left('no')])
+    assert list((lambda x: x + 1) % xs) == [Right(2), Left('no')]
+
+
+def test_EitherArray_apply_prefers_own_error():
+    fs = EitherArray.from_eithers([Right(lambda x: -x), Left('f'),
+                                   Left('g')])
+    xs = EitherArray.from_eithers([Right(1), Right(2), Left('x')])
+    assert list(fs * xs) == [Right(-1), Left('f'), Left('g')]
+
+
+def test_EitherArray_bind_records_Left():
+    def positive(x):
+        return Right(x) if x > 0 else Left("{!r} isn't positive".format(x))
+
+    xs = EitherArray.from_eithers([Right(1), Right(-1), Left('no')])
+    assert list(xs >> positive) == [Right(1), Left("-1 isn't positive"),
+                                    Left('no')]
+
+
+def test_EitherArray_filter_like_Right():
+    def odd(x):
+        return x % 2
+
+    xs = EitherArray([1, 2, 3]).filter(odd)
+    assert list(xs) == [Right(1), Left('odd false with input 2'), Right(3)]
+    assert list(xs) == [Right(1).filter(odd), Right(2).filter(odd),
+                        Right(3).filter(odd)]
+
+
+def test_EitherArray_to_maybe():
+    xs = EitherArray.from_eithers([Right(1), Left('no')]).to_maybe()
+    assert list(xs) == [Just(1), Nothing]
+
+
+@needs_numpy
+def test_MaybeArray_vectorized_fmap_calls_once():
+    calls = []
+
+    @ArrayList.vectorized
+    def double(xs):
+        calls.append(xs)
+        return xs * 2
+
+    xs = MaybeArray([1, None, 3]).fmap(double)
+    assert len(calls) == 1 and list(calls[0]) == [1, 3]
+    assert list(xs) == [Just(2), Nothing, Just(6)]
+    assert list(np.sqrt % MaybeArray([4, None])) == [Just(2.0), Nothing]
+
+
+@needs_numpy
+def test_vectorized_filter_and_bind():
+    xs = MaybeArray([1.0, 2.0, None, 4.0])
+    assert list(xs.filter(np.vectorize(lambda x: x > 1))) == \
+        [Nothing, Just(2.0), Nothing, Just(4.0)]
+
+    @ArrayList.vectorized
+    def inverse(column):
+        return MaybeArray(column, mask=column != 0).fmap(
+            ArrayList.vectorized(lambda c: 1 / c))
+
+    ys = MaybeArray([2.0, 0.0, None]) >> inverse
+    assert list(ys) == [Just(0.5), Nothing, Nothing]
+
+
+@needs_numpy
+def test_EitherArray_vectorized_bind():
+    @ArrayList.vectorized
+    def checked(column):
+        ok = column > 0
+        return EitherArray(column, mask=ok,
+                           errors=[None if o else 'neg' for o in ok])
+
+    xs = EitherArray([1, -1, 2]) >> checked
+    assert list(xs) == [Right(1), Left('neg'), Right(2)]
+
+
+def test_errors_may_be_sequences():
+    xs = MaybeArray([1, None]).to_either(('missing', 'x'))
+    assert list(xs) == [Right(1), Left(('missing', 'x'))]
+    assert list(MaybeArray([None, 2]).get_or([0])) == [[0], 2]
+
+
+@needs_numpy
+def test_columns_stay_arrays():
+    xs = MaybeArray([1.0, None, 3.0]).fmap(np.negative)
+    filled = xs.get_or(0.0)
+    assert isinstance(filled, np.ndarray) and filled.dtype == float
+    assert list(filled) == [-1.0, 0.0, -3.0]
+    either = xs.to_either('missing')
+    assert isinstance(either.errors, np.ndarray)
+    assert list(either.errors) == [None, 'missing', None]
+    fs = EitherArray.from_eithers([Right(abs), Right(abs), Left('f')])
+    both = fs * EitherArray([-1, 2, 3], mask=[True, False, True],
+                            errors=[None, 'x', None])
+    assert isinstance(both.mask, np.ndarray)
+    assert list(both) == [Right(1), Left('x'), Left('f')]
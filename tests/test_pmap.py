@@ -0,0 +1,69 @@
+import pytest
+from pynads import Map, PMap
+from pynads.funcs import identity
+
+
+def test_PMap_construction():
+    m = PMap({'a': 1}, b=2)
+    assert m == PMap([('a', 1), ('b', 2)])
+    assert m == Map({'a': 1, 'b': 2})
+    assert PMap(m)._v is m._v
+    assert m.to_map() == Map({'a': 1, 'b': 2})
+    assert PMap.unit(('a', 4)) == PMap({'a': 4})
+    assert PMap.fromkeys('ab', 0) == PMap({'a': 0, 'b': 0})
+
+
+def test_PMap_mapping():
+    m = PMap({'a': 1})
+    assert m['a'] == 1 and 'a' in m and 'b' not in m
+    assert m.get('b', 3) == 3
+    assert list(m) == ['a']
+    with pytest.raises(KeyError):
+        m['b']
+
+
+def test_PMap_assoc_dissoc_are_persistent():
+    m = PMap.fromkeys(range(1000), 0)
+    n = m.assoc(5, 1).dissoc(6)
+    assert m[5] == 0 and 6 in m and len(m) == 1000
+    assert n[5] == 1 and 6 not in n and len(n) == 999
+    assert m.dissoc('missing')._v is m._v
+
+
+def test_PMap_fmap():
+    m = PMap({'a': 1, 'b': 2})
+    assert (lambda x: x + 1) % m == PMap({'a': 2, 'b': 3})
+
+
+def test_PMap_apply():
+    m = PMap({'a': lambda x: lambda y: x + y, 'c': identity})
+    assert m * PMap({'a': 1}) * PMap({'a': 2}) == PMap({'a': 3})
+    assert m * Map({'b': 1}) == PMap()
+
+
+def test_PMap_mappend_right_wins():
+    big = PMap.fromkeys(range(100), 'base')
+    small = PMap({1: 'override', 'new': 1})
+    merged = big + small
+    assert merged[1] == 'override' and merged['new'] == 1
+    assert len(merged) == 101
+    merged = small + big
+    assert merged[1] == 'base' and merged['new'] == 1
+    assert big + {2: 'dict'} == big.assoc(2, 'dict')
+
+
+def test_PMap_monoid():
+    m, n, o = PMap({'a': 1}), PMap({'b': 2}), PMap({'a': 3})
+    assert PMap.mempty + m == m + PMap.mempty == m
+    assert (m + n) + o == m + (n + o) == PMap.mconcat(m, n, o)
+    assert PMap.mconcat(m, n, o) == PMap({'a': 3, 'b': 2})
+
+
+def test_Map_ne_defers_to_other_mappings():
+    import warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert Map({'a': 2}) != PMap({'a': 1})
+        assert not Map({'a': 1}) != PMap({'a': 1})
+        assert PMap({'a': 1}) != Map({'a': 2})
+        assert Map({'a': 1}) != {'a': 1}
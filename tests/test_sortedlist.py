@@ -0,0 +1,151 @@
+import pytest
+from pynads import List, SortedList
+from pynads.funcs import mconcat, mempty
+
+
+def test_SortedList_sorts():
+    assert SortedList([3, 1, 2]) == List(1, 2, 3)
+    assert SortedList(['bb', 'a', 'ccc'], key=len) == List('a', 'bb', 'ccc')
+    assert repr(SortedList([2, 1])) == 'SortedList([1, 2])'
+
+
+def test_SortedList_has_own_mempty():
+    for _ in range(2):
+        assert type(SortedList.mempty) is SortedList
+        assert type(List.mempty) is List
+    assert type(mempty(List(1))) is List
+    assert List.mempty + List(3, 1) == List(3, 1)
+    assert SortedList.mempty + List(3, 1) == List(1, 3)
+
+
+def test_SortedList_contains_and_index():
+    xs = SortedList([5, 1, 3, 3, 9])
+    assert 3 in xs and 4 not in xs
+    assert xs.index(3) == 1
+    assert xs.count(3) == 2
+    with pytest.raises(ValueError):
+        xs.index(4)
+
+
+def test_SortedList_contains_with_key_checks_value():
+    xs = SortedList(['ab', 'cd', 'e'], key=len)
+    assert 'cd' in xs
+    assert 'xy' not in xs
+    assert xs.index('cd') == 2
+
+
+def test_SortedList_contains_unhashable():
+    xs = SortedList([[3], [1], [2]])
+    assert [2] in xs
+    assert xs.count([2]) == 1
+
+
+def test_SortedList_irange():
+    xs = SortedList(range(10))
+    assert xs.irange(3, 6) == List(3, 4, 5, 6)
+    assert xs.irange(3, 6, inclusive=(False, False)) == List(4, 5)
+    assert xs.irange(maximum=2) == List(0, 1, 2)
+    assert xs.irange(minimum=8) == List(8, 9)
+    assert xs.irange(6, 3) == List()
+    assert isinstance(xs.irange(3, 6), SortedList)
+
+
+def test_SortedList_irange_by_key():
+    xs = SortedList(['a', 'bbb', 'cc', 'dddd'], key=len)
+    assert xs.irange(2, 3) == List('cc', 'bbb')
+
+
+def test_SortedList_add():
+    xs = SortedList([1, 3, 5]).add(4).add(0).add(6)
+    assert xs == List(0, 1, 3, 4, 5, 6)
+    assert isinstance(xs, SortedList)
+
+
+def test_SortedList_cons_append_only_keep_type_in_order():
+    xs = SortedList([2, 3])
+    assert isinstance(xs.cons(1), SortedList)
+    assert isinstance(xs.append(4), SortedList)
+    assert type(xs.cons(5)) is List and xs.cons(5) == List(5, 2, 3)
+    assert type(xs.append(0)) is List
+
+
+def test_SortedList_fmap_makes_List():
+    xs = (lambda x: -x) % SortedList([1, 2, 3])
+    assert type(xs) is List
+    assert xs == List(-1, -2, -3)
+
+
+def test_SortedList_filter_and_slice_stay_sorted():
+    xs = SortedList([4, 1, 3, 2])
+    assert isinstance(xs.filter(lambda x: x % 2), SortedList)
+    assert isinstance(xs[1:3], SortedList) and xs[1:3] == List(2, 3)
+    assert type(reversed(xs)) is List
+
+
+def test_SortedList_mappend_merges():
+    xs = SortedList([1, 4, 7]) + SortedList([2, 3, 8])
+    assert isinstance(xs, SortedList)
+    assert xs == List(1, 2, 3, 4, 7, 8)
+    assert SortedList([2, 1]) + [0, 3] == List(0, 1, 2, 3)
+
+
+def test_SortedList_mappend_rejects_non_iterables():
+    with pytest.raises(TypeError):
+        SortedList([1]) + 1
+
+
+def test_SortedList_monoid_identity():
+    xs = SortedList([3, 1])
+    assert SortedList.mempty + xs == xs
+    assert xs + SortedList.mempty == xs
+
+
+def test_SortedList_mconcat():
+    xs = mconcat(SortedList([1, 5]), SortedList([2, 4]), SortedList([3]))
+    assert xs == List(1, 2, 3, 4, 5)
+    assert SortedList.mconcat(SortedList(), [2, 1]) == List(1, 2)
+
+
+def test_SortedList_set_operations():
+    xs = SortedList([1, 2, 2, 3, 4])
+    ys = SortedList([3, 4, 4, 5])
+    assert xs.union(ys) == List(1, 2, 3, 4, 5)
+    assert xs.intersect(ys) == List(3, 4)
+    assert xs.difference(ys) == List(1, 2)
+    assert xs.symmetric_difference(ys) == List(1, 2, 5)
+    assert xs.distinct() == List(1, 2, 3, 4)
+    assert isinstance(xs.union(ys), SortedList)
+
+
+def test_SortedList_set_operations_on_unhashables():
+    xs = SortedList([[1], [2], [3]])
+    assert xs.intersect([[3], [2], [9]]) == List([2], [3])
+    assert xs.difference([[2]]) == List([1], [3])
+
+
+def test_SortedList_set_operations_use_key():
+    xs = SortedList(['a', 'bb', 'ccc'], key=len)
+    assert xs.intersect(['xx', 'yyyy']) == List('bb')
+    assert xs.union(['xx', 'yyyy']) == List('a', 'bb', 'ccc', 'yyyy')
+
+
+def test_SortedList_set_operations_take_other_keys():
+    assert SortedList([1]).union([2], key=abs) == List(1, 2)
+    xs = SortedList([-3, -1, 1, 2])
+    assert xs.distinct(key=abs) == List(-3, -1, 2)
+    assert isinstance(xs.distinct(key=abs), SortedList)
+    assert xs.intersect([3], key=abs) == List(-3)
+    assert xs.difference([1], key=abs) == List(-3, 2)
+    assert xs.symmetric_difference([-2, 5], key=abs) == List(-3, -1, 5)
+    assert xs.union([5], key=None) == List(-3, -1, 1, 2, 5)
+
+
+def test_SortedList_from_tuple_and_iterable_sort():
+    xs = SortedList.from_iterable([3, 1, 2])
+    assert xs == List(1, 2, 3) and repr(xs) == 'SortedList([1, 2, 3])'
+    ys = SortedList.from_tuple(('bb', 'a'), key=len)
+    assert ys == List('a', 'bb') and ys.key is len
+    assert SortedList.from_iterable(ys, key=len) is ys
+    assert SortedList.from_iterable(List(2, 1)) == List(1, 2)
+    with pytest.raises(TypeError):
+        SortedList.from_tuple([1])
@@ -0,0 +1,122 @@
+from array import array
+import sys
+import pytest
+from pynads import List, TypedList
+
+
+def test_TypedList_stores_array():
+    xs = TypedList('d', [1.0, 2.0, 3.0])
+    assert isinstance(next(xs._v.leaves()).items, array)
+    assert xs == List(1.0, 2.0, 3.0)
+    assert List.typed('d', [1.0]) == TypedList('d', [1.0])
+
+
+def test_TypedList_fmap_keeps_type():
+    xs = TypedList('i', [1, 2, 3]).fmap(lambda x: x * 2)
+    assert isinstance(xs, TypedList)
+    assert xs.typecode == 'i'
+    assert xs == List(2, 4, 6)
+
+
+def test_TypedList_fmap_falls_back_to_List():
+    for f in [str, float, lambda x: x > 1, lambda x: 2 ** 70]:
+        ys = TypedList('i', [1, 2, 3]).fmap(f)
+        assert type(ys) is List
+        assert ys == List(*[f(x) for x in [1, 2, 3]])
+
+
+def test_TypedList_bind_and_apply_make_Lists():
+    xs = TypedList('i', [1, 2])
+    assert xs >> (lambda x: [x, -x]) == List(1, -1, 2, -2)
+    assert List(lambda x: x + 1) * xs == List(2, 3)
+
+
+def test_TypedList_mappend():
+    xs, ys = TypedList('i', [1, 2]), TypedList('i', [3])
+    assert isinstance(xs + ys, TypedList)
+    assert xs + ys == List(1, 2, 3)
+    assert type(xs + List('a')) is List
+    assert type(xs + TypedList('d', [1.0])) is List
+    assert TypedList.mconcat(xs, ys, xs) == List(1, 2, 3, 1, 2)
+    assert List.mempty + xs == xs
+    assert TypedList('d') + xs is xs
+    assert TypedList.mconcat() == List()
+
+
+def test_TypedList_has_own_mempty():
+    assert TypedList.mempty == List()
+    assert TypedList.mempty + TypedList('i', [1]) == List(1)
+    assert type(List.mempty) is List
+    assert type(TypedList.mempty) is List
+
+
+def test_TypedList_append_and_cons():
+    xs = TypedList('i', [])
+    for x in range(100):
+        xs = xs.append(x)
+    assert isinstance(xs, TypedList)
+    assert all(isinstance(l.items, array) for l in xs._v.leaves())
+    assert xs.cons(-1) == List(*range(-1, 100))
+    assert type(xs.append('a')) is List
+    assert type(xs.append(1.0)) is List
+
+
+def test_TypedList_set_operations():
+    threes = TypedList('i', range(3, 16, 3))
+    fives = TypedList('i', range(5, 16, 5))
+    assert isinstance(threes | fives, TypedList)
+    assert threes | fives == List(3, 6, 9, 12, 15, 5, 10)
+    assert threes & fives == List(15)
+    assert threes - fives == List(3, 6, 9, 12)
+    assert threes ^ fives == List(3, 6, 9, 12, 5, 10)
+    assert ~TypedList('i', [1, 1, 2]) == List(1, 2)
+
+
+def test_TypedList_slicing():
+    xs = TypedList('i', range(100))
+    assert isinstance(xs[10:20], TypedList)
+    assert xs[10:20] == List(*range(10, 20))
+    assert xs[::-3] == List(*range(99, -1, -3))
+    assert isinstance(reversed(xs), TypedList)
+    assert xs[5] == 5
+
+
+def test_TypedList_to_array_and_buffer():
+    xs = TypedList('B', b'hello') + TypedList('B', b' world')
+    assert xs.to_array() == array('B', b'hello world')
+    assert xs.tobytes() == b'hello world'
+    assert bytes(memoryview(xs[::-1].to_array())) == b'dlrow olleh'
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12),
+                    reason="__buffer__ requires Python 3.12")
+def test_TypedList_buffer_protocol():
+    assert bytes(memoryview(TypedList('B', b'abc'))) == b'abc'
+
+
+def test_TypedList_mixed_storage_stepped_slice():
+    xs = TypedList('i', range(40)) + List(*['a'] * 40)
+    assert xs[::2] == List(*(list(range(0, 40, 2)) + ['a'] * 20))
+    ys = TypedList('d', [1.5] * 40) + List(*range(40))
+    assert ys[::5] == List(*([1.5] * 8 + list(range(0, 40, 5))))
+    assert all(type(y) is int for y in ys[::5][8:])
+    zs = TypedList('i', range(40)) + TypedList('i', range(40))
+    assert all(isinstance(l.items, array) for l in zs[::3]._v.leaves())
+
+
+def test_TypedList_from_tuple_and_iterable():
+    xs = TypedList.from_iterable(range(3), 'i')
+    assert xs == List(0, 1, 2) and xs.typecode == 'i'
+    assert repr(TypedList.from_tuple((1.5,), 'd')) == "TypedList('d', [1.5])"
+    assert TypedList.from_iterable(xs) is xs
+    assert TypedList.from_iterable(xs, 'd').to_array() == array('d', [0, 1, 2])
+    with pytest.raises(TypeError):
+        TypedList.from_iterable([1, 2])
+    with pytest.raises(TypeError):
+        TypedList.from_tuple([1], 'i')
+
+
+def test_TypedList_mconcat_accepts_iterables():
+    xs = TypedList('i', [3])
+    assert TypedList.mconcat((1, 2), xs) == List(1, 2, 3)
+    assert TypedList.mconcat([1], [2]) == List(1, 2)
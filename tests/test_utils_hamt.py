@@ -0,0 +1,56 @@
+from pynads.utils.hamt import EMPTY, HashTrie
+
+
+class Collides(object):
+    def __init__(self, v):
+        self.v = v
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, Collides) and self.v == other.v
+
+
+def test_HashTrie_matches_dict():
+    d, t = {}, EMPTY
+    for i in range(2000):
+        k = (i * 7919) % 613 - 300
+        if i % 3:
+            d[k] = i
+            t = t.assoc(k, i)
+        else:
+            d.pop(k, None)
+            t = t.dissoc(k)
+        assert len(t) == len(d)
+    assert dict(t.items()) == d
+    assert all(t.get(k) == v for k, v in d.items())
+
+
+def test_HashTrie_is_persistent():
+    t = HashTrie.from_items((i, i) for i in range(100))
+    u = t.assoc(1, 'x').dissoc(2)
+    assert t.get(1) == 1 and 2 in t
+    assert u.get(1) == 'x' and 2 not in u
+    assert t.assoc(1, 1) is t
+
+
+def test_HashTrie_collisions():
+    keys = [Collides(i) for i in range(5)]
+    t = HashTrie.from_items((k, k.v) for k in keys).assoc(42, 'int')
+    assert len(t) == 6
+    assert all(t.get(k) == k.v for k in keys)
+    assert t.get(42) == 'int'
+    t = t.dissoc(keys[0]).dissoc(42)
+    assert len(t) == 4 and keys[0] not in t and keys[1] in t
+
+
+def test_HashTrie_assoc_without_replace():
+    t = EMPTY.assoc('a', 1)
+    assert t.assoc('a', 2, replace=False).get('a') == 1
+    assert t.assoc('b', 2, replace=False).get('b') == 2
+
+
+def test_HashTrie_fmap():
+    t = HashTrie.from_items((i, i) for i in range(50)).fmap(str)
+    assert dict(t.items()) == dict((i, str(i)) for i in range(50))
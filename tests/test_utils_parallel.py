@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+from pynads.utils import parallel
+from pynads.utils.parallel import adaptive_chunksize, chunked_map
+
+
+def inc(x):
+    return x + 1
+
+
+def pair(x):
+    return [x, -x]
+
+
+def test_chunked_map_preserves_order():
+    with ThreadPoolExecutor(4) as pool:
+        assert chunked_map(inc, range(1000), pool) == list(range(1, 1001))
+        assert chunked_map(inc, range(10), pool, chunksize=3) == \
+            list(range(1, 11))
+
+
+def test_chunked_map_flatten():
+    with ThreadPoolExecutor(2) as pool:
+        assert chunked_map(pair, [1, 2], pool, flatten=True) == [1, -1, 2, -2]
+
+
+def test_chunked_map_default_process_pool():
+    assert chunked_map(inc, range(50)) == list(range(1, 51))
+
+
+def test_chunked_map_empty():
+    with ThreadPoolExecutor(2) as pool:
+        assert chunked_map(inc, [], pool) == []
+
+
+class CountingExecutor(object):
+    """Runs chunks in the calling thread and counts them.
+    """
+    def __init__(self):
+        self.chunks = 0
+
+    def map(self, func, *iterables):
+        for args in zip(*iterables):
+            self.chunks += 1
+            yield func(*args)
+
+
+def test_chunked_map_balances_across_workers():
+    for workers, chunks in [(1, 4), (2, 8)]:
+        executor = CountingExecutor()
+        assert chunked_map(inc, range(100), executor, workers=workers) == \
+            list(range(1, 101))
+        assert executor.chunks == chunks
+
+
+def test_adaptive_chunksize():
+    # cheap functions get big chunks but still spread over every worker
+    assert adaptive_chunksize(1e-7, 100000, 4) == 6250
+    # expensive functions get small chunks
+    assert adaptive_chunksize(0.01, 100000, 4) == 5
+    assert adaptive_chunksize(10, 100000, 4) == 1
+    assert adaptive_chunksize(0, 10, 4) == 1
+
+
+def test_parallel_imports_executors_lazily():
+    assert not hasattr(parallel, 'ProcessPoolExecutor')
+    assert not hasattr(parallel, 'cpu_count')
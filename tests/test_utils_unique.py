@@ -0,0 +1,77 @@
+import pytest
+from pynads.utils.unique import Distinct, Seen, fingerprint, unique
+
+
+class Unhashable(object):
+    __hash__ = None
+
+    def __init__(self, v):
+        self.v = v
+
+    def __eq__(self, other):
+        return self.v == other.v
+
+    def __lt__(self, other):
+        return self.v < other.v
+
+
+def test_fingerprint_matches_equality():
+    assert fingerprint({'a': [1, 2]}) == fingerprint({'a': [1, 2]})
+    assert fingerprint({'a': [1, 2]}) != fingerprint({'a': [2, 1]})
+    assert fingerprint([1, 2]) != (1, 2)
+    assert fingerprint([[1]]) != fingerprint([(1,)])
+    assert fingerprint({1, 2}) == frozenset([1, 2])
+    assert fingerprint(3) == 3
+    with pytest.raises(TypeError):
+        fingerprint([Unhashable(1)])
+
+
+def test_Seen_mixes_strategies():
+    seen = Seen()
+    assert seen.add(1) and not seen.add(1)
+    assert seen.add([1]) and not seen.add([1])
+    assert seen.add(Unhashable(2)) and not seen.add(Unhashable(2))
+    assert seen.add(Unhashable(1))
+    assert [1] in seen and 1 in seen and Unhashable(1) in seen
+    assert {} not in seen and Unhashable(3) not in seen
+
+
+def test_Seen_sets_match_frozensets():
+    seen = Seen()
+    assert seen.add({1, 2})
+    assert frozenset([1, 2]) in seen and not seen.add(frozenset([2, 1]))
+    assert [{1}] not in seen and seen.add([{1}])
+    assert [frozenset([1])] in seen
+
+
+def test_Seen_unorderable_raises():
+    seen = Seen()
+    seen.add(Unhashable(1))
+    with pytest.raises(TypeError):
+        seen.add(Unhashable('a'))
+
+
+def test_Seen_with_key():
+    seen = Seen(key=len)
+    assert seen.add('ab')
+    assert not seen.add('cd')
+    assert 'xy' in seen
+
+
+def test_unique_is_lazy_and_ordered():
+    def gen():
+        yield {'a': 1}
+        yield {'a': 1}
+        yield {'b': 2}
+        raise AssertionError("consumed too far")
+
+    it = unique(gen())
+    assert next(it) == {'a': 1}
+    assert next(it) == {'b': 2}
+
+
+def test_Distinct():
+    d = Distinct([[2], [1], [2], [3]])
+    assert list(d) == [[2], [1], [3]]
+    assert len(d) == 3
+    assert [1] in d and [4] not in d
@@ -0,0 +1,125 @@
+import random
+import pytest
+from pynads.utils.vector import Vector, LEAF_SIZE
+
+
+def build_by_append(n):
+    v = Vector.from_tuple(())
+    for x in range(n):
+        v = v.append(x)
+    return v
+
+
+def assert_balanced(node):
+    if node.depth:
+        assert abs(node.left.depth - node.right.depth) <= 1
+        assert_balanced(node.left)
+        assert_balanced(node.right)
+
+
+def test_Vector_from_tuple_does_not_copy():
+    t = tuple(range(10))
+    assert Vector.from_tuple(t).to_tuple() is t
+
+
+def test_Vector_append_and_cons():
+    v = build_by_append(1000)
+    assert v.to_tuple() == tuple(range(1000))
+    assert v.cons(-1).to_tuple() == tuple(range(-1, 1000))
+    assert_balanced(v)
+
+
+def test_Vector_append_merges_small_leaves():
+    v = build_by_append(LEAF_SIZE * 10)
+    assert all(leaf.size == LEAF_SIZE for leaf in v.leaves())
+
+
+def test_Vector_concat_is_balanced():
+    v = Vector.from_tuple(())
+    for x in range(200):
+        v = v.concat(Vector.from_tuple(tuple(range(x))))
+    assert_balanced(v)
+    assert len(v) == sum(range(200))
+
+
+def test_Vector_getitem():
+    v = build_by_append(500)
+    assert [v[i] for i in range(500)] == list(range(500))
+    assert v[-1] == 499
+
+    with pytest.raises(IndexError):
+        v[500]
+
+
+def test_Vector_slice_matches_tuple():
+    v = build_by_append(300)
+    t = tuple(range(300))
+    rand = random.Random(0)
+    for _ in range(200):
+        i = rand.randint(0, 300)
+        j = rand.randint(i, 300)
+        assert v.slice(i, j).to_tuple() == t[i:j]
+
+
+def test_Vector_slice_shares_storage():
+    t = tuple(range(100))
+    v = Vector.from_tuple(t).slice(10, 20, share=True)
+    assert next(v.leaves()).items is t
+
+
+def test_Vector_shared_stepped_slices_match_tuple():
+    t = tuple(range(300))
+    v = build_by_append(300)
+    for s in [slice(None, None, 3), slice(7, 290, 5), slice(None, None, -4),
+              slice(250, 20, -9), slice(31, 33), slice(10, 11, 50)]:
+        assert v.slice(*s.indices(300), share=True).to_tuple() == t[s]
+
+
+def test_Vector_contains_index_count():
+    v = build_by_append(100).concat(Vector.from_tuple((5, 5)))
+    assert 99 in v
+    assert 100 not in v
+    assert v.index(50) == 50
+    assert v.slice(10, 20).index(15) == 5
+    assert v.count(5) == 3
+
+    with pytest.raises(ValueError):
+        v.index(100)
+
+
+def test_Vector_eq():
+    assert build_by_append(50) == Vector.from_tuple(tuple(range(50)))
+    assert build_by_append(50) != build_by_append(49)
+
+
+def test_Vector_eq_does_not_flatten():
+    v, w = build_by_append(100), build_by_append(100)
+    assert v == w and v != w.append(1)
+    assert v._flat is None and w._flat is None
+    assert v.mismatch(w.cons(-1)) == (0, -1)
+    assert v.mismatch(w.append(1)) is None
+
+
+def test_Vector_stepped_slices_match_tuple():
+    t = tuple(range(100))
+    trees = [Vector.from_tuple(t), build_by_append(100)]
+    for v in trees:
+        for s in [slice(None, None, 2), slice(None, None, -1),
+                  slice(90, 10, -3), slice(5, 95, 7), slice(-1, None, -2)]:
+            assert v.slice(*s.indices(100)).to_tuple() == t[s]
+
+
+def test_Vector_reverse_shares_storage():
+    t = tuple(range(100))
+    v = Vector.from_tuple(t).reverse()
+    assert v.to_tuple() == t[::-1]
+    assert next(v.leaves()).items is t
+    assert build_by_append(100).reverse().to_tuple() == t[::-1]
+
+
+def test_Vector_slice_copies_when_pinning():
+    t = tuple(range(1000))
+    v = Vector.from_tuple(t)
+    assert next(v.slice(0, 10).leaves()).items is not t
+    assert next(v.slice(0, 10, share=True).leaves()).items is t
+    assert next(v.slice(0, 500).leaves()).items is t